@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import time
 
 import numpy as np
 
-from loxodrome import ops, vectorized as vz
+from loxodrome import EARTH_RADIUS_METERS, ops, vectorized as vz
 from loxodrome.geometry import Point
 
 
@@ -20,6 +21,26 @@ def _time_call(fn, *, repeat: int) -> float:
     return best
 
 
+def _numba_haversine():
+    """Compile a parallel Numba haversine baseline, or return None when Numba is not installed."""
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def haversine(lat1, lon1, lat2, lon2, out):
+        for i in prange(lat1.shape[0]):
+            phi1 = np.radians(lat1[i])
+            phi2 = np.radians(lat2[i])
+            sin_lat = np.sin((phi2 - phi1) / 2.0)
+            sin_lon = np.sin(np.radians(lon2[i] - lon1[i]) / 2.0)
+            a = sin_lat * sin_lat + np.cos(phi1) * np.cos(phi2) * sin_lon * sin_lon
+            out[i] = 2.0 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(min(max(a, 0.0), 1.0)))
+
+    return haversine
+
+
 def benchmark_pairwise(count: int, repeat: int) -> None:
     origins = np.column_stack((np.linspace(0.0, 45.0, count), np.linspace(0.0, 90.0, count)))
     destinations = np.column_stack((np.linspace(1.0, 46.0, count), np.linspace(1.0, 91.0, count)))
@@ -45,6 +66,20 @@ def benchmark_pairwise(count: int, repeat: int) -> None:
     print(f"Vectorized distance ({count} pairs): {vectorized_best * 1e3:.2f} ms")
     print(f"Scalar distance ({scalar_sample} pairs): {scalar_best * 1e3:.2f} ms")
 
+    haversine = _numba_haversine()
+    if haversine is None:
+        print("Numba baseline: skipped (numba not installed)")
+        return
+
+    columns = (origins[:, 0].copy(), origins[:, 1].copy(), destinations[:, 0].copy(), destinations[:, 1].copy())
+    out = np.empty(count, dtype=np.float64)
+    # Warmup triggers JIT compilation outside the timed region.
+    haversine(*columns, out)
+    np.testing.assert_allclose(out, vz.geodesic_distance_batch(origin_batch, destination_batch).to_numpy(), rtol=1e-9)
+
+    numba_best = _time_call(lambda: haversine(*columns, out), repeat=repeat)
+    print(f"Numba parallel haversine ({count} pairs): {numba_best * 1e3:.2f} ms")
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -66,6 +66,13 @@ impl GeodesicAlgorithm for Geographiclib {
     let meters = self.distance_m(p1, p2)?;
     Distance::from_meters(meters)
   }
+
+  /// The smallest radius of curvature on the ellipsoid, `b² / a`, which no
+  /// geodesic can undercut per radian of unit-sphere arc.
+  fn min_meters_per_radian(&self) -> Option<f64> {
+    let one_minus_f = 1.0 - self.geodesic.f;
+    Some(self.geodesic.a * one_minus_f * one_minus_f)
+  }
 }
 
 impl fmt::Debug for Geographiclib {
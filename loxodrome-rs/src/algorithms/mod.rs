@@ -45,4 +45,66 @@ pub trait GeodesicAlgorithm {
       .map(|(a, b)| self.geodesic_distance(*a, *b).map(|d| d.meters()))
       .collect()
   }
+
+  /// Lower bound on meters per radian of central angle between two points.
+  ///
+  /// The central angle is measured between the points' latitude/longitude
+  /// positions on the unit sphere. Spatial indexes rank candidates by that
+  /// angle and use this bound to stop scanning once no remaining candidate can
+  /// be closer. The default returns `None`, which makes those searches
+  /// evaluate every candidate.
+  fn min_meters_per_radian(&self) -> Option<f64> {
+    None
+  }
+
+  /// Compute geodesic distance between two prepared points.
+  ///
+  /// Kernels that compare the same points many times (pairwise sweeps such as
+  /// Hausdorff) prepare each point once and call this in their inner loops.
+  /// The default delegates to [`Self::geodesic_distance`]; strategies that can
+  /// reuse the cached per-point terms override it.
+  ///
+  /// # Errors
+  ///
+  /// Implementations should return [`GeodistError`] when the calculation
+  /// cannot be completed.
+  fn prepared_distance(&self, p1: &PreparedPoint, p2: &PreparedPoint) -> Result<Distance, GeodistError> {
+    self.geodesic_distance(p1.point(), p2.point())
+  }
+}
+
+/// Validated point with its latitude cosine cached for repeated comparisons.
+///
+/// Preparing a point set once turns the per-pair trigonometry of an `N x M`
+/// sweep into `N + M` evaluations.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct PreparedPoint {
+  point: Point,
+  cos_lat: f64,
+}
+
+impl PreparedPoint {
+  /// Validate `point` and cache its per-point terms.
+  ///
+  /// # Errors
+  ///
+  /// Returns [`GeodistError`] when the point's latitude or longitude is out of
+  /// range or non-finite.
+  pub fn new(point: Point) -> Result<Self, GeodistError> {
+    point.validate()?;
+    Ok(Self {
+      point,
+      cos_lat: point.lat.to_radians().cos(),
+    })
+  }
+
+  /// Underlying point in degrees.
+  pub const fn point(&self) -> Point {
+    self.point
+  }
+
+  /// Cosine of the point's latitude.
+  pub const fn cos_lat(&self) -> f64 {
+    self.cos_lat
+  }
 }
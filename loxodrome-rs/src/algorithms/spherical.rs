@@ -2,7 +2,7 @@
 //!
 //! Inputs are degrees; output is meters.
 
-use super::GeodesicAlgorithm;
+use super::{GeodesicAlgorithm, PreparedPoint};
 use crate::{Distance, EARTH_RADIUS_METERS, Ellipsoid, GeodistError, Point};
 
 /// Baseline spherical algorithm using a haversine great-circle model.
@@ -57,6 +57,15 @@ impl GeodesicAlgorithm for Spherical {
   fn geodesic_distance(&self, p1: Point, p2: Point) -> Result<Distance, GeodistError> {
     spherical_distance(self.radius_meters, p1, p2)
   }
+
+  fn min_meters_per_radian(&self) -> Option<f64> {
+    Some(self.radius_meters)
+  }
+
+  fn prepared_distance(&self, p1: &PreparedPoint, p2: &PreparedPoint) -> Result<Distance, GeodistError> {
+    // Prepared points are validated on construction.
+    haversine(self.radius_meters, p1.point(), p1.cos_lat(), p2.point(), p2.cos_lat())
+  }
 }
 
 /// Compute spherical great-circle distance for a single pair.
@@ -72,15 +81,24 @@ pub fn spherical_distance(radius_meters: f64, p1: Point, p2: Point) -> Result<Di
   p1.validate()?;
   p2.validate()?;
 
-  let lat1 = p1.lat.to_radians();
-  let lat2 = p2.lat.to_radians();
+  haversine(
+    radius_meters,
+    p1,
+    p1.lat.to_radians().cos(),
+    p2,
+    p2.lat.to_radians().cos(),
+  )
+}
+
+/// Haversine arc length for validated points and their latitude cosines.
+fn haversine(radius_meters: f64, p1: Point, cos_lat1: f64, p2: Point, cos_lat2: f64) -> Result<Distance, GeodistError> {
   let delta_lat = (p2.lat - p1.lat).to_radians();
   let delta_lon = (p2.lon - p1.lon).to_radians();
 
   let sin_lat = (delta_lat / 2.0).sin();
   let sin_lon = (delta_lon / 2.0).sin();
 
-  let a = sin_lat * sin_lat + lat1.cos() * lat2.cos() * sin_lon * sin_lon;
+  let a = sin_lat * sin_lat + cos_lat1 * cos_lat2 * sin_lon * sin_lon;
   // Clamp to guard against minor floating error that could push `a` outside
   // [0, 1] and cause NaNs.
   let normalized_a = a.clamp(0.0, 1.0);
@@ -104,6 +122,18 @@ mod tests {
     assert!((meters - expected).abs() < 1e-6);
   }
 
+  #[test]
+  fn prepared_distance_matches_geodesic_distance() {
+    let algorithm = Spherical::default();
+    let a = Point::new(48.8566, 2.3522).unwrap();
+    let b = Point::new(-33.8688, 151.2093).unwrap();
+
+    let prepared = algorithm
+      .prepared_distance(&PreparedPoint::new(a).unwrap(), &PreparedPoint::new(b).unwrap())
+      .unwrap();
+    assert_eq!(prepared, algorithm.geodesic_distance(a, b).unwrap());
+  }
+
   #[test]
   fn propagates_validation_errors() {
     let invalid = Point { lat: 200.0, lon: 0.0 };
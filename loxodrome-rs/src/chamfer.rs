@@ -70,9 +70,9 @@ impl ChamferResult {
 }
 
 /// Directed Chamfer distance between densified polylines.
-pub fn chamfer_directed_polyline(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn chamfer_directed_polyline<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
 ) -> Result<ChamferDirectedResult, GeodistError> {
@@ -80,10 +80,10 @@ pub fn chamfer_directed_polyline(
 }
 
 /// Directed Chamfer distance with a custom geodesic algorithm.
-pub fn chamfer_directed_polyline_with<A: GeodesicAlgorithm>(
+pub fn chamfer_directed_polyline_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
 ) -> Result<ChamferDirectedResult, GeodistError> {
@@ -91,9 +91,9 @@ pub fn chamfer_directed_polyline_with<A: GeodesicAlgorithm>(
 }
 
 /// Symmetric Chamfer distance between densified polylines.
-pub fn chamfer_polyline(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn chamfer_polyline<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
 ) -> Result<ChamferResult, GeodistError> {
@@ -101,10 +101,10 @@ pub fn chamfer_polyline(
 }
 
 /// Symmetric Chamfer distance with a custom geodesic algorithm.
-pub fn chamfer_polyline_with<A: GeodesicAlgorithm>(
+pub fn chamfer_polyline_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
 ) -> Result<ChamferResult, GeodistError> {
@@ -113,9 +113,9 @@ pub fn chamfer_polyline_with<A: GeodesicAlgorithm>(
 
 /// Directed Chamfer distance between densified polylines after bounding box
 /// clipping.
-pub fn chamfer_directed_polyline_clipped(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn chamfer_directed_polyline_clipped<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: BoundingBox,
@@ -125,10 +125,10 @@ pub fn chamfer_directed_polyline_clipped(
 
 /// Directed Chamfer distance with custom geodesic algorithm after bounding box
 /// clipping.
-pub fn chamfer_directed_polyline_clipped_with<A: GeodesicAlgorithm>(
+pub fn chamfer_directed_polyline_clipped_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: BoundingBox,
@@ -138,9 +138,9 @@ pub fn chamfer_directed_polyline_clipped_with<A: GeodesicAlgorithm>(
 
 /// Symmetric Chamfer distance between densified polylines after bounding box
 /// clipping.
-pub fn chamfer_polyline_clipped(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn chamfer_polyline_clipped<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: BoundingBox,
@@ -149,10 +149,10 @@ pub fn chamfer_polyline_clipped(
 }
 
 /// Symmetric Chamfer distance with custom geodesic algorithm and clipping.
-pub fn chamfer_polyline_clipped_with<A: GeodesicAlgorithm>(
+pub fn chamfer_polyline_clipped_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: BoundingBox,
@@ -160,10 +160,10 @@ pub fn chamfer_polyline_clipped_with<A: GeodesicAlgorithm>(
   chamfer_polyline_internal(algorithm, a, b, options, reduction, Some(bounding_box))
 }
 
-fn chamfer_directed_polyline_internal<A: GeodesicAlgorithm>(
+fn chamfer_directed_polyline_internal<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: Option<BoundingBox>,
@@ -173,10 +173,10 @@ fn chamfer_directed_polyline_internal<A: GeodesicAlgorithm>(
   chamfer_directed_from_samples(algorithm, &samples_a, &samples_b, reduction)
 }
 
-fn chamfer_polyline_internal<A: GeodesicAlgorithm>(
+fn chamfer_polyline_internal<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   reduction: ChamferReduction,
   bounding_box: Option<BoundingBox>,
@@ -403,8 +403,8 @@ fn should_break_search(current_best: f64, candidate_distance: f64) -> bool {
   candidate_distance - current_best > f64::EPSILON
 }
 
-fn densify_and_clip(
-  parts: &[Vec<Point>],
+fn densify_and_clip<P: AsRef<[Point]>>(
+  parts: &[P],
   options: DensificationOptions,
   bounding_box: Option<&BoundingBox>,
 ) -> Result<FlattenedPolyline, GeodistError> {
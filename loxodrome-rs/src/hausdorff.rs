@@ -4,9 +4,9 @@
 
 use rstar::{AABB, PointDistance, RTree, RTreeObject};
 
-use crate::algorithms::{GeodesicAlgorithm, Spherical};
+use crate::algorithms::{GeodesicAlgorithm, PreparedPoint, Spherical};
 use crate::distance::{EcefPoint, geodetic_to_ecef};
-use crate::polyline::{DensificationOptions, FlattenedPolyline, densify_multiline};
+use crate::polyline::{DensificationOptions, FlattenedPolyline, MultilineSampler, densify_multiline};
 use crate::{BoundingBox, Distance, Ellipsoid, GeodistError, Point, Point3D};
 
 // Keep the O(n*m) fallback for small collections where index build overhead
@@ -198,7 +198,7 @@ struct Positioned<T> {
   index: usize,
 }
 
-#[derive(Clone, Copy)]
+#[derive(Clone, Copy, Debug, PartialEq)]
 struct DirectedHausdorffMeters {
   meters: f64,
   origin_index: usize,
@@ -232,14 +232,44 @@ pub fn hausdorff_directed_with<A: GeodesicAlgorithm>(
   a: &[Point],
   b: &[Point],
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
-  ensure_non_empty(a)?;
-  ensure_non_empty(b)?;
-  validate_points(a)?;
-  validate_points(b)?;
+  let (origins, candidates) = prepare_point_sets(a, b)?;
+  hausdorff_directed_positioned_with(algorithm, &origins, &candidates, None)
+}
 
-  let origins = position_points(a);
-  let candidates = position_points(b);
-  hausdorff_directed_positioned_with(algorithm, &origins, &candidates)
+/// Directed Hausdorff distance that stops once it provably exceeds
+/// `upper_bound_m`, using the default spherical geodesic.
+///
+/// While the directed distance stays within `upper_bound_m` the witness is
+/// identical to [`hausdorff_directed`]. As soon as one origin's nearest
+/// neighbor lies farther than the bound the search ends, returning a witness
+/// whose distance exceeds `upper_bound_m` but may fall short of the true
+/// directed maximum. Threshold tests then cost O(n + m) evaluations in the
+/// common rejecting case instead of the full search.
+///
+/// # Errors
+/// Returns [`GeodistError::InvalidDistance`] when `upper_bound_m` is negative
+/// or not finite, plus the errors of [`hausdorff_directed`].
+pub fn hausdorff_directed_bounded(
+  a: &[Point],
+  b: &[Point],
+  upper_bound_m: f64,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  hausdorff_directed_bounded_with(&Spherical::default(), a, b, upper_bound_m)
+}
+
+/// Bounded directed Hausdorff distance using a custom geodesic algorithm.
+///
+/// # Errors
+/// Propagates the same errors as [`hausdorff_directed_bounded`].
+pub fn hausdorff_directed_bounded_with<A: GeodesicAlgorithm>(
+  algorithm: &A,
+  a: &[Point],
+  b: &[Point],
+  upper_bound_m: f64,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let limit = Distance::from_meters(upper_bound_m)?.meters();
+  let (origins, candidates) = prepare_point_sets(a, b)?;
+  hausdorff_directed_positioned_with(algorithm, &origins, &candidates, Some(limit))
 }
 
 /// Symmetric Hausdorff distance between sets `a` and `b`.
@@ -257,8 +287,9 @@ pub fn hausdorff(a: &[Point], b: &[Point]) -> Result<HausdorffWitness, GeodistEr
 
 /// Symmetric Hausdorff distance using a custom geodesic algorithm.
 ///
-/// Executes [`hausdorff_directed_with`] in both directions and returns the
-/// dominant leg so asymmetric paths are respected.
+/// Evaluates the directed distance in both directions and returns the
+/// dominant leg so asymmetric paths are respected. Both sets are validated
+/// once and shared by the two passes.
 ///
 /// # Errors
 /// Propagates the same validation and empty-set errors as [`hausdorff`].
@@ -267,9 +298,27 @@ pub fn hausdorff_with<A: GeodesicAlgorithm>(
   a: &[Point],
   b: &[Point],
 ) -> Result<HausdorffWitness, GeodistError> {
-  let forward = hausdorff_directed_with(algorithm, a, b)?;
-  let reverse = hausdorff_directed_with(algorithm, b, a)?;
-  HausdorffWitness::new(forward, reverse)
+  let (positioned_a, positioned_b) = prepare_point_sets(a, b)?;
+  hausdorff_positioned(algorithm, &positioned_a, &positioned_b)
+}
+
+/// Symmetric Hausdorff distance with both directed passes run concurrently on
+/// the rayon pool.
+///
+/// Both sets are validated and positioned once, as in [`hausdorff`], before
+/// the two passes are handed to [`rayon::join`]; the witness is identical to
+/// the serial evaluation.
+///
+/// # Errors
+/// Propagates the same validation and empty-set errors as [`hausdorff`].
+#[cfg(feature = "rayon")]
+pub fn hausdorff_parallel(a: &[Point], b: &[Point]) -> Result<HausdorffWitness, GeodistError> {
+  let algorithm = Spherical::default();
+  let (positioned_a, positioned_b) = prepare_point_sets(a, b)?;
+  join_directions(
+    || hausdorff_directed_positioned_with(&algorithm, &positioned_a, &positioned_b, None),
+    || hausdorff_directed_positioned_with(&algorithm, &positioned_b, &positioned_a, None),
+  )
 }
 
 /// Directed Hausdorff distance from set `a` to set `b` using ECEF chord
@@ -300,18 +349,34 @@ pub fn hausdorff_directed_3d_on_ellipsoid(
   a: &[Point3D],
   b: &[Point3D],
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
-  ensure_non_empty(a)?;
-  ensure_non_empty(b)?;
-  validate_points_3d(a)?;
-  validate_points_3d(b)?;
-  ellipsoid.validate()?;
+  hausdorff_directed_3d_internal(ellipsoid, a, b, None)
+}
 
-  let positioned_a = position_points_3d(a);
-  let positioned_b = position_points_3d(b);
-  let ecef_a = to_ecef_points(&positioned_a, &ellipsoid)?;
-  let ecef_b = to_ecef_points(&positioned_b, &ellipsoid)?;
+/// Directed 3D Hausdorff distance that stops once it provably exceeds
+/// `upper_bound_m`, using the WGS84 ellipsoid.
+///
+/// Follows the same early-exit contract as [`hausdorff_directed_bounded`].
+///
+/// # Errors
+/// Returns [`GeodistError::InvalidDistance`] when `upper_bound_m` is negative
+/// or not finite, plus the errors of [`hausdorff_directed_3d`].
+pub fn hausdorff_directed_3d_bounded(
+  a: &[Point3D],
+  b: &[Point3D],
+  upper_bound_m: f64,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let limit = Distance::from_meters(upper_bound_m)?.meters();
+  hausdorff_directed_3d_internal(Ellipsoid::wgs84(), a, b, Some(limit))
+}
 
-  hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b)
+fn hausdorff_directed_3d_internal(
+  ellipsoid: Ellipsoid,
+  a: &[Point3D],
+  b: &[Point3D],
+  upper_bound: Option<f64>,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let (ecef_a, ecef_b) = prepare_ecef_sets(&ellipsoid, a, b)?;
+  hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b, upper_bound)
 }
 
 /// Symmetric 3D Hausdorff distance between sets `a` and `b`.
@@ -328,7 +393,8 @@ pub fn hausdorff_3d(a: &[Point3D], b: &[Point3D]) -> Result<HausdorffWitness, Ge
 
 /// Symmetric 3D Hausdorff distance using a custom ellipsoid.
 ///
-/// Delegates to [`hausdorff_directed_3d_on_ellipsoid`] in each direction.
+/// Both sets are validated and converted to ECEF once and shared by the two
+/// directed passes.
 ///
 /// # Errors
 /// Propagates the same validation and empty-set errors as
@@ -338,9 +404,24 @@ pub fn hausdorff_3d_on_ellipsoid(
   a: &[Point3D],
   b: &[Point3D],
 ) -> Result<HausdorffWitness, GeodistError> {
-  let forward = hausdorff_directed_3d_on_ellipsoid(ellipsoid, a, b)?;
-  let reverse = hausdorff_directed_3d_on_ellipsoid(ellipsoid, b, a)?;
-  HausdorffWitness::new(forward, reverse)
+  let (ecef_a, ecef_b) = prepare_ecef_sets(&ellipsoid, a, b)?;
+  hausdorff_3d_from_ecef(&ecef_a, &ecef_b)
+}
+
+/// Symmetric 3D Hausdorff distance on the WGS84 ellipsoid with both directed
+/// passes run concurrently on the rayon pool.
+///
+/// Validation and ECEF conversion happen once, as in [`hausdorff_3d`].
+///
+/// # Errors
+/// Propagates the same validation and empty-set errors as [`hausdorff_3d`].
+#[cfg(feature = "rayon")]
+pub fn hausdorff_3d_parallel(a: &[Point3D], b: &[Point3D]) -> Result<HausdorffWitness, GeodistError> {
+  let (ecef_a, ecef_b) = prepare_ecef_sets(&Ellipsoid::wgs84(), a, b)?;
+  join_directions(
+    || hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b, None),
+    || hausdorff_directed_3d_from_ecef(&ecef_b, &ecef_a, None),
+  )
 }
 
 /// Directed Hausdorff distance between densified polylines.
@@ -348,9 +429,9 @@ pub fn hausdorff_3d_on_ellipsoid(
 /// Accepts MultiLineString inputs (`Vec<Vec<Point>>`), densifies them using
 /// `options`, and computes the directed Hausdorff witness between the emitted
 /// samples.
-pub fn hausdorff_directed_polyline(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn hausdorff_directed_polyline<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
   hausdorff_directed_polyline_with(&Spherical::default(), a, b, options)
@@ -358,22 +439,85 @@ pub fn hausdorff_directed_polyline(
 
 /// Directed Hausdorff distance between densified polylines using a custom
 /// geodesic algorithm.
-pub fn hausdorff_directed_polyline_with<A: GeodesicAlgorithm>(
+pub fn hausdorff_directed_polyline_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
   hausdorff_directed_polyline_internal(algorithm, a, b, options, None)
 }
 
+/// Directed Hausdorff distance between polylines without materializing the
+/// origin samples.
+///
+/// `b` is densified and indexed once; `a` is densified one segment at a time
+/// and each sample is queried as soon as it is emitted, so peak memory covers
+/// the candidate samples plus a single origin segment. Witnesses and errors
+/// match [`hausdorff_directed_polyline`].
+pub fn hausdorff_directed_polyline_streaming<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
+  options: DensificationOptions,
+) -> Result<PolylineDirectedWitness, GeodistError> {
+  hausdorff_directed_polyline_streaming_with(&Spherical::default(), a, b, options)
+}
+
+/// Streaming directed Hausdorff distance between polylines using a custom
+/// geodesic algorithm.
+pub fn hausdorff_directed_polyline_streaming_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
+  algorithm: &A,
+  a: &[P],
+  b: &[P],
+  options: DensificationOptions,
+) -> Result<PolylineDirectedWitness, GeodistError> {
+  let sampler = MultilineSampler::new(a, options)?;
+  let candidates = densify_multiline(b, options)?;
+  validate_points(candidates.samples())?;
+
+  let index = RTree::bulk_load(index_points(&position_points(candidates.samples()))?);
+  let mut best: Option<(DirectedHausdorffMeters, usize, usize, Point)> = None;
+  let mut flat_index = 0usize;
+
+  sampler.for_each_sample(|part_index, sample_index, point| {
+    point.validate()?;
+    let origin = Positioned {
+      point,
+      index: flat_index,
+    };
+    flat_index += 1;
+
+    let floor = best.map(|(current, ..)| current.meters);
+    if let Some(witness) = nearest_indexed(algorithm, &index, origin, floor)?
+      && best.is_none_or(|(current, ..)| witness.meters > current.meters)
+    {
+      best = Some((witness, part_index, sample_index, point));
+    }
+
+    Ok(())
+  })?;
+
+  let (raw, source_part, source_index, source_coord) = best.ok_or(GeodistError::EmptyPointSet)?;
+  let (target_part, target_index) = candidates.part_and_index(raw.candidate_index)?;
+
+  Ok(PolylineDirectedWitness {
+    distance: Distance::from_meters(raw.meters)?,
+    source_part,
+    source_index,
+    target_part,
+    target_index,
+    source_coord,
+    target_coord: candidates.samples()[raw.candidate_index],
+  })
+}
+
 /// Symmetric Hausdorff distance between densified polylines.
 ///
 /// Executes directed evaluation in both directions with the default spherical
 /// geodesic and returns the dominant witness plus both legs.
-pub fn hausdorff_polyline(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn hausdorff_polyline<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
   hausdorff_polyline_with(&Spherical::default(), a, b, options)
@@ -381,15 +525,43 @@ pub fn hausdorff_polyline(
 
 /// Symmetric Hausdorff distance between densified polylines using a custom
 /// geodesic algorithm.
-pub fn hausdorff_polyline_with<A: GeodesicAlgorithm>(
+pub fn hausdorff_polyline_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
   hausdorff_polyline_internal(algorithm, a, b, options, None)
 }
 
+/// Symmetric Hausdorff distance between polylines that are already densified.
+///
+/// Skips densification, so a polyline compared against many others can be
+/// sampled once with [`densify_multiline`] and reused. Witness part/index
+/// fields reference the supplied sample order.
+///
+/// # Errors
+/// Returns [`GeodistError::EmptyPointSet`] when either sample set is empty.
+pub fn hausdorff_polyline_densified(
+  a: &FlattenedPolyline,
+  b: &FlattenedPolyline,
+) -> Result<PolylineHausdorffWitness, GeodistError> {
+  hausdorff_polyline_densified_with(&Spherical::default(), a, b)
+}
+
+/// Symmetric Hausdorff distance between densified polylines using a custom
+/// geodesic algorithm.
+///
+/// # Errors
+/// Propagates the same errors as [`hausdorff_polyline_densified`].
+pub fn hausdorff_polyline_densified_with<A: GeodesicAlgorithm>(
+  algorithm: &A,
+  a: &FlattenedPolyline,
+  b: &FlattenedPolyline,
+) -> Result<PolylineHausdorffWitness, GeodistError> {
+  hausdorff_polyline_from_samples(algorithm, a, b)
+}
+
 /// Directed Hausdorff distance after clipping both sets by a bounding box.
 ///
 /// Points outside `bounding_box` are discarded prior to the directed distance
@@ -420,14 +592,36 @@ pub fn hausdorff_directed_clipped_with<A: GeodesicAlgorithm>(
   b: &[Point],
   bounding_box: BoundingBox,
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
-  let filtered_a = filter_points(a, &bounding_box);
-  let filtered_b = filter_points(b, &bounding_box);
-  ensure_non_empty(&filtered_a)?;
-  ensure_non_empty(&filtered_b)?;
-  validate_positioned_points(&filtered_a)?;
-  validate_positioned_points(&filtered_b)?;
+  hausdorff_directed_clipped_internal(algorithm, a, b, bounding_box, None)
+}
+
+/// Directed Hausdorff distance after bounding box filtering that stops once it
+/// provably exceeds `upper_bound_m`.
+///
+/// Follows the same early-exit contract as [`hausdorff_directed_bounded`].
+///
+/// # Errors
+/// Returns [`GeodistError::InvalidDistance`] when `upper_bound_m` is negative
+/// or not finite, plus the errors of [`hausdorff_directed_clipped`].
+pub fn hausdorff_directed_clipped_bounded(
+  a: &[Point],
+  b: &[Point],
+  bounding_box: BoundingBox,
+  upper_bound_m: f64,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let limit = Distance::from_meters(upper_bound_m)?.meters();
+  hausdorff_directed_clipped_internal(&Spherical::default(), a, b, bounding_box, Some(limit))
+}
 
-  hausdorff_directed_positioned_with(algorithm, &filtered_a, &filtered_b)
+fn hausdorff_directed_clipped_internal<A: GeodesicAlgorithm>(
+  algorithm: &A,
+  a: &[Point],
+  b: &[Point],
+  bounding_box: BoundingBox,
+  upper_bound: Option<f64>,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let (filtered_a, filtered_b) = prepare_clipped_point_sets(a, b, &bounding_box)?;
+  hausdorff_directed_positioned_with(algorithm, &filtered_a, &filtered_b, upper_bound)
 }
 
 /// Symmetric Hausdorff distance after clipping both sets by a bounding box.
@@ -461,21 +655,37 @@ pub fn hausdorff_clipped_with<A: GeodesicAlgorithm>(
   b: &[Point],
   bounding_box: BoundingBox,
 ) -> Result<HausdorffWitness, GeodistError> {
-  let filtered_a = filter_points(a, &bounding_box);
-  let filtered_b = filter_points(b, &bounding_box);
-  ensure_non_empty(&filtered_a)?;
-  ensure_non_empty(&filtered_b)?;
-  validate_positioned_points(&filtered_a)?;
-  validate_positioned_points(&filtered_b)?;
-
+  let (filtered_a, filtered_b) = prepare_clipped_point_sets(a, b, &bounding_box)?;
   hausdorff_positioned(algorithm, &filtered_a, &filtered_b)
 }
 
+/// Symmetric clipped Hausdorff distance with both directed passes run
+/// concurrently on the rayon pool.
+///
+/// Both sets are filtered and validated once, as in [`hausdorff_clipped`].
+///
+/// # Errors
+/// Propagates the same validation and empty-set errors as
+/// [`hausdorff_clipped`].
+#[cfg(feature = "rayon")]
+pub fn hausdorff_clipped_parallel(
+  a: &[Point],
+  b: &[Point],
+  bounding_box: BoundingBox,
+) -> Result<HausdorffWitness, GeodistError> {
+  let algorithm = Spherical::default();
+  let (filtered_a, filtered_b) = prepare_clipped_point_sets(a, b, &bounding_box)?;
+  join_directions(
+    || hausdorff_directed_positioned_with(&algorithm, &filtered_a, &filtered_b, None),
+    || hausdorff_directed_positioned_with(&algorithm, &filtered_b, &filtered_a, None),
+  )
+}
+
 /// Directed Hausdorff distance between densified polylines after bounding box
 /// clipping.
-pub fn hausdorff_directed_polyline_clipped(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn hausdorff_directed_polyline_clipped<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: BoundingBox,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
@@ -484,10 +694,10 @@ pub fn hausdorff_directed_polyline_clipped(
 
 /// Directed polyline Hausdorff distance with custom geodesic algorithm after
 /// bounding box clipping.
-pub fn hausdorff_directed_polyline_clipped_with<A: GeodesicAlgorithm>(
+pub fn hausdorff_directed_polyline_clipped_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: BoundingBox,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
@@ -496,9 +706,9 @@ pub fn hausdorff_directed_polyline_clipped_with<A: GeodesicAlgorithm>(
 
 /// Symmetric Hausdorff distance between densified polylines after clipping to
 /// a bounding box.
-pub fn hausdorff_polyline_clipped(
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+pub fn hausdorff_polyline_clipped<P: AsRef<[Point]>>(
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: BoundingBox,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
@@ -507,10 +717,10 @@ pub fn hausdorff_polyline_clipped(
 
 /// Symmetric polyline Hausdorff distance with custom geodesic algorithm and
 /// bounding box clipping.
-pub fn hausdorff_polyline_clipped_with<A: GeodesicAlgorithm>(
+pub fn hausdorff_polyline_clipped_with<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: BoundingBox,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
@@ -549,17 +759,36 @@ pub fn hausdorff_directed_clipped_3d_on_ellipsoid(
   b: &[Point3D],
   bounding_box: BoundingBox,
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
-  let filtered_a = filter_points_3d(a, &bounding_box);
-  let filtered_b = filter_points_3d(b, &bounding_box);
-  ensure_non_empty(&filtered_a)?;
-  ensure_non_empty(&filtered_b)?;
-  validate_positioned_points_3d(&filtered_a)?;
-  validate_positioned_points_3d(&filtered_b)?;
-  ellipsoid.validate()?;
+  hausdorff_directed_clipped_3d_internal(ellipsoid, a, b, bounding_box, None)
+}
+
+/// Directed 3D Hausdorff distance after bounding box filtering that stops once
+/// it provably exceeds `upper_bound_m`, using the WGS84 ellipsoid.
+///
+/// Follows the same early-exit contract as [`hausdorff_directed_bounded`].
+///
+/// # Errors
+/// Returns [`GeodistError::InvalidDistance`] when `upper_bound_m` is negative
+/// or not finite, plus the errors of [`hausdorff_directed_clipped_3d`].
+pub fn hausdorff_directed_clipped_3d_bounded(
+  a: &[Point3D],
+  b: &[Point3D],
+  bounding_box: BoundingBox,
+  upper_bound_m: f64,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let limit = Distance::from_meters(upper_bound_m)?.meters();
+  hausdorff_directed_clipped_3d_internal(Ellipsoid::wgs84(), a, b, bounding_box, Some(limit))
+}
 
-  let ecef_a = to_ecef_points(&filtered_a, &ellipsoid)?;
-  let ecef_b = to_ecef_points(&filtered_b, &ellipsoid)?;
-  hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b)
+fn hausdorff_directed_clipped_3d_internal(
+  ellipsoid: Ellipsoid,
+  a: &[Point3D],
+  b: &[Point3D],
+  bounding_box: BoundingBox,
+  upper_bound: Option<f64>,
+) -> Result<HausdorffDirectedWitness, GeodistError> {
+  let (ecef_a, ecef_b) = prepare_clipped_ecef_sets(&ellipsoid, a, b, &bounding_box)?;
+  hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b, upper_bound)
 }
 
 /// Symmetric 3D Hausdorff distance after bounding box clipping.
@@ -581,8 +810,8 @@ pub fn hausdorff_clipped_3d(
 
 /// Symmetric 3D Hausdorff distance on a custom ellipsoid after bounding.
 ///
-/// Delegates to [`hausdorff_directed_clipped_3d_on_ellipsoid`] in both
-/// directions, honoring the provided ellipsoid for ECEF conversion.
+/// Applies the clipping of [`hausdorff_directed_clipped_3d_on_ellipsoid`]
+/// once and shares the converted sets between both directions.
 ///
 /// # Errors
 /// Propagates the same validation, empty-set, and ellipsoid errors as
@@ -593,26 +822,36 @@ pub fn hausdorff_clipped_3d_on_ellipsoid(
   b: &[Point3D],
   bounding_box: BoundingBox,
 ) -> Result<HausdorffWitness, GeodistError> {
-  let filtered_a = filter_points_3d(a, &bounding_box);
-  let filtered_b = filter_points_3d(b, &bounding_box);
-  ensure_non_empty(&filtered_a)?;
-  ensure_non_empty(&filtered_b)?;
-  validate_positioned_points_3d(&filtered_a)?;
-  validate_positioned_points_3d(&filtered_b)?;
-  ellipsoid.validate()?;
-
-  let ecef_a = to_ecef_points(&filtered_a, &ellipsoid)?;
-  let ecef_b = to_ecef_points(&filtered_b, &ellipsoid)?;
+  let (ecef_a, ecef_b) = prepare_clipped_ecef_sets(&ellipsoid, a, b, &bounding_box)?;
+  hausdorff_3d_from_ecef(&ecef_a, &ecef_b)
+}
 
-  let forward = hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b)?;
-  let reverse = hausdorff_directed_3d_from_ecef(&ecef_b, &ecef_a)?;
-  HausdorffWitness::new(forward, reverse)
+/// Symmetric clipped 3D Hausdorff distance on the WGS84 ellipsoid with both
+/// directed passes run concurrently on the rayon pool.
+///
+/// Clipping, validation, and ECEF conversion happen once, as in
+/// [`hausdorff_clipped_3d`].
+///
+/// # Errors
+/// Propagates the same validation and empty-set errors as
+/// [`hausdorff_clipped_3d`].
+#[cfg(feature = "rayon")]
+pub fn hausdorff_clipped_3d_parallel(
+  a: &[Point3D],
+  b: &[Point3D],
+  bounding_box: BoundingBox,
+) -> Result<HausdorffWitness, GeodistError> {
+  let (ecef_a, ecef_b) = prepare_clipped_ecef_sets(&Ellipsoid::wgs84(), a, b, &bounding_box)?;
+  join_directions(
+    || hausdorff_directed_3d_from_ecef(&ecef_a, &ecef_b, None),
+    || hausdorff_directed_3d_from_ecef(&ecef_b, &ecef_a, None),
+  )
 }
 
-fn hausdorff_directed_polyline_internal<A: GeodesicAlgorithm>(
+fn hausdorff_directed_polyline_internal<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: Option<BoundingBox>,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
@@ -621,10 +860,10 @@ fn hausdorff_directed_polyline_internal<A: GeodesicAlgorithm>(
   hausdorff_directed_polyline_from_samples(algorithm, &samples_a, &samples_b)
 }
 
-fn hausdorff_polyline_internal<A: GeodesicAlgorithm>(
+fn hausdorff_polyline_internal<A: GeodesicAlgorithm, P: AsRef<[Point]>>(
   algorithm: &A,
-  a: &[Vec<Point>],
-  b: &[Vec<Point>],
+  a: &[P],
+  b: &[P],
   options: DensificationOptions,
   bounding_box: Option<BoundingBox>,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
@@ -668,6 +907,74 @@ fn validate_positioned_points_3d(points: &[Positioned<Point3D>]) -> Result<(), G
   Ok(())
 }
 
+/// Check and position both sets once so symmetric evaluation can reuse them
+/// for both directed passes. Emptiness is checked before coordinates so the
+/// error precedence matches the directed entry points.
+fn prepare_point_sets(
+  a: &[Point],
+  b: &[Point],
+) -> Result<(Vec<Positioned<Point>>, Vec<Positioned<Point>>), GeodistError> {
+  ensure_non_empty(a)?;
+  ensure_non_empty(b)?;
+  validate_points(a)?;
+  validate_points(b)?;
+  Ok((position_points(a), position_points(b)))
+}
+
+/// Clip, check, and validate both sets once; the clipped counterpart of
+/// [`prepare_point_sets`].
+fn prepare_clipped_point_sets(
+  a: &[Point],
+  b: &[Point],
+  bounding_box: &BoundingBox,
+) -> Result<(Vec<Positioned<Point>>, Vec<Positioned<Point>>), GeodistError> {
+  let filtered_a = filter_points(a, bounding_box);
+  let filtered_b = filter_points(b, bounding_box);
+  ensure_non_empty(&filtered_a)?;
+  ensure_non_empty(&filtered_b)?;
+  validate_positioned_points(&filtered_a)?;
+  validate_positioned_points(&filtered_b)?;
+  Ok((filtered_a, filtered_b))
+}
+
+/// Check and validate both 3D sets once and convert them to ECEF.
+fn prepare_ecef_sets(
+  ellipsoid: &Ellipsoid,
+  a: &[Point3D],
+  b: &[Point3D],
+) -> Result<(Vec<Positioned<EcefPoint>>, Vec<Positioned<EcefPoint>>), GeodistError> {
+  ensure_non_empty(a)?;
+  ensure_non_empty(b)?;
+  validate_points_3d(a)?;
+  validate_points_3d(b)?;
+  ellipsoid.validate()?;
+
+  let ecef_a = to_ecef_points(&position_points_3d(a), ellipsoid)?;
+  let ecef_b = to_ecef_points(&position_points_3d(b), ellipsoid)?;
+  Ok((ecef_a, ecef_b))
+}
+
+/// Clip both 3D sets on latitude/longitude, validate them once, and convert
+/// the survivors to ECEF.
+fn prepare_clipped_ecef_sets(
+  ellipsoid: &Ellipsoid,
+  a: &[Point3D],
+  b: &[Point3D],
+  bounding_box: &BoundingBox,
+) -> Result<(Vec<Positioned<EcefPoint>>, Vec<Positioned<EcefPoint>>), GeodistError> {
+  let filtered_a = filter_points_3d(a, bounding_box);
+  let filtered_b = filter_points_3d(b, bounding_box);
+  ensure_non_empty(&filtered_a)?;
+  ensure_non_empty(&filtered_b)?;
+  validate_positioned_points_3d(&filtered_a)?;
+  validate_positioned_points_3d(&filtered_b)?;
+  ellipsoid.validate()?;
+
+  let ecef_a = to_ecef_points(&filtered_a, ellipsoid)?;
+  let ecef_b = to_ecef_points(&filtered_b, ellipsoid)?;
+  Ok((ecef_a, ecef_b))
+}
+
 fn position_points(points: &[Point]) -> Vec<Positioned<Point>> {
   points
     .iter()
@@ -706,8 +1013,8 @@ fn filter_points_3d(points: &[Point3D], bounding_box: &BoundingBox) -> Vec<Posit
     .collect()
 }
 
-fn densify_and_clip(
-  parts: &[Vec<Point>],
+fn densify_and_clip<P: AsRef<[Point]>>(
+  parts: &[P],
   options: DensificationOptions,
   bounding_box: Option<&BoundingBox>,
 ) -> Result<FlattenedPolyline, GeodistError> {
@@ -739,7 +1046,24 @@ fn hausdorff_directed_polyline_from_samples<A: GeodesicAlgorithm>(
   origins: &FlattenedPolyline,
   candidates: &FlattenedPolyline,
 ) -> Result<PolylineDirectedWitness, GeodistError> {
-  let witness = hausdorff_directed_with(algorithm, origins.samples(), candidates.samples())?;
+  let (positioned_origins, positioned_candidates) = prepare_point_sets(origins.samples(), candidates.samples())?;
+  polyline_witness_from_positioned(
+    algorithm,
+    origins,
+    &positioned_origins,
+    candidates,
+    &positioned_candidates,
+  )
+}
+
+fn polyline_witness_from_positioned<A: GeodesicAlgorithm>(
+  algorithm: &A,
+  origins: &FlattenedPolyline,
+  positioned_origins: &[Positioned<Point>],
+  candidates: &FlattenedPolyline,
+  positioned_candidates: &[Positioned<Point>],
+) -> Result<PolylineDirectedWitness, GeodistError> {
+  let witness = hausdorff_directed_positioned_with(algorithm, positioned_origins, positioned_candidates, None)?;
   let (source_part, source_index) = origins.part_and_index(witness.origin_index())?;
   let (target_part, target_index) = candidates.part_and_index(witness.candidate_index())?;
 
@@ -759,8 +1083,9 @@ fn hausdorff_polyline_from_samples<A: GeodesicAlgorithm>(
   a: &FlattenedPolyline,
   b: &FlattenedPolyline,
 ) -> Result<PolylineHausdorffWitness, GeodistError> {
-  let forward = hausdorff_directed_polyline_from_samples(algorithm, a, b)?;
-  let reverse = hausdorff_directed_polyline_from_samples(algorithm, b, a)?;
+  let (positioned_a, positioned_b) = prepare_point_sets(a.samples(), b.samples())?;
+  let forward = polyline_witness_from_positioned(algorithm, a, &positioned_a, b, &positioned_b)?;
+  let reverse = polyline_witness_from_positioned(algorithm, b, &positioned_b, a, &positioned_a)?;
   let meters = forward.distance().meters().max(reverse.distance().meters());
   let distance = Distance::from_meters(meters)?;
 
@@ -800,18 +1125,24 @@ fn should_break_search(current: &DirectedHausdorffMeters, candidate_distance: f6
   candidate_distance - current.meters > f64::EPSILON
 }
 
+/// Whether `witness` already proves the directed distance exceeds `upper_bound`.
+fn exceeds_bound(witness: &DirectedHausdorffMeters, upper_bound: Option<f64>) -> bool {
+  upper_bound.is_some_and(|limit| witness.meters > limit)
+}
+
 fn hausdorff_directed_positioned_with<A: GeodesicAlgorithm>(
   algorithm: &A,
   origins: &[Positioned<Point>],
   candidates: &[Positioned<Point>],
+  upper_bound: Option<f64>,
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
   ensure_non_empty(origins)?;
   ensure_non_empty(candidates)?;
 
   let strategy = choose_strategy(origins.len(), candidates.len());
   let raw = match strategy {
-    HausdorffStrategy::Naive => hausdorff_directed_naive(algorithm, origins, candidates)?,
-    HausdorffStrategy::Indexed => hausdorff_directed_indexed(algorithm, origins, candidates)?,
+    HausdorffStrategy::Naive => hausdorff_directed_naive(algorithm, origins, candidates, upper_bound)?,
+    HausdorffStrategy::Indexed => hausdorff_directed_indexed(algorithm, origins, candidates, upper_bound)?,
   };
 
   HausdorffDirectedWitness::from_raw(raw)
@@ -822,22 +1153,45 @@ fn hausdorff_positioned<A: GeodesicAlgorithm>(
   a: &[Positioned<Point>],
   b: &[Positioned<Point>],
 ) -> Result<HausdorffWitness, GeodistError> {
-  let forward = hausdorff_directed_positioned_with(algorithm, a, b)?;
-  let reverse = hausdorff_directed_positioned_with(algorithm, b, a)?;
+  let forward = hausdorff_directed_positioned_with(algorithm, a, b, None)?;
+  let reverse = hausdorff_directed_positioned_with(algorithm, b, a, None)?;
   HausdorffWitness::new(forward, reverse)
 }
 
+fn hausdorff_3d_from_ecef(
+  a: &[Positioned<EcefPoint>],
+  b: &[Positioned<EcefPoint>],
+) -> Result<HausdorffWitness, GeodistError> {
+  let forward = hausdorff_directed_3d_from_ecef(a, b, None)?;
+  let reverse = hausdorff_directed_3d_from_ecef(b, a, None)?;
+  HausdorffWitness::new(forward, reverse)
+}
+
+/// Evaluate the two directed passes of a symmetric call on the rayon pool.
+///
+/// Errors keep the serial precedence: a failing forward pass wins.
+#[cfg(feature = "rayon")]
+fn join_directions<F, R>(forward: F, reverse: R) -> Result<HausdorffWitness, GeodistError>
+where
+  F: FnOnce() -> Result<HausdorffDirectedWitness, GeodistError> + Send,
+  R: FnOnce() -> Result<HausdorffDirectedWitness, GeodistError> + Send,
+{
+  let (forward, reverse) = rayon::join(forward, reverse);
+  HausdorffWitness::new(forward?, reverse?)
+}
+
 fn hausdorff_directed_3d_from_ecef(
   origins: &[Positioned<EcefPoint>],
   candidates: &[Positioned<EcefPoint>],
+  upper_bound: Option<f64>,
 ) -> Result<HausdorffDirectedWitness, GeodistError> {
   ensure_non_empty(origins)?;
   ensure_non_empty(candidates)?;
 
   let strategy = choose_strategy(origins.len(), candidates.len());
   let raw = match strategy {
-    HausdorffStrategy::Naive => hausdorff_directed_3d_naive(origins, candidates),
-    HausdorffStrategy::Indexed => hausdorff_directed_3d_indexed(origins, candidates),
+    HausdorffStrategy::Naive => hausdorff_directed_3d_naive(origins, candidates, upper_bound),
+    HausdorffStrategy::Indexed => hausdorff_directed_3d_indexed(origins, candidates, upper_bound),
   };
 
   HausdorffDirectedWitness::from_raw(raw)
@@ -847,13 +1201,18 @@ fn hausdorff_directed_naive<A: GeodesicAlgorithm>(
   algorithm: &A,
   origins: &[Positioned<Point>],
   candidates: &[Positioned<Point>],
+  upper_bound: Option<f64>,
 ) -> Result<DirectedHausdorffMeters, GeodistError> {
+  let candidates = prepare_points(candidates)?;
   let mut best: Option<DirectedHausdorffMeters> = None;
 
   for origin in origins {
+    let prepared_origin = PreparedPoint::new(origin.point)?;
     let mut nearest: Option<(f64, usize)> = None;
-    for candidate in candidates {
-      let meters = algorithm.geodesic_distance(origin.point, candidate.point)?.meters();
+    for candidate in &candidates {
+      let meters = algorithm
+        .prepared_distance(&prepared_origin, &candidate.point)?
+        .meters();
       if nearest.is_none_or(|(current, _)| meters < current) {
         nearest = Some((meters, candidate.index));
       }
@@ -869,6 +1228,9 @@ fn hausdorff_directed_naive<A: GeodesicAlgorithm>(
     if best.is_none_or(|current| witness.meters > current.meters) {
       best = Some(witness);
     }
+    if exceeds_bound(&witness, upper_bound) {
+      break;
+    }
   }
 
   best.ok_or(GeodistError::EmptyPointSet)
@@ -878,65 +1240,118 @@ fn hausdorff_directed_indexed<A: GeodesicAlgorithm>(
   algorithm: &A,
   origins: &[Positioned<Point>],
   candidates: &[Positioned<Point>],
+  upper_bound: Option<f64>,
 ) -> Result<DirectedHausdorffMeters, GeodistError> {
-  let index = RTree::bulk_load(index_points(algorithm, candidates));
+  let index = RTree::bulk_load(index_points(candidates)?);
   let mut best: Option<DirectedHausdorffMeters> = None;
 
   for origin in origins {
-    let query = [origin.point.lon, origin.point.lat];
-    let mut nearest: Option<DirectedHausdorffMeters> = None;
+    let floor = best.map(|current| current.meters);
+    if let Some(origin_witness) = nearest_indexed(algorithm, &index, *origin, floor)?
+      && best.is_none_or(|current| origin_witness.meters > current.meters)
+    {
+      best = Some(origin_witness);
+      if exceeds_bound(&origin_witness, upper_bound) {
+        break;
+      }
+    }
+  }
 
-    for candidate in index.nearest_neighbor_iter(&query) {
-      let meters = algorithm.geodesic_distance(origin.point, candidate.point)?.meters();
-      let witness = DirectedHausdorffMeters {
-        meters,
-        origin_index: origin.index,
-        candidate_index: candidate.source_index,
-      };
+  best.ok_or(GeodistError::EmptyPointSet)
+}
 
-      if prefer_candidate(&nearest, &witness) {
-        nearest = Some(witness);
-      }
+/// Nearest indexed candidate for `origin`.
+///
+/// Candidates arrive in increasing unit-sphere chord order. Once the central
+/// angle scaled by [`GeodesicAlgorithm::min_meters_per_radian`] exceeds the
+/// best distance found so far, no remaining candidate can be closer and the
+/// scan stops; algorithms without such a bound visit every candidate.
+///
+/// Returns `None` as soon as any candidate lies within `floor` (the running
+/// directed maximum): the origin's nearest distance can then no longer exceed
+/// it, so the remaining candidates need not be visited.
+fn nearest_indexed<A: GeodesicAlgorithm>(
+  algorithm: &A,
+  index: &RTree<IndexedPoint>,
+  origin: Positioned<Point>,
+  floor: Option<f64>,
+) -> Result<Option<DirectedHausdorffMeters>, GeodistError> {
+  let query = unit_vector(origin.point);
+  let prepared_origin = PreparedPoint::new(origin.point)?;
+  let meters_per_radian = algorithm.min_meters_per_radian();
+  let mut nearest: Option<DirectedHausdorffMeters> = None;
+
+  for (candidate, chord_squared) in index.nearest_neighbor_iter_with_distance_2(&query) {
+    if let (Some(current), Some(scale)) = (nearest, meters_per_radian)
+      && should_break_search(&current, central_angle_lower_bound(chord_squared) * scale)
+    {
+      break;
+    }
 
-      if let Some(current) = nearest
-        && should_break_search(&current, meters)
-      {
-        break;
-      }
+    let meters = algorithm
+      .prepared_distance(&prepared_origin, &candidate.point)?
+      .meters();
+    if floor.is_some_and(|limit| meters <= limit) {
+      return Ok(None);
     }
 
-    let origin_witness = nearest.expect("candidate set validated as non-empty");
+    let witness = DirectedHausdorffMeters {
+      meters,
+      origin_index: origin.index,
+      candidate_index: candidate.source_index,
+    };
 
-    if best.is_none_or(|current| origin_witness.meters > current.meters) {
-      best = Some(origin_witness);
+    if prefer_candidate(&nearest, &witness) {
+      nearest = Some(witness);
     }
   }
 
-  best.ok_or(GeodistError::EmptyPointSet)
+  Ok(nearest)
+}
+
+/// Slack subtracted from squared unit-sphere chords before they become
+/// distance lower bounds, absorbing rounding in the unit vectors so pruning
+/// never skips a candidate the exhaustive scan would pick.
+const CHORD_SQUARED_SLACK: f64 = 1e-14;
+
+/// Conservative central angle in radians for a squared unit-sphere chord.
+fn central_angle_lower_bound(chord_squared: f64) -> f64 {
+  let chord = (chord_squared - CHORD_SQUARED_SLACK).max(0.0).sqrt();
+  2.0 * (chord / 2.0).min(1.0).asin()
+}
+
+/// Position of `point` on the unit sphere.
+fn unit_vector(point: Point) -> [f64; 3] {
+  let (sin_lat, cos_lat) = point.lat.to_radians().sin_cos();
+  let (sin_lon, cos_lon) = point.lon.to_radians().sin_cos();
+  [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat]
 }
 
 /// Directed 3D Hausdorff distance using a naive O(n*m) search.
 ///
 /// Iterates over every origin/candidate pair and returns the maximum of the
-/// per-origin nearest-neighbor distances measured in ECEF meters.
+/// per-origin nearest-neighbor distances measured in ECEF meters. Candidates
+/// are compared by squared chord length, so each origin pays for a single
+/// square root.
 fn hausdorff_directed_3d_naive(
   origins: &[Positioned<EcefPoint>],
   candidates: &[Positioned<EcefPoint>],
+  upper_bound: Option<f64>,
 ) -> DirectedHausdorffMeters {
   let mut best: Option<DirectedHausdorffMeters> = None;
 
   for origin in origins {
     let mut nearest: Option<(f64, usize)> = None;
     for candidate in candidates {
-      let meters = origin.point.distance_to(candidate.point);
-      if nearest.is_none_or(|(current, _)| meters < current) {
-        nearest = Some((meters, candidate.index));
+      let squared = origin.point.squared_distance_to(candidate.point);
+      if nearest.is_none_or(|(current, _)| squared < current) {
+        nearest = Some((squared, candidate.index));
       }
     }
 
-    let (min_distance, nearest_index) = nearest.expect("candidate set validated as non-empty");
+    let (min_squared, nearest_index) = nearest.expect("candidate set validated as non-empty");
     let witness = DirectedHausdorffMeters {
-      meters: min_distance,
+      meters: min_squared.sqrt(),
       origin_index: origin.index,
       candidate_index: nearest_index,
     };
@@ -944,6 +1359,9 @@ fn hausdorff_directed_3d_naive(
     if best.is_none_or(|current| witness.meters > current.meters) {
       best = Some(witness);
     }
+    if exceeds_bound(&witness, upper_bound) {
+      break;
+    }
   }
 
   best.expect("origin set validated as non-empty")
@@ -956,6 +1374,7 @@ fn hausdorff_directed_3d_naive(
 fn hausdorff_directed_3d_indexed(
   origins: &[Positioned<EcefPoint>],
   candidates: &[Positioned<EcefPoint>],
+  upper_bound: Option<f64>,
 ) -> DirectedHausdorffMeters {
   let index = RTree::bulk_load(index_ecef_points(candidates));
   let mut best: Option<DirectedHausdorffMeters> = None;
@@ -988,19 +1407,35 @@ fn hausdorff_directed_3d_indexed(
     if best.is_none_or(|current| origin_witness.meters > current.meters) {
       best = Some(origin_witness);
     }
+    if exceeds_bound(&origin_witness, upper_bound) {
+      break;
+    }
   }
 
   best.expect("origin set validated as non-empty")
 }
 
-fn index_points<'a, A: GeodesicAlgorithm>(algorithm: &'a A, points: &[Positioned<Point>]) -> Vec<IndexedPoint<'a, A>> {
+fn prepare_points(points: &[Positioned<Point>]) -> Result<Vec<Positioned<PreparedPoint>>, GeodistError> {
   points
     .iter()
-    .copied()
-    .map(|positioned| IndexedPoint {
-      algorithm,
-      point: positioned.point,
-      source_index: positioned.index,
+    .map(|positioned| {
+      Ok(Positioned {
+        index: positioned.index,
+        point: PreparedPoint::new(positioned.point)?,
+      })
+    })
+    .collect()
+}
+
+fn index_points(points: &[Positioned<Point>]) -> Result<Vec<IndexedPoint>, GeodistError> {
+  points
+    .iter()
+    .map(|positioned| {
+      Ok(IndexedPoint {
+        position: unit_vector(positioned.point),
+        point: PreparedPoint::new(positioned.point)?,
+        source_index: positioned.index,
+      })
     })
     .collect()
 }
@@ -1016,35 +1451,31 @@ fn index_ecef_points(points: &[Positioned<EcefPoint>]) -> Vec<IndexedEcefPoint>
     .collect()
 }
 
+/// Candidate indexed by its unit-sphere position.
+///
+/// Envelopes and distances share the same Euclidean space, so R-tree pruning
+/// is exact and queries visit O(log m) nodes instead of the whole tree; the
+/// chord ordering is monotonic in central angle.
 #[derive(Clone, Copy)]
-struct IndexedPoint<'a, A> {
-  algorithm: &'a A,
-  point: Point,
+struct IndexedPoint {
+  position: [f64; 3],
+  point: PreparedPoint,
   source_index: usize,
 }
 
-impl<'a, A> RTreeObject for IndexedPoint<'a, A> {
-  type Envelope = AABB<[f64; 2]>;
+impl RTreeObject for IndexedPoint {
+  type Envelope = AABB<[f64; 3]>;
 
   fn envelope(&self) -> Self::Envelope {
-    AABB::from_point([self.point.lon, self.point.lat])
+    AABB::from_point(self.position)
   }
 }
 
-impl<'a, A: GeodesicAlgorithm> PointDistance for IndexedPoint<'a, A> {
-  fn distance_2(&self, point: &[f64; 2]) -> f64 {
-    let query = Point {
-      lat: point[1],
-      lon: point[0],
-    };
-
-    match self.algorithm.geodesic_distance(self.point, query) {
-      Ok(distance) => {
-        let meters = distance.meters();
-        meters * meters
-      }
-      Err(_) => f64::INFINITY,
-    }
+impl PointDistance for IndexedPoint {
+  fn distance_2(&self, point: &[f64; 3]) -> f64 {
+    let [x, y, z] = self.position;
+    let (dx, dy, dz) = (x - point[0], y - point[1], z - point[2]);
+    dx * dx + dy * dy + dz * dz
   }
 }
 
@@ -1252,6 +1683,33 @@ mod tests {
     assert!((distance - expected).abs() < 1e-6);
   }
 
+  #[cfg(feature = "rayon")]
+  #[test]
+  fn parallel_symmetric_variants_match_serial() {
+    let a: Vec<Point> = (0..70).map(|i| Point::new(0.0, i as f64 * 0.1).unwrap()).collect();
+    let b: Vec<Point> = (0..40).map(|i| Point::new(0.05, i as f64 * 0.2).unwrap()).collect();
+    let bounding_box = BoundingBox::new(-1.0, 1.0, 0.0, 5.0).unwrap();
+
+    assert_eq!(hausdorff_parallel(&a, &b).unwrap(), hausdorff(&a, &b).unwrap());
+    assert_eq!(
+      hausdorff_clipped_parallel(&a, &b, bounding_box).unwrap(),
+      hausdorff_clipped(&a, &b, bounding_box).unwrap()
+    );
+
+    let a_3d: Vec<Point3D> = a.iter().map(|p| Point3D::new(p.lat, p.lon, 10.0).unwrap()).collect();
+    let b_3d: Vec<Point3D> = b.iter().map(|p| Point3D::new(p.lat, p.lon, 0.0).unwrap()).collect();
+
+    assert_eq!(
+      hausdorff_3d_parallel(&a_3d, &b_3d).unwrap(),
+      hausdorff_3d(&a_3d, &b_3d).unwrap()
+    );
+    assert_eq!(
+      hausdorff_clipped_3d_parallel(&a_3d, &b_3d, bounding_box).unwrap(),
+      hausdorff_clipped_3d(&a_3d, &b_3d, bounding_box).unwrap()
+    );
+    assert!(matches!(hausdorff_parallel(&[], &b), Err(GeodistError::EmptyPointSet)));
+  }
+
   #[test]
   fn directed_3d_witness_reports_indices() {
     let far = Point3D::new(0.0, 0.0, 100.0).unwrap();
@@ -1279,6 +1737,46 @@ mod tests {
     assert_eq!(witness.origin_index(), 0);
   }
 
+  #[test]
+  fn indexed_search_matches_naive_scan_for_bounded_algorithms() {
+    let origins = position_points(
+      &(0..60)
+        .map(|i| Point::new(f64::from(i) * 1.3 - 40.0, f64::from(i * 7 % 60) * 5.0 - 150.0).unwrap())
+        .collect::<Vec<_>>(),
+    );
+    let candidates = position_points(
+      &(0..400)
+        .map(|i| Point::new(f64::from(i % 20) * 4.0 - 38.0, f64::from(i / 20) * 17.0 - 170.0).unwrap())
+        .collect::<Vec<_>>(),
+    );
+
+    let spherical = Spherical::default();
+    let ellipsoidal = crate::algorithms::Geographiclib::from_ellipsoid(Ellipsoid::wgs84()).unwrap();
+    assert_eq!(
+      hausdorff_directed_indexed(&spherical, &origins, &candidates, None).unwrap(),
+      hausdorff_directed_naive(&spherical, &origins, &candidates, None).unwrap()
+    );
+    assert_eq!(
+      hausdorff_directed_indexed(&ellipsoidal, &origins, &candidates, None).unwrap(),
+      hausdorff_directed_naive(&ellipsoidal, &origins, &candidates, None).unwrap()
+    );
+  }
+
+  #[test]
+  fn densified_polyline_hausdorff_matches_raw_inputs() {
+    let options = DensificationOptions::default();
+    let a = vec![vec![Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 0.01).unwrap()]];
+    let b = vec![vec![Point::new(0.001, 0.0).unwrap(), Point::new(0.001, 0.01).unwrap()]];
+
+    let samples_a = densify_multiline(&a, options).unwrap();
+    let samples_b = densify_multiline(&b, options).unwrap();
+
+    assert_eq!(
+      hausdorff_polyline_densified(&samples_a, &samples_b).unwrap(),
+      hausdorff_polyline(&a, &b, options).unwrap()
+    );
+  }
+
   #[test]
   fn polyline_directed_maps_parts_and_indices() {
     let options = DensificationOptions {
@@ -1303,6 +1801,109 @@ mod tests {
     assert_eq!(witness.target_coord(), Point::new(0.0, 0.0).unwrap());
   }
 
+  #[test]
+  fn bounded_directed_matches_unbounded_within_bound() {
+    let a: Vec<Point> = (0..40).map(|i| Point::new(0.0, f64::from(i) * 0.1).unwrap()).collect();
+    let b: Vec<Point> = (0..40).map(|i| Point::new(0.05, f64::from(i) * 0.1).unwrap()).collect();
+
+    let exact = hausdorff_directed(&a, &b).unwrap();
+    let bounded = hausdorff_directed_bounded(&a, &b, exact.distance().meters() + 1.0).unwrap();
+    assert_eq!(bounded, exact);
+
+    let a3: Vec<Point3D> = a.iter().map(|p| Point3D::new(p.lat, p.lon, 0.0).unwrap()).collect();
+    let b3: Vec<Point3D> = b.iter().map(|p| Point3D::new(p.lat, p.lon, 10.0).unwrap()).collect();
+    let exact_3d = hausdorff_directed_3d(&a3, &b3).unwrap();
+    let bounded_3d = hausdorff_directed_3d_bounded(&a3, &b3, exact_3d.distance().meters() + 1.0).unwrap();
+    assert_eq!(bounded_3d, exact_3d);
+  }
+
+  #[test]
+  fn bounded_directed_stops_at_first_origin_beyond_bound() {
+    let a = [
+      Point::new(0.0, 0.0).unwrap(),
+      Point::new(0.0, 1.0).unwrap(),
+      Point::new(0.0, 3.0).unwrap(),
+    ];
+    let b = [Point::new(0.0, 0.0).unwrap()];
+
+    let bounded = hausdorff_directed_bounded(&a, &b, 1_000.0).unwrap();
+    assert_eq!(bounded.origin_index(), 1);
+    assert!(bounded.distance().meters() > 1_000.0);
+    assert!(bounded.distance().meters() < hausdorff_directed(&a, &b).unwrap().distance().meters());
+
+    let box_all = BoundingBox::new(-1.0, 1.0, -1.0, 4.0).unwrap();
+    assert_eq!(
+      hausdorff_directed_clipped_bounded(&a, &b, box_all, 1_000.0).unwrap(),
+      bounded
+    );
+    assert!(matches!(
+      hausdorff_directed_bounded(&a, &b, -1.0),
+      Err(GeodistError::InvalidDistance(_))
+    ));
+  }
+
+  #[test]
+  fn symmetric_polyline_legs_match_directed_evaluations() {
+    let options = DensificationOptions {
+      max_segment_length_m: Some(50_000.0),
+      max_segment_angle_deg: None,
+      sample_cap: 10_000,
+    };
+
+    let a = vec![
+      vec![Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 2.0).unwrap()],
+      vec![Point::new(3.0, 0.0).unwrap(), Point::new(3.0, 1.0).unwrap()],
+    ];
+    let b = vec![vec![Point::new(0.5, 0.0).unwrap(), Point::new(0.5, 3.0).unwrap()]];
+
+    let symmetric = hausdorff_polyline(&a, &b, options).unwrap();
+    assert_eq!(
+      symmetric.a_to_b(),
+      hausdorff_directed_polyline(&a, &b, options).unwrap()
+    );
+    assert_eq!(
+      symmetric.b_to_a(),
+      hausdorff_directed_polyline(&b, &a, options).unwrap()
+    );
+  }
+
+  #[test]
+  fn streaming_polyline_matches_materialized_witness() {
+    let options = DensificationOptions {
+      max_segment_length_m: Some(5_000.0),
+      max_segment_angle_deg: None,
+      sample_cap: 10_000,
+    };
+
+    let a = vec![
+      vec![
+        Point::new(0.0, 0.0).unwrap(),
+        Point::new(0.3, 0.5).unwrap(),
+        Point::new(0.0, 1.0).unwrap(),
+      ],
+      vec![Point::new(0.5, 0.0).unwrap(), Point::new(0.5, 0.4).unwrap()],
+    ];
+    let b = vec![vec![Point::new(0.1, 0.0).unwrap(), Point::new(0.1, 1.0).unwrap()]];
+
+    let materialized = hausdorff_directed_polyline(&a, &b, options).unwrap();
+    let streamed = hausdorff_directed_polyline_streaming(&a, &b, options).unwrap();
+    assert_eq!(streamed, materialized);
+  }
+
+  #[test]
+  fn streaming_polyline_propagates_sample_cap() {
+    let options = DensificationOptions {
+      max_segment_length_m: Some(100.0),
+      max_segment_angle_deg: None,
+      sample_cap: 10,
+    };
+    let a = vec![vec![Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 1.0).unwrap()]];
+    let b = vec![vec![Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 0.0001).unwrap()]];
+
+    let result = hausdorff_directed_polyline_streaming(&a, &b, options);
+    assert!(matches!(result, Err(GeodistError::SampleCapExceeded { .. })));
+  }
+
   #[test]
   fn polyline_clipped_errors_when_no_samples_survive() {
     let options = DensificationOptions::default();
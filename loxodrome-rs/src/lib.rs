@@ -47,7 +47,7 @@ mod polygon;
 mod polyline;
 mod types;
 
-pub use algorithms::{GeodesicAlgorithm, Geographiclib, Spherical};
+pub use algorithms::{GeodesicAlgorithm, Geographiclib, PreparedPoint, Spherical};
 pub use chamfer::{
   ChamferDirectedResult, ChamferReduction, ChamferResult, chamfer_directed_polyline, chamfer_directed_polyline_clipped,
   chamfer_directed_polyline_clipped_with, chamfer_directed_polyline_with, chamfer_polyline, chamfer_polyline_clipped,
@@ -62,10 +62,18 @@ pub use distance::{
 pub use hausdorff::{
   HausdorffDirectedWitness, HausdorffWitness, PolylineDirectedWitness, PolylineHausdorffWitness, hausdorff,
   hausdorff_3d, hausdorff_3d_on_ellipsoid, hausdorff_clipped, hausdorff_clipped_3d, hausdorff_clipped_3d_on_ellipsoid,
-  hausdorff_directed, hausdorff_directed_3d, hausdorff_directed_3d_on_ellipsoid, hausdorff_directed_clipped,
-  hausdorff_directed_clipped_3d, hausdorff_directed_clipped_3d_on_ellipsoid, hausdorff_directed_polyline,
-  hausdorff_directed_polyline_clipped, hausdorff_directed_polyline_clipped_with, hausdorff_directed_polyline_with,
-  hausdorff_polyline, hausdorff_polyline_clipped, hausdorff_polyline_clipped_with, hausdorff_polyline_with,
+  hausdorff_directed, hausdorff_directed_3d, hausdorff_directed_3d_bounded, hausdorff_directed_3d_on_ellipsoid,
+  hausdorff_directed_bounded, hausdorff_directed_bounded_with, hausdorff_directed_clipped,
+  hausdorff_directed_clipped_3d, hausdorff_directed_clipped_3d_bounded, hausdorff_directed_clipped_3d_on_ellipsoid,
+  hausdorff_directed_clipped_bounded, hausdorff_directed_polyline, hausdorff_directed_polyline_clipped,
+  hausdorff_directed_polyline_clipped_with, hausdorff_directed_polyline_streaming,
+  hausdorff_directed_polyline_streaming_with, hausdorff_directed_polyline_with, hausdorff_polyline,
+  hausdorff_polyline_clipped, hausdorff_polyline_clipped_with, hausdorff_polyline_densified,
+  hausdorff_polyline_densified_with, hausdorff_polyline_with,
+};
+#[cfg(feature = "rayon")]
+pub use hausdorff::{
+  hausdorff_3d_parallel, hausdorff_clipped_3d_parallel, hausdorff_clipped_parallel, hausdorff_parallel,
 };
 pub use polygon::{
   BoundaryDirectedWitness, BoundaryHausdorffWitness, Polygon, hausdorff_boundary, hausdorff_boundary_directed,
@@ -173,8 +173,8 @@ pub fn densify_polyline(vertices: &[Point], options: DensificationOptions) -> Re
 /// reference the starting index of each part within the flattened samples.
 /// Returns [`GeodistError::SampleCapExceeded`] when the accumulated emission
 /// would cross the configured cap.
-pub fn densify_multiline(
-  parts: &[Vec<Point>],
+pub fn densify_multiline<P: AsRef<[Point]>>(
+  parts: &[P],
   options: DensificationOptions,
 ) -> Result<FlattenedPolyline, GeodistError> {
   densify_multiline_with_geometry(parts, options, &GreatCircleGeometry)
@@ -192,8 +192,8 @@ fn densify_polyline_with_geometry<G: SegmentGeometry>(
   densify_segments(&segments, &deduped, &options.sample_cap, None, geometry)
 }
 
-fn densify_multiline_with_geometry<G: SegmentGeometry>(
-  parts: &[Vec<Point>],
+fn densify_multiline_with_geometry<G: SegmentGeometry, P: AsRef<[Point]>>(
+  parts: &[P],
   options: DensificationOptions,
   geometry: &G,
 ) -> Result<FlattenedPolyline, GeodistError> {
@@ -210,7 +210,7 @@ fn densify_multiline_with_geometry<G: SegmentGeometry>(
   let mut total_samples = 0usize;
 
   for (part_index, part) in parts.iter().enumerate() {
-    let deduped = validate_polyline(part, Some(part_index))?;
+    let deduped = validate_polyline(part.as_ref(), Some(part_index))?;
 
     let segments = build_segments(&deduped, &options, geometry)?;
     // Pre-flight cap check before emitting.
@@ -236,6 +236,104 @@ fn densify_multiline_with_geometry<G: SegmentGeometry>(
   })
 }
 
+/// Densification plan for a MultiLineString that emits samples on demand.
+///
+/// Construction performs the same validation and sample-cap pre-flight as
+/// [`densify_multiline`] but retains only vertices and segment descriptors, so
+/// callers can consume samples one segment at a time instead of holding the
+/// flattened output in memory.
+#[derive(Debug, Clone)]
+pub struct MultilineSampler {
+  parts: Vec<PlannedPart>,
+}
+
+#[derive(Debug, Clone)]
+struct PlannedPart {
+  vertices: Vec<Point>,
+  segments: Vec<SegmentDescriptor<f64>>,
+}
+
+impl MultilineSampler {
+  /// Validate `parts` and plan their densification without emitting samples.
+  ///
+  /// Returns the same errors, in the same order, as [`densify_multiline`].
+  pub fn new<P: AsRef<[Point]>>(parts: &[P], options: DensificationOptions) -> Result<Self, GeodistError> {
+    options.validate()?;
+
+    if parts.is_empty() {
+      return Err(GeodistError::DegeneratePolyline { part_index: None });
+    }
+
+    let mut planned = Vec::with_capacity(parts.len());
+    let mut total_samples = 0usize;
+
+    for (part_index, part) in parts.iter().enumerate() {
+      let vertices = validate_polyline(part.as_ref(), Some(part_index))?;
+      let segments = build_segments(&vertices, &options, &GreatCircleGeometry)?;
+
+      let expected = 1 + segments.iter().map(|info| info.split_count).sum::<usize>();
+      let predicted_total = total_samples + expected;
+      if predicted_total > options.sample_cap {
+        return Err(GeodistError::SampleCapExceeded {
+          expected: predicted_total,
+          cap: options.sample_cap,
+          part_index: Some(part_index),
+        });
+      }
+
+      total_samples = predicted_total;
+      planned.push(PlannedPart { vertices, segments });
+    }
+
+    Ok(Self { parts: planned })
+  }
+
+  /// Visit every sample in emission order as `(part_index, sample_index,
+  /// point)`.
+  ///
+  /// Samples and per-part indices match [`densify_multiline`] exactly. Only the
+  /// current segment's interpolated points are buffered; the visitor may abort
+  /// the walk by returning an error.
+  pub fn for_each_sample<F>(&self, mut visit: F) -> Result<(), GeodistError>
+  where
+    F: FnMut(usize, usize, Point) -> Result<(), GeodistError>,
+  {
+    let mut buffer = Vec::new();
+
+    for (part_index, part) in self.parts.iter().enumerate() {
+      let Some(first_segment) = part.segments.first() else {
+        // All segments collapsed to duplicates; the retained vertex is the
+        // only sample, as in `densify_segments`.
+        if let Some(vertex) = part.vertices.first() {
+          visit(part_index, 0, *vertex)?;
+        }
+        continue;
+      };
+
+      visit(part_index, 0, part.vertices[first_segment.start_index])?;
+      let mut sample_index = 1;
+
+      for segment in &part.segments {
+        buffer.clear();
+        GreatCircleGeometry::interpolate_segment_into(
+          part.vertices[segment.start_index],
+          part.vertices[segment.end_index],
+          segment.geometry,
+          segment.split_count,
+          &mut buffer,
+        );
+
+        for &sample in &buffer {
+          visit(part_index, sample_index, sample)?;
+          sample_index += 1;
+        }
+      }
+    }
+
+    Ok(())
+  }
+}
+
 #[derive(Debug, Clone, Copy)]
 struct SegmentDescriptor<G> {
   start_index: usize,
@@ -324,13 +422,23 @@ impl GreatCircleGeometry {
 
   fn interpolate_segment(start: Point, end: Point, central_angle_rad: f64, split_count: usize) -> Vec<Point> {
     let mut points = Vec::with_capacity(split_count);
+    Self::interpolate_segment_into(start, end, central_angle_rad, split_count, &mut points);
+    points
+  }
 
+  fn interpolate_segment_into(
+    start: Point,
+    end: Point,
+    central_angle_rad: f64,
+    split_count: usize,
+    points: &mut Vec<Point>,
+  ) {
     // Prevent divide-by-zero in degenerate cases; zero-length segments are
     // filtered earlier so this represents extremely short arcs.
     let sin_delta = central_angle_rad.sin();
     if sin_delta == 0.0 {
       points.push(end);
-      return points;
+      return;
     }
 
     let (lat1, lon1) = (start.lat.to_radians(), start.lon.to_radians());
@@ -350,8 +458,6 @@ impl GreatCircleGeometry {
 
       points.push(Point::new_unchecked(lat.to_degrees(), lon.to_degrees()));
     }
-
-    points
   }
 }
 
@@ -672,10 +778,66 @@ mod tests {
     assert_eq!(with_duplicates, deduped);
   }
 
+  #[test]
+  fn sampler_matches_flattened_densification() {
+    let part_a = vec![
+      Point::new(0.0, 0.0).unwrap(),
+      Point::new(0.0, 0.01).unwrap(),
+      Point::new(0.01, 0.02).unwrap(),
+    ];
+    let part_b = vec![Point::new(1.0, 0.0).unwrap(), Point::new(1.0, 0.005).unwrap()];
+    let parts = vec![part_a, part_b];
+
+    let options = DensificationOptions {
+      max_segment_length_m: Some(250.0),
+      max_segment_angle_deg: None,
+      sample_cap: 50_000,
+    };
+
+    let flattened = densify_multiline(&parts, options).unwrap();
+    let sampler = MultilineSampler::new(&parts, options).unwrap();
+
+    let mut streamed = Vec::new();
+    sampler
+      .for_each_sample(|part, index, point| {
+        streamed.push(((part, index), point));
+        Ok(())
+      })
+      .unwrap();
+
+    assert_eq!(streamed.len(), flattened.len());
+    for (flat_index, (position, point)) in streamed.into_iter().enumerate() {
+      assert_eq!(flattened.part_and_index(flat_index).unwrap(), position);
+      assert_eq!(flattened.samples()[flat_index], point);
+    }
+  }
+
+  #[test]
+  fn sampler_preflights_sample_cap() {
+    let part_a = vec![Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 0.001_1).unwrap()];
+    let part_b = vec![Point::new(1.0, 0.0).unwrap(), Point::new(1.0, 0.001_1).unwrap()];
+
+    let options = DensificationOptions {
+      max_segment_length_m: Some(100.0),
+      max_segment_angle_deg: None,
+      sample_cap: 5,
+    };
+
+    let result = MultilineSampler::new(&[part_a, part_b], options);
+    assert!(matches!(
+      result,
+      Err(GeodistError::SampleCapExceeded {
+        expected: 6,
+        cap: 5,
+        part_index: Some(1),
+      })
+    ));
+  }
+
   #[test]
   fn rejects_empty_multiline() {
     let options = DensificationOptions::default();
-    let result = densify_multiline(&[], options);
+    let result = densify_multiline::<Vec<Point>>(&[], options);
     assert!(matches!(
       result,
       Err(GeodistError::DegeneratePolyline { part_index: None })
@@ -12,9 +12,11 @@ use geographiclib_rs::{
 };
 use pyo3::buffer::{PyBuffer, ReadOnlyCell};
 use pyo3::exceptions::PyValueError;
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
-use pyo3::types::PyModule;
+use pyo3::types::{PyBytes, PyDict, PyModule};
 use pyo3::{PyErr, create_exception, wrap_pyfunction};
+use rayon::prelude::*;
 
 use crate::constants::{EARTH_RADIUS_METERS, MAX_LAT_DEGREES, MAX_LON_DEGREES, MIN_LAT_DEGREES, MIN_LON_DEGREES};
 use crate::{
@@ -22,6 +24,9 @@ use crate::{
 };
 
 type RingTuple = Vec<(f64, f64)>;
+/// `(distance_m, source_part, source_index, target_part, target_index,
+/// source_coord, target_coord)` with coordinates as `(lat, lon)`.
+type PolylineDirectedTuple = (f64, usize, usize, usize, usize, (f64, f64), (f64, f64));
 
 create_exception!(_loxodrome_rs, GeodistError, PyValueError);
 create_exception!(_loxodrome_rs, InvalidLatitudeError, GeodistError);
@@ -151,6 +156,20 @@ impl From<hausdorff_kernel::PolylineDirectedWitness> for PolylineDirectedWitness
 
 #[pymethods]
 impl PolylineDirectedWitness {
+  /// Return a tuple `(distance_m, source_part, source_index, target_part,
+  /// target_index, source_coord, target_coord)` with `(lat, lon)` coordinates.
+  pub const fn to_tuple(&self) -> PolylineDirectedTuple {
+    (
+      self.distance_m,
+      self.source_part,
+      self.source_index,
+      self.target_part,
+      self.target_index,
+      self.source_coord.to_tuple(),
+      self.target_coord.to_tuple(),
+    )
+  }
+
   fn __repr__(&self) -> String {
     format!(
       "PolylineDirectedWitness(distance_m={}, source_part={}, source_index={}, target_part={}, \
@@ -191,6 +210,12 @@ impl From<hausdorff_kernel::PolylineHausdorffWitness> for PolylineHausdorffWitne
 
 #[pymethods]
 impl PolylineHausdorffWitness {
+  /// Return a tuple `(distance_m, a_to_b, b_to_a)` where the latter two are
+  /// directed witness tuples.
+  pub const fn to_tuple(&self) -> (f64, PolylineDirectedTuple, PolylineDirectedTuple) {
+    (self.distance_m, self.a_to_b.to_tuple(), self.b_to_a.to_tuple())
+  }
+
   fn __repr__(&self) -> String {
     let dist = self.distance_m;
     let format_leg = |leg: &PolylineDirectedWitness| {
@@ -445,9 +470,10 @@ impl Polygon {
 
 #[pymethods]
 impl Polyline {
+  /// Build a LineString from `(lat, lon)` tuples or a float64 `(N, 2)` buffer.
   #[new]
-  pub fn new(vertices: Vec<(f64, f64)>) -> PyResult<Self> {
-    let points = map_to_points_from_tuples(&vertices)?;
+  pub fn new(py: Python<'_>, vertices: &Bound<'_, PyAny>) -> PyResult<Self> {
+    let points = extract_vertices(py, vertices)?;
     let deduped = map_geodist_result(polyline::validate_polyline(&points, None))?;
     Ok(Self { vertices: deduped })
   }
@@ -483,6 +509,52 @@ impl Polyline {
     )
   }
 
+  /// Densify the LineString into packed native-endian float64 `(lat, lon)` pairs.
+  ///
+  /// The returned bytes back an `(N, 2)` array without allocating a Python
+  /// object per sample.
+  #[pyo3(signature = (max_segment_length_m = Some(100.0), max_segment_angle_deg = Some(0.1), sample_cap = 50_000))]
+  pub fn densify_coords<'py>(
+    &self,
+    py: Python<'py>,
+    max_segment_length_m: Option<f64>,
+    max_segment_angle_deg: Option<f64>,
+    sample_cap: usize,
+  ) -> PyResult<Bound<'py, PyBytes>> {
+    let options = polyline::DensificationOptions {
+      max_segment_length_m,
+      max_segment_angle_deg,
+      sample_cap,
+    };
+    let samples = map_geodist_result(polyline::densify_polyline(&self.vertices, options))?;
+
+    let mut packed = Vec::with_capacity(samples.len() * 2 * size_of::<f64>());
+    for sample in &samples {
+      packed.extend_from_slice(&sample.lat.to_ne_bytes());
+      packed.extend_from_slice(&sample.lon.to_ne_bytes());
+    }
+    Ok(PyBytes::new(py, &packed))
+  }
+
+  /// NumPy array interface exposing the vertices as a read-only `(N, 2)`
+  /// float64 view of `(lat, lon)` rows without copying.
+  ///
+  /// The pointer targets this object's vertex storage, which never changes
+  /// because the class is frozen; NumPy keeps the object alive as the view's
+  /// base.
+  #[getter(__array_interface__)]
+  fn array_interface<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+    const _: () = assert!(size_of::<types::Point>() == 2 * size_of::<f64>());
+    let typestr = if cfg!(target_endian = "little") { "<f8" } else { ">f8" };
+
+    let interface = PyDict::new(py);
+    interface.set_item("shape", (self.vertices.len(), 2))?;
+    interface.set_item("typestr", typestr)?;
+    interface.set_item("data", (self.vertices.as_ptr() as usize, true))?;
+    interface.set_item("version", 3)?;
+    Ok(interface)
+  }
+
   fn __repr__(&self) -> String {
     format!("LineString(num_vertices={})", self.vertices.len())
   }
@@ -492,6 +564,72 @@ impl Polyline {
   }
 }
 
+/// Polyline samples densified once so repeated Hausdorff queries can reuse
+/// them instead of re-sampling the same input on every call.
+#[pyclass(frozen)]
+#[derive(Debug, Clone)]
+pub struct DensifiedPolyline {
+  samples: polyline::FlattenedPolyline,
+}
+
+#[pymethods]
+impl DensifiedPolyline {
+  #[new]
+  #[pyo3(signature = (parts, options = None))]
+  pub fn new<'py>(parts: Vec<PyRef<'py, Polyline>>, options: Option<&PyDensificationOptions>) -> PyResult<Self> {
+    let densification_options = map_densification_options(options)?;
+    let samples =
+      polyline::densify_multiline(&map_to_multiline(&parts), densification_options).map_err(map_geodist_error)?;
+    Ok(Self { samples })
+  }
+
+  /// Offsets delimiting each part within the densified samples.
+  fn part_offsets(&self) -> Vec<usize> {
+    self.samples.part_offsets().to_vec()
+  }
+
+  fn __repr__(&self) -> String {
+    format!(
+      "DensifiedPolyline(num_parts={}, num_samples={})",
+      self.samples.part_count(),
+      self.samples.len()
+    )
+  }
+
+  const fn __len__(&self) -> PyResult<usize> {
+    Ok(self.samples.len())
+  }
+}
+
+/// Densified samples for a polyline Hausdorff argument.
+///
+/// A [`DensifiedPolyline`] lends its cached samples; a list of `LineString`
+/// parts is densified on the spot.
+enum PolylineSamples<'py> {
+  Cached(PyRef<'py, DensifiedPolyline>),
+  Fresh(polyline::FlattenedPolyline),
+}
+
+impl<'py> PolylineSamples<'py> {
+  fn extract(obj: &Bound<'py, PyAny>, options: polyline::DensificationOptions) -> PyResult<Self> {
+    if let Ok(cached) = obj.extract::<PyRef<'py, DensifiedPolyline>>() {
+      return Ok(Self::Cached(cached));
+    }
+
+    let parts = obj.extract::<Vec<PyRef<'py, Polyline>>>()?;
+    polyline::densify_multiline(&map_to_multiline(&parts), options)
+      .map(Self::Fresh)
+      .map_err(map_geodist_error)
+  }
+
+  fn samples(&self) -> &polyline::FlattenedPolyline {
+    match self {
+      Self::Cached(cached) => &cached.samples,
+      Self::Fresh(samples) => samples,
+    }
+  }
+}
+
 #[pymethods]
 impl PyDensificationOptions {
   #[new]
@@ -678,8 +816,9 @@ fn map_to_points3d(handles: &[Point3D]) -> PyResult<Vec<types::Point3D>> {
   handles.iter().map(map_to_point3d).collect::<Result<Vec<_>, _>>()
 }
 
-fn map_to_multiline(handles: &[Polyline]) -> Vec<Vec<types::Point>> {
-  handles.iter().map(|line| line.vertices.clone()).collect()
+/// Borrow each `LineString` handle's vertices without copying them.
+fn map_to_multiline<'a>(handles: &'a [PyRef<'_, Polyline>]) -> Vec<&'a [types::Point]> {
+  handles.iter().map(|line| line.vertices.as_slice()).collect()
 }
 
 fn map_to_bounding_box(handle: &BoundingBox) -> PyResult<types::BoundingBox> {
@@ -804,47 +943,115 @@ fn geodesic_distance_3d(p1: &Point3D, p2: &Point3D) -> PyResult<f64> {
     .map_err(map_geodist_error)
 }
 
+/// Below this many points across both sets a symmetric Hausdorff call
+/// evaluates its two directions serially; handing tiny inputs to the pool
+/// costs more than the second direction itself.
+const MIN_PARALLEL_HAUSDORFF_POINTS: usize = 1_024;
+
+/// Decide whether a symmetric Hausdorff call should run both directions on
+/// the rayon pool.
+///
+/// `threads` caps concurrency rather than sizing a pool: the two directions
+/// are the only units of work, so `threads=1` pins the call to the current
+/// thread (useful inside a caller-managed pool to avoid oversubscription) and
+/// any larger value merely allows both directions to run on the global pool.
+/// Values below 1 are rejected.
+fn run_directions_in_parallel(threads: Option<i64>, point_count: usize) -> PyResult<bool> {
+  match threads {
+    Some(count) if count < 1 => Err(PyValueError::new_err(format!(
+      "threads must be at least 1, got {count}"
+    ))),
+    Some(1) => Ok(false),
+    _ => Ok(point_count >= MIN_PARALLEL_HAUSDORFF_POINTS),
+  }
+}
+
+/// Run one of the kernel's parallel symmetric entry points with the GIL
+/// released.
+fn hausdorff_detached<F>(py: Python<'_>, kernel: F) -> PyResult<HausdorffWitness>
+where
+  F: Ungil + FnOnce() -> Result<hausdorff_kernel::HausdorffWitness, types::GeodistError>,
+{
+  py.detach(kernel).map(HausdorffWitness::from).map_err(map_geodist_error)
+}
+
 #[pyfunction]
-fn hausdorff_directed(a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffDirectedWitness> {
-  let points_a = map_to_points(&a)?;
-  let points_b = map_to_points(&b)?;
+#[pyo3(signature = (a, b, upper_bound_m = None))]
+fn hausdorff_directed(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  upper_bound_m: Option<f64>,
+) -> PyResult<HausdorffDirectedWitness> {
+  let points_a = extract_point_set(py, a)?;
+  let points_b = extract_point_set(py, b)?;
 
-  hausdorff_kernel::hausdorff_directed(&points_a, &points_b)
-    .map(HausdorffDirectedWitness::from)
-    .map_err(map_geodist_error)
+  match upper_bound_m {
+    Some(limit) => hausdorff_kernel::hausdorff_directed_bounded(&points_a, &points_b, limit),
+    None => hausdorff_kernel::hausdorff_directed(&points_a, &points_b),
+  }
+  .map(HausdorffDirectedWitness::from)
+  .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff(a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffWitness> {
-  let points_a = map_to_points(&a)?;
-  let points_b = map_to_points(&b)?;
+#[pyo3(signature = (a, b, threads = None))]
+fn hausdorff(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  threads: Option<i64>,
+) -> PyResult<HausdorffWitness> {
+  let points_a = extract_point_set(py, a)?;
+  let points_b = extract_point_set(py, b)?;
 
+  if run_directions_in_parallel(threads, points_a.len() + points_b.len())? {
+    return hausdorff_detached(py, || hausdorff_kernel::hausdorff_parallel(&points_a, &points_b));
+  }
   hausdorff_kernel::hausdorff(&points_a, &points_b)
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
+#[pyo3(signature = (a, b, bounding_box, upper_bound_m = None))]
 fn hausdorff_directed_clipped(
-  a: Vec<Point>,
-  b: Vec<Point>,
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
   bounding_box: &BoundingBox,
+  upper_bound_m: Option<f64>,
 ) -> PyResult<HausdorffDirectedWitness> {
-  let points_a = map_to_points(&a)?;
-  let points_b = map_to_points(&b)?;
+  let points_a = extract_point_set(py, a)?;
+  let points_b = extract_point_set(py, b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_directed_clipped(&points_a, &points_b, bbox)
-    .map(HausdorffDirectedWitness::from)
-    .map_err(map_geodist_error)
+  match upper_bound_m {
+    Some(limit) => hausdorff_kernel::hausdorff_directed_clipped_bounded(&points_a, &points_b, bbox, limit),
+    None => hausdorff_kernel::hausdorff_directed_clipped(&points_a, &points_b, bbox),
+  }
+  .map(HausdorffDirectedWitness::from)
+  .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_clipped(a: Vec<Point>, b: Vec<Point>, bounding_box: &BoundingBox) -> PyResult<HausdorffWitness> {
-  let points_a = map_to_points(&a)?;
-  let points_b = map_to_points(&b)?;
+#[pyo3(signature = (a, b, bounding_box, threads = None))]
+fn hausdorff_clipped(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  bounding_box: &BoundingBox,
+  threads: Option<i64>,
+) -> PyResult<HausdorffWitness> {
+  let points_a = extract_point_set(py, a)?;
+  let points_b = extract_point_set(py, b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
+  if run_directions_in_parallel(threads, points_a.len() + points_b.len())? {
+    return hausdorff_detached(py, || {
+      hausdorff_kernel::hausdorff_clipped_parallel(&points_a, &points_b, bbox)
+    });
+  }
   hausdorff_kernel::hausdorff_clipped(&points_a, &points_b, bbox)
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
@@ -852,9 +1059,9 @@ fn hausdorff_clipped(a: Vec<Point>, b: Vec<Point>, bounding_box: &BoundingBox) -
 
 #[pyfunction]
 #[pyo3(signature = (a, b, options = None))]
-fn hausdorff_directed_polyline(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn hausdorff_directed_polyline<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   options: Option<&PyDensificationOptions>,
 ) -> PyResult<PolylineDirectedWitness> {
   let parts_a = map_to_multiline(&a);
@@ -868,15 +1075,143 @@ fn hausdorff_directed_polyline(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, options = None))]
-fn hausdorff_polyline(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn hausdorff_directed_polyline_streaming<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   options: Option<&PyDensificationOptions>,
-) -> PyResult<PolylineHausdorffWitness> {
+) -> PyResult<PolylineDirectedWitness> {
   let parts_a = map_to_multiline(&a);
   let parts_b = map_to_multiline(&b);
   let densification_options = map_densification_options(options)?;
 
+  hausdorff_kernel::hausdorff_directed_polyline_streaming(&parts_a, &parts_b, densification_options)
+    .map(PolylineDirectedWitness::from)
+    .map_err(map_geodist_error)
+}
+
+/// Bytes per packed directed polyline witness: `distance_m`, four `u64`
+/// part/index fields, then source and target `(lat, lon)` as `f64`.
+const POLYLINE_WITNESS_RECORD_BYTES: usize = 9 * 8;
+
+/// Below this many input vertices across all pairs a batch runs on the
+/// calling thread; splitting tiny batches across the pool costs more than it
+/// saves.
+const MIN_PARALLEL_BATCH_VERTICES: usize = 4_096;
+
+/// Directed polyline Hausdorff for many `(a[i], b[i])` pairs in one call.
+///
+/// Witnesses come back as one packed buffer of fixed-width native-endian
+/// records so Python can view them as a NumPy structured array instead of
+/// materialising a witness object per pair. Pairs are spread across the rayon
+/// pool with the GIL released once the batch is large enough.
+#[pyfunction]
+#[pyo3(signature = (a, b, options = None))]
+fn hausdorff_directed_polyline_batch<'py>(
+  py: Python<'py>,
+  a: Vec<Vec<PyRef<'py, Polyline>>>,
+  b: Vec<Vec<PyRef<'py, Polyline>>>,
+  options: Option<&PyDensificationOptions>,
+) -> PyResult<Bound<'py, PyBytes>> {
+  if a.len() != b.len() {
+    return Err(PyValueError::new_err(format!(
+      "a and b must share length, got {} and {}",
+      a.len(),
+      b.len()
+    )));
+  }
+
+  let densification_options = map_densification_options(options)?;
+  let pairs: Vec<_> = a
+    .iter()
+    .zip(&b)
+    .map(|(parts_a, parts_b)| (map_to_multiline(parts_a), map_to_multiline(parts_b)))
+    .collect();
+
+  let vertex_count: usize = pairs
+    .iter()
+    .flat_map(|(parts_a, parts_b)| parts_a.iter().chain(parts_b))
+    .map(|part| part.len())
+    .sum();
+  let parallel = pairs.len() > 1 && vertex_count >= MIN_PARALLEL_BATCH_VERTICES;
+
+  let packed = py
+    .detach(|| -> Result<Vec<u8>, types::GeodistError> {
+      let directed = |(parts_a, parts_b): &(Vec<&[types::Point]>, Vec<&[types::Point]>)| {
+        hausdorff_kernel::hausdorff_directed_polyline(parts_a, parts_b, densification_options)
+      };
+      // Both paths yield witnesses in input order, so results do not depend on scheduling.
+      let witnesses = if parallel {
+        pairs.par_iter().map(directed).collect::<Result<Vec<_>, _>>()?
+      } else {
+        pairs.iter().map(directed).collect::<Result<Vec<_>, _>>()?
+      };
+
+      let mut packed = Vec::with_capacity(witnesses.len() * POLYLINE_WITNESS_RECORD_BYTES);
+      for witness in &witnesses {
+        pack_polyline_witness(&mut packed, witness);
+      }
+      Ok(packed)
+    })
+    .map_err(map_geodist_error)?;
+
+  Ok(PyBytes::new(py, &packed))
+}
+
+fn pack_polyline_witness(packed: &mut Vec<u8>, witness: &hausdorff_kernel::PolylineDirectedWitness) {
+  packed.extend_from_slice(&witness.distance().meters().to_ne_bytes());
+  for index in [
+    witness.source_part(),
+    witness.source_index(),
+    witness.target_part(),
+    witness.target_index(),
+  ] {
+    packed.extend_from_slice(&(index as u64).to_ne_bytes());
+  }
+  for coord in [witness.source_coord(), witness.target_coord()] {
+    packed.extend_from_slice(&coord.lat.to_ne_bytes());
+    packed.extend_from_slice(&coord.lon.to_ne_bytes());
+  }
+}
+
+/// Symmetric polyline Hausdorff between two multilines.
+///
+/// Either side may be a list of `LineString` parts or a [`DensifiedPolyline`];
+/// `options` only applies to sides that still need densifying.
+#[pyfunction]
+#[pyo3(signature = (a, b, options = None))]
+fn hausdorff_polyline(
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  options: Option<&PyDensificationOptions>,
+) -> PyResult<PolylineHausdorffWitness> {
+  let densification_options = map_densification_options(options)?;
+  let samples_a = PolylineSamples::extract(a, densification_options)?;
+  let samples_b = PolylineSamples::extract(b, densification_options)?;
+
+  hausdorff_kernel::hausdorff_polyline_densified(samples_a.samples(), samples_b.samples())
+    .map(PolylineHausdorffWitness::from)
+    .map_err(map_geodist_error)
+}
+
+/// Symmetric polyline Hausdorff over flat coordinates split into parts by offsets.
+///
+/// Each multiline arrives as one `(N, 2)` `(lat, lon)` buffer plus `P + 1`
+/// part offsets, so parts are sliced out of a single extraction instead of being
+/// pulled from per-part `LineString` handles.
+#[pyfunction]
+#[pyo3(signature = (coords_a, offsets_a, coords_b, offsets_b, options = None))]
+fn hausdorff_polyline_coords(
+  py: Python<'_>,
+  coords_a: &Bound<'_, PyAny>,
+  offsets_a: &Bound<'_, PyAny>,
+  coords_b: &Bound<'_, PyAny>,
+  offsets_b: &Bound<'_, PyAny>,
+  options: Option<&PyDensificationOptions>,
+) -> PyResult<PolylineHausdorffWitness> {
+  let parts_a = multiline_from_coords(py, coords_a, offsets_a, "offsets_a")?;
+  let parts_b = multiline_from_coords(py, coords_b, offsets_b, "offsets_b")?;
+  let densification_options = map_densification_options(options)?;
+
   hausdorff_kernel::hausdorff_polyline(&parts_a, &parts_b, densification_options)
     .map(PolylineHausdorffWitness::from)
     .map_err(map_geodist_error)
@@ -884,9 +1219,9 @@ fn hausdorff_polyline(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, reduction = "mean", options = None))]
-fn chamfer_directed_polyline(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn chamfer_directed_polyline<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   reduction: &str,
   options: Option<&PyDensificationOptions>,
 ) -> PyResult<ChamferDirectedResult> {
@@ -902,9 +1237,9 @@ fn chamfer_directed_polyline(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, reduction = "mean", options = None))]
-fn chamfer_polyline(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn chamfer_polyline<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   reduction: &str,
   options: Option<&PyDensificationOptions>,
 ) -> PyResult<ChamferResult> {
@@ -920,9 +1255,9 @@ fn chamfer_polyline(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, options = None))]
-fn hausdorff_directed_polyline_clipped(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn hausdorff_directed_polyline_clipped<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   bounding_box: &BoundingBox,
   options: Option<&PyDensificationOptions>,
 ) -> PyResult<PolylineDirectedWitness> {
@@ -938,9 +1273,9 @@ fn hausdorff_directed_polyline_clipped(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, options = None))]
-fn hausdorff_polyline_clipped(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn hausdorff_polyline_clipped<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   bounding_box: &BoundingBox,
   options: Option<&PyDensificationOptions>,
 ) -> PyResult<PolylineHausdorffWitness> {
@@ -956,9 +1291,9 @@ fn hausdorff_polyline_clipped(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, reduction = "mean", options = None))]
-fn chamfer_directed_polyline_clipped(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn chamfer_directed_polyline_clipped<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   bounding_box: &BoundingBox,
   reduction: &str,
   options: Option<&PyDensificationOptions>,
@@ -976,9 +1311,9 @@ fn chamfer_directed_polyline_clipped(
 
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, reduction = "mean", options = None))]
-fn chamfer_polyline_clipped(
-  a: Vec<Polyline>,
-  b: Vec<Polyline>,
+fn chamfer_polyline_clipped<'py>(
+  a: Vec<PyRef<'py, Polyline>>,
+  b: Vec<PyRef<'py, Polyline>>,
   bounding_box: &BoundingBox,
   reduction: &str,
   options: Option<&PyDensificationOptions>,
@@ -995,46 +1330,82 @@ fn chamfer_polyline_clipped(
 }
 
 #[pyfunction]
-fn hausdorff_directed_3d(a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffDirectedWitness> {
-  let points_a = map_to_points3d(&a)?;
-  let points_b = map_to_points3d(&b)?;
+#[pyo3(signature = (a, b, upper_bound_m = None))]
+fn hausdorff_directed_3d(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  upper_bound_m: Option<f64>,
+) -> PyResult<HausdorffDirectedWitness> {
+  let points_a = extract_point3d_set(py, a)?;
+  let points_b = extract_point3d_set(py, b)?;
 
-  hausdorff_kernel::hausdorff_directed_3d(&points_a, &points_b)
-    .map(HausdorffDirectedWitness::from)
-    .map_err(map_geodist_error)
+  match upper_bound_m {
+    Some(limit) => hausdorff_kernel::hausdorff_directed_3d_bounded(&points_a, &points_b, limit),
+    None => hausdorff_kernel::hausdorff_directed_3d(&points_a, &points_b),
+  }
+  .map(HausdorffDirectedWitness::from)
+  .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_3d(a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffWitness> {
-  let points_a = map_to_points3d(&a)?;
-  let points_b = map_to_points3d(&b)?;
+#[pyo3(signature = (a, b, threads = None))]
+fn hausdorff_3d(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  threads: Option<i64>,
+) -> PyResult<HausdorffWitness> {
+  let points_a = extract_point3d_set(py, a)?;
+  let points_b = extract_point3d_set(py, b)?;
 
+  if run_directions_in_parallel(threads, points_a.len() + points_b.len())? {
+    return hausdorff_detached(py, || hausdorff_kernel::hausdorff_3d_parallel(&points_a, &points_b));
+  }
   hausdorff_kernel::hausdorff_3d(&points_a, &points_b)
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
+#[pyo3(signature = (a, b, bounding_box, upper_bound_m = None))]
 fn hausdorff_directed_clipped_3d(
-  a: Vec<Point3D>,
-  b: Vec<Point3D>,
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
   bounding_box: &BoundingBox,
+  upper_bound_m: Option<f64>,
 ) -> PyResult<HausdorffDirectedWitness> {
-  let points_a = map_to_points3d(&a)?;
-  let points_b = map_to_points3d(&b)?;
+  let points_a = extract_point3d_set(py, a)?;
+  let points_b = extract_point3d_set(py, b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_directed_clipped_3d(&points_a, &points_b, bbox)
-    .map(HausdorffDirectedWitness::from)
-    .map_err(map_geodist_error)
+  match upper_bound_m {
+    Some(limit) => hausdorff_kernel::hausdorff_directed_clipped_3d_bounded(&points_a, &points_b, bbox, limit),
+    None => hausdorff_kernel::hausdorff_directed_clipped_3d(&points_a, &points_b, bbox),
+  }
+  .map(HausdorffDirectedWitness::from)
+  .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_clipped_3d(a: Vec<Point3D>, b: Vec<Point3D>, bounding_box: &BoundingBox) -> PyResult<HausdorffWitness> {
-  let points_a = map_to_points3d(&a)?;
-  let points_b = map_to_points3d(&b)?;
+#[pyo3(signature = (a, b, bounding_box, threads = None))]
+fn hausdorff_clipped_3d(
+  py: Python<'_>,
+  a: &Bound<'_, PyAny>,
+  b: &Bound<'_, PyAny>,
+  bounding_box: &BoundingBox,
+  threads: Option<i64>,
+) -> PyResult<HausdorffWitness> {
+  let points_a = extract_point3d_set(py, a)?;
+  let points_b = extract_point3d_set(py, b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
+  if run_directions_in_parallel(threads, points_a.len() + points_b.len())? {
+    return hausdorff_detached(py, || {
+      hausdorff_kernel::hausdorff_clipped_3d_parallel(&points_a, &points_b, bbox)
+    });
+  }
   hausdorff_kernel::hausdorff_clipped_3d(&points_a, &points_b, bbox)
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
@@ -1391,6 +1762,82 @@ fn geodesic_distance_to_many(
   Ok(distances)
 }
 
+/// Row-major spherical distance matrix reusing per-point latitude cosines.
+///
+/// Mirrors the haversine evaluation in `Spherical::geodesic_distance` term for
+/// term so entries match the scalar kernel exactly; only the cosines are
+/// hoisted out of the inner loop.
+fn spherical_distance_matrix(origins: &LatLonBuffers, destinations: &LatLonBuffers) -> Vec<f64> {
+  let destination_cos: Vec<f64> = destinations.lat.iter().map(|lat| lat.to_radians().cos()).collect();
+  let mut out = Vec::with_capacity(origins.lat.len() * destinations.lat.len());
+
+  for (&origin_lat, &origin_lon) in origins.lat.iter().zip(&origins.lon) {
+    let origin_cos = origin_lat.to_radians().cos();
+
+    for ((&lat, &lon), &lat_cos) in destinations.lat.iter().zip(&destinations.lon).zip(&destination_cos) {
+      let sin_lat = ((lat - origin_lat).to_radians() / 2.0).sin();
+      let sin_lon = ((lon - origin_lon).to_radians() / 2.0).sin();
+
+      let a = sin_lat * sin_lat + origin_cos * lat_cos * sin_lon * sin_lon;
+      let normalized_a = a.clamp(0.0, 1.0);
+      let c = 2.0 * normalized_a.sqrt().atan2((1.0 - normalized_a).sqrt());
+      out.push(EARTH_RADIUS_METERS * c);
+    }
+  }
+
+  out
+}
+
+/// Compute distances between every origin and every destination.
+///
+/// Returns a flat, row-major `len(origins) * len(destinations)` vector so the
+/// Python layer can reshape it into a matrix without per-row lists.
+#[pyfunction]
+fn geodesic_distance_matrix(
+  py: Python<'_>,
+  origins_lat: &Bound<'_, PyAny>,
+  origins_lon: &Bound<'_, PyAny>,
+  destinations_lat: &Bound<'_, PyAny>,
+  destinations_lon: &Bound<'_, PyAny>,
+  ellipsoid: Option<&Ellipsoid>,
+) -> PyResult<Vec<f64>> {
+  let origins = load_lat_lon_buffers(py, origins_lat, origins_lon, "origins")?;
+  let destinations = load_lat_lon_buffers(py, destinations_lat, destinations_lon, "destinations")?;
+
+  let rows = origins.lat.len();
+  let cols = destinations.lat.len();
+  let count = rows.checked_mul(cols).ok_or_else(|| {
+    PyValueError::new_err(format!(
+      "distance matrix of {rows} x {cols} entries exceeds addressable size"
+    ))
+  })?;
+
+  if count == 0 {
+    return Ok(Vec::new());
+  }
+
+  let ellipsoid_axes = ellipsoid_axes(ellipsoid)?;
+  let distances = py.detach(|| match ellipsoid_axes {
+    Some((semi_major, semi_minor)) => {
+      let flattening = 1.0 - (semi_minor / semi_major);
+      let geodesic = GeographicGeodesic::new(semi_major, flattening);
+      let mut out = Vec::with_capacity(count);
+
+      for (&origin_lat, &origin_lon) in origins.lat.iter().zip(&origins.lon) {
+        for (&lat, &lon) in destinations.lat.iter().zip(&destinations.lon) {
+          let meters = geodesic.inverse(origin_lat, origin_lon, lat, lon);
+          out.push(meters);
+        }
+      }
+
+      out
+    }
+    None => spherical_distance_matrix(&origins, &destinations),
+  });
+
+  Ok(distances)
+}
+
 /// Extract a monotonic offset vector from Python buffers or sequences.
 ///
 /// Supports `usize`/`i64` contiguous buffers to avoid copies, falling back
@@ -1439,6 +1886,33 @@ fn extract_offsets(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResu
   obj.extract::<Vec<usize>>()
 }
 
+/// Split a flat coordinate buffer into polyline parts using `P + 1` offsets.
+///
+/// Vertices are left unvalidated here; the polyline kernels validate each part
+/// and report failures with its part index.
+fn multiline_from_coords(
+  py: Python<'_>,
+  coords: &Bound<'_, PyAny>,
+  offsets: &Bound<'_, PyAny>,
+  name: &str,
+) -> PyResult<Vec<Vec<types::Point>>> {
+  let coords = extract_ring_coords(py, coords)?;
+  let offsets = extract_offsets(py, offsets, name)?;
+  validate_offsets(&offsets, name, coords.len())?;
+
+  Ok(
+    offsets
+      .windows(2)
+      .map(|window| {
+        coords[window[0]..window[1]]
+          .iter()
+          .map(|&(lat, lon)| types::Point { lat, lon })
+          .collect()
+      })
+      .collect(),
+  )
+}
+
 /// Validate that offsets are non-empty, start at zero, monotonic, and end
 /// at the expected sentinel value. Returns `InvalidGeometryError` on
 /// malformed inputs to mirror Python-facing error types.
@@ -1555,6 +2029,86 @@ fn extract_ring_coords(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Vec<(
   obj.extract::<Vec<(f64, f64)>>()
 }
 
+/// Read a Hausdorff point set from a float64 `(N, 2)` buffer or a list of handles.
+///
+/// Buffers are validated row by row straight into kernel points, so NumPy
+/// callers skip building a `Point` handle per row. Anything that does not
+/// expose a float64 buffer is extracted as a list of `Point` handles.
+fn extract_point_set(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Vec<types::Point>> {
+  let Ok(buffer) = PyBuffer::<f64>::get(obj) else {
+    return map_to_points(&obj.extract::<Vec<Point>>()?);
+  };
+
+  map_to_points_from_buffer(py, &buffer)
+}
+
+/// Read LineString vertices from a float64 `(N, 2)` buffer or a list of `(lat, lon)` tuples.
+fn extract_vertices(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Vec<types::Point>> {
+  let Ok(buffer) = PyBuffer::<f64>::get(obj) else {
+    return map_to_points_from_tuples(&obj.extract::<Vec<(f64, f64)>>()?);
+  };
+
+  map_to_points_from_buffer(py, &buffer)
+}
+
+/// Validate the `(lat, lon)` rows of a float64 `(N, 2)` buffer into kernel points.
+///
+/// Wider buffers are rejected rather than truncated to their first two
+/// columns. Row errors are `InvalidGeometryError`s naming the offending row.
+fn map_to_points_from_buffer(py: Python<'_>, buffer: &PyBuffer<f64>) -> PyResult<Vec<types::Point>> {
+  if !buffer.is_c_contiguous() {
+    return Err(PyValueError::new_err("coords must be contiguous"));
+  }
+  if buffer.dimensions() != 2 || buffer.shape().get(1) != Some(&2) {
+    return Err(PyValueError::new_err("coords must have shape (N, 2)"));
+  }
+
+  let slice = buffer
+    .as_slice(py)
+    .ok_or_else(|| PyValueError::new_err("coords must be a readable, contiguous buffer"))?;
+
+  slice
+    .chunks_exact(2)
+    .enumerate()
+    .map(|(index, row)| {
+      let (lat, lon) = (row[0].get(), row[1].get());
+      validate_lat_lon(lat, lon, index)?;
+      map_geodist_result(types::Point::new(lat, lon))
+    })
+    .collect()
+}
+
+/// Read a 3D Hausdorff point set from a float64 `(N, 3)` buffer or a list of handles.
+///
+/// Buffer rows hold `(lat, lon, altitude_m)`; validation mirrors
+/// [`extract_point_set`] with altitude checks delegated to the kernel type.
+fn extract_point3d_set(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Vec<types::Point3D>> {
+  let Ok(buffer) = PyBuffer::<f64>::get(obj) else {
+    return map_to_points3d(&obj.extract::<Vec<Point3D>>()?);
+  };
+
+  if !buffer.is_c_contiguous() {
+    return Err(PyValueError::new_err("coords must be contiguous"));
+  }
+  if buffer.dimensions() != 2 || buffer.shape().get(1) != Some(&3) {
+    return Err(PyValueError::new_err("3D coords must have shape (N, 3)"));
+  }
+
+  let slice = buffer
+    .as_slice(py)
+    .ok_or_else(|| PyValueError::new_err("coords must be a readable, contiguous buffer"))?;
+
+  slice
+    .chunks_exact(3)
+    .enumerate()
+    .map(|(index, row)| {
+      let (lat, lon, altitude_m) = (row[0].get(), row[1].get(), row[2].get());
+      validate_lat_lon(lat, lon, index)?;
+      map_geodist_result(types::Point3D::new(lat, lon, altitude_m))
+    })
+    .collect()
+}
+
 /// Compute area of a ring slice using a GeographicLib accumulator.
 ///
 /// Arguments define a half-open interval within `coords` that represent a
@@ -1667,6 +2221,8 @@ fn polygon_area_batch(
 #[pymodule]
 fn _loxodrome_rs(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
   m.add("EARTH_RADIUS_METERS", EARTH_RADIUS_METERS)?;
+  // Frozen, so one shared handle can back every default-ellipsoid call.
+  m.add("WGS84_ELLIPSOID", Ellipsoid::wgs84())?;
   m.add("GeodistError", py.get_type::<GeodistError>())?;
   m.add("InvalidLatitudeError", py.get_type::<InvalidLatitudeError>())?;
   m.add("InvalidLongitudeError", py.get_type::<InvalidLongitudeError>())?;
@@ -1684,6 +2240,7 @@ fn _loxodrome_rs(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
   m.add_class::<Polygon>()?;
   m.add_class::<Polyline>()?;
   m.add_class::<PyDensificationOptions>()?;
+  m.add_class::<DensifiedPolyline>()?;
   m.add_class::<GeodesicSolution>()?;
   m.add_class::<BoundingBox>()?;
   m.add_class::<HausdorffDirectedWitness>()?;
@@ -1702,7 +2259,10 @@ fn _loxodrome_rs(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
   m.add_function(wrap_pyfunction!(hausdorff_directed_clipped, m)?)?;
   m.add_function(wrap_pyfunction!(hausdorff_clipped, m)?)?;
   m.add_function(wrap_pyfunction!(hausdorff_directed_polyline, m)?)?;
+  m.add_function(wrap_pyfunction!(hausdorff_directed_polyline_streaming, m)?)?;
+  m.add_function(wrap_pyfunction!(hausdorff_directed_polyline_batch, m)?)?;
   m.add_function(wrap_pyfunction!(hausdorff_polyline, m)?)?;
+  m.add_function(wrap_pyfunction!(hausdorff_polyline_coords, m)?)?;
   m.add_function(wrap_pyfunction!(chamfer_directed_polyline, m)?)?;
   m.add_function(wrap_pyfunction!(chamfer_polyline, m)?)?;
   m.add_function(wrap_pyfunction!(hausdorff_directed_3d, m)?)?;
@@ -1717,6 +2277,7 @@ fn _loxodrome_rs(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
   m.add_function(wrap_pyfunction!(geodesic_distance_batch, m)?)?;
   m.add_function(wrap_pyfunction!(geodesic_with_bearings_batch, m)?)?;
   m.add_function(wrap_pyfunction!(geodesic_distance_to_many, m)?)?;
+  m.add_function(wrap_pyfunction!(geodesic_distance_matrix, m)?)?;
   m.add_function(wrap_pyfunction!(polygon_area_batch, m)?)?;
   Ok(())
 }
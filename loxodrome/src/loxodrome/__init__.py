@@ -1,49 +1,95 @@
 """Minimal Python surface for the loxodrome Rust kernels.
 
-Exports the constant, error types, and Rust-backed geometry wrappers. Keep this
-module's public API aligned with the compiled extension. Optional Shapely
-interop helpers live in `loxodrome.ext.shapely`.
+Exports the constant, error types, and Rust-backed geometry wrappers, resolved
+lazily on first access. Keep this module's public API aligned with the compiled
+extension. Optional Shapely interop helpers live in `loxodrome.ext.shapely`.
 """
 
 from __future__ import annotations
 
-from typing import Final
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from . import _loxodrome_rs
-from .errors import (
-    EmptyPointSetError,
-    GeodistError,
-    InvalidAltitudeError,
-    InvalidBoundingBoxError,
-    InvalidDistanceError,
-    InvalidEllipsoidError,
-    InvalidGeometryError,
-    InvalidLatitudeError,
-    InvalidLongitudeError,
-    InvalidRadiusError,
-)
-from .geometry import BoundingBox, Ellipsoid, LineString, Point, Point3D, Polygon
-from .ops import (
-    GeodesicResult,
-    HausdorffDirectedWitness,
-    HausdorffWitness,
-    geodesic_distance,
-    geodesic_distance_3d,
-    geodesic_distance_on_ellipsoid,
-    geodesic_with_bearings,
-    geodesic_with_bearings_on_ellipsoid,
-    hausdorff,
-    hausdorff_3d,
-    hausdorff_clipped,
-    hausdorff_clipped_3d,
-    hausdorff_directed,
-    hausdorff_directed_3d,
-    hausdorff_directed_clipped,
-    hausdorff_directed_clipped_3d,
-    hausdorff_polygon_boundary,
-)
+if TYPE_CHECKING:
+    from ._loxodrome_rs import EARTH_RADIUS_METERS
+    from .errors import (
+        EmptyPointSetError,
+        GeodistError,
+        InvalidAltitudeError,
+        InvalidBoundingBoxError,
+        InvalidDistanceError,
+        InvalidEllipsoidError,
+        InvalidGeometryError,
+        InvalidLatitudeError,
+        InvalidLongitudeError,
+        InvalidRadiusError,
+    )
+    from .geometry import BoundingBox, DensifiedPolyline, Ellipsoid, LineString, Point, Point3D, Polygon
+    from .ops import (
+        GeodesicResult,
+        HausdorffDirectedWitness,
+        HausdorffWitness,
+        PolylineDirectedWitness,
+        PolylineHausdorffWitness,
+        geodesic_distance,
+        geodesic_distance_3d,
+        geodesic_distance_on_ellipsoid,
+        geodesic_with_bearings,
+        geodesic_with_bearings_on_ellipsoid,
+        hausdorff,
+        hausdorff_3d,
+        hausdorff_clipped,
+        hausdorff_clipped_3d,
+        hausdorff_directed,
+        hausdorff_directed_3d,
+        hausdorff_directed_clipped,
+        hausdorff_directed_clipped_3d,
+        hausdorff_polygon_boundary,
+        hausdorff_polyline,
+    )
 
-EARTH_RADIUS_METERS: Final[float] = float(_loxodrome_rs.EARTH_RADIUS_METERS)
+# Public names resolve on first access so `import loxodrome` stays cheap; the
+# extension and wrapper modules load only when something from them is used.
+_LAZY: dict[str, str] = {
+    "EARTH_RADIUS_METERS": "_loxodrome_rs",
+    "GeodistError": "errors",
+    "InvalidGeometryError": "errors",
+    "InvalidLatitudeError": "errors",
+    "InvalidLongitudeError": "errors",
+    "InvalidAltitudeError": "errors",
+    "InvalidDistanceError": "errors",
+    "InvalidRadiusError": "errors",
+    "InvalidEllipsoidError": "errors",
+    "InvalidBoundingBoxError": "errors",
+    "EmptyPointSetError": "errors",
+    "BoundingBox": "geometry",
+    "DensifiedPolyline": "geometry",
+    "Ellipsoid": "geometry",
+    "LineString": "geometry",
+    "Point": "geometry",
+    "Point3D": "geometry",
+    "Polygon": "geometry",
+    "GeodesicResult": "ops",
+    "HausdorffDirectedWitness": "ops",
+    "HausdorffWitness": "ops",
+    "PolylineDirectedWitness": "ops",
+    "PolylineHausdorffWitness": "ops",
+    "geodesic_distance": "ops",
+    "geodesic_distance_on_ellipsoid": "ops",
+    "geodesic_distance_3d": "ops",
+    "geodesic_with_bearings": "ops",
+    "geodesic_with_bearings_on_ellipsoid": "ops",
+    "hausdorff": "ops",
+    "hausdorff_3d": "ops",
+    "hausdorff_clipped": "ops",
+    "hausdorff_clipped_3d": "ops",
+    "hausdorff_directed": "ops",
+    "hausdorff_directed_3d": "ops",
+    "hausdorff_directed_clipped": "ops",
+    "hausdorff_directed_clipped_3d": "ops",
+    "hausdorff_polygon_boundary": "ops",
+    "hausdorff_polyline": "ops",
+}
 
 __all__ = (
     "EARTH_RADIUS_METERS",
@@ -58,6 +104,7 @@ __all__ = (
     "InvalidBoundingBoxError",
     "EmptyPointSetError",
     "BoundingBox",
+    "DensifiedPolyline",
     "Ellipsoid",
     "LineString",
     "Point",
@@ -66,6 +113,8 @@ __all__ = (
     "GeodesicResult",
     "HausdorffDirectedWitness",
     "HausdorffWitness",
+    "PolylineDirectedWitness",
+    "PolylineHausdorffWitness",
     "geodesic_distance",
     "geodesic_distance_on_ellipsoid",
     "geodesic_distance_3d",
@@ -80,4 +129,22 @@ __all__ = (
     "hausdorff_directed_clipped",
     "hausdorff_directed_clipped_3d",
     "hausdorff_polygon_boundary",
+    "hausdorff_polyline",
 )
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule backing `name` on first access and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List eagerly bound names alongside the lazily exported API."""
+    return sorted([*globals(), *_LAZY])
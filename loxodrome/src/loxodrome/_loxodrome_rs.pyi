@@ -4,9 +4,10 @@ Exports stay intentionally small while Rust-backed geometry wrappers are built.
 Keep this stub in sync with `loxodrome-rs/src/python.rs`.
 """
 
-from typing import Final, Literal
+from typing import Any, Final, Literal
 
 EARTH_RADIUS_METERS: Final[float]
+WGS84_ELLIPSOID: Final[Ellipsoid]
 
 class GeodistError(ValueError): ...
 class InvalidLatitudeError(GeodistError): ...
@@ -48,7 +49,7 @@ class Polygon:
     def to_tuple(self) -> tuple[list[tuple[float, float]], list[list[tuple[float, float]]]]: ...
 
 class LineString:
-    def __init__(self, vertices: list[tuple[float, float]]): ...
+    def __init__(self, vertices: list[tuple[float, float]] | object): ...
     def to_tuple(self) -> list[tuple[float, float]]: ...
     def densify(
         self,
@@ -56,6 +57,19 @@ class LineString:
         max_segment_angle_deg: float | None = ...,
         sample_cap: int = ...,
     ) -> list[Point]: ...
+    def densify_coords(
+        self,
+        max_segment_length_m: float | None = ...,
+        max_segment_angle_deg: float | None = ...,
+        sample_cap: int = ...,
+    ) -> bytes: ...
+    @property
+    def __array_interface__(self) -> dict[str, Any]: ...
+    def __len__(self) -> int: ...
+
+class DensifiedPolyline:
+    def __init__(self, parts: list[LineString], options: DensificationOptions | None = ...) -> None: ...
+    def part_offsets(self) -> list[int]: ...
     def __len__(self) -> int: ...
 
 class DensificationOptions:
@@ -107,11 +121,23 @@ class PolylineDirectedWitness:
     source_coord: Point
     target_coord: Point
 
+    def to_tuple(
+        self,
+    ) -> tuple[float, int, int, int, int, tuple[float, float], tuple[float, float]]: ...
+
 class PolylineHausdorffWitness:
     distance_m: float
     a_to_b: PolylineDirectedWitness
     b_to_a: PolylineDirectedWitness
 
+    def to_tuple(
+        self,
+    ) -> tuple[
+        float,
+        tuple[float, int, int, int, int, tuple[float, float], tuple[float, float]],
+        tuple[float, int, int, int, int, tuple[float, float], tuple[float, float]],
+    ]: ...
+
 class ChamferDirectedResult:
     distance_m: float
     witness: PolylineDirectedWitness | None
@@ -141,21 +167,48 @@ def geodesic_distance_on_ellipsoid(p1: Point, p2: Point, ellipsoid: Ellipsoid) -
 def geodesic_with_bearings(p1: Point, p2: Point) -> GeodesicSolution: ...
 def geodesic_with_bearings_on_ellipsoid(p1: Point, p2: Point, ellipsoid: Ellipsoid) -> GeodesicSolution: ...
 def geodesic_distance_3d(p1: Point3D, p2: Point3D) -> float: ...
-def hausdorff_directed(a: list[Point], b: list[Point]) -> HausdorffDirectedWitness: ...
-def hausdorff(a: list[Point], b: list[Point]) -> HausdorffWitness: ...
+def hausdorff_directed(
+    a: list[Point] | object, b: list[Point] | object, upper_bound_m: float | None = ...
+) -> HausdorffDirectedWitness: ...
+def hausdorff(a: list[Point] | object, b: list[Point] | object, threads: int | None = ...) -> HausdorffWitness: ...
 def hausdorff_directed_clipped(
-    a: list[Point], b: list[Point], bounding_box: BoundingBox
+    a: list[Point] | object,
+    b: list[Point] | object,
+    bounding_box: BoundingBox,
+    upper_bound_m: float | None = ...,
 ) -> HausdorffDirectedWitness: ...
-def hausdorff_clipped(a: list[Point], b: list[Point], bounding_box: BoundingBox) -> HausdorffWitness: ...
+def hausdorff_clipped(
+    a: list[Point] | object,
+    b: list[Point] | object,
+    bounding_box: BoundingBox,
+    threads: int | None = ...,
+) -> HausdorffWitness: ...
 def hausdorff_directed_polyline(
     a: list[LineString],
     b: list[LineString],
     options: DensificationOptions | None = ...,
 ) -> PolylineDirectedWitness: ...
-def hausdorff_polyline(
+def hausdorff_directed_polyline_streaming(
     a: list[LineString],
     b: list[LineString],
     options: DensificationOptions | None = ...,
+) -> PolylineDirectedWitness: ...
+def hausdorff_directed_polyline_batch(
+    a: list[list[LineString]],
+    b: list[list[LineString]],
+    options: DensificationOptions | None = ...,
+) -> bytes: ...
+def hausdorff_polyline(
+    a: list[LineString] | DensifiedPolyline,
+    b: list[LineString] | DensifiedPolyline,
+    options: DensificationOptions | None = ...,
+) -> PolylineHausdorffWitness: ...
+def hausdorff_polyline_coords(
+    coords_a: object,
+    offsets_a: object,
+    coords_b: object,
+    offsets_b: object,
+    options: DensificationOptions | None = ...,
 ) -> PolylineHausdorffWitness: ...
 def chamfer_directed_polyline(
     a: list[LineString],
@@ -169,12 +222,24 @@ def chamfer_polyline(
     reduction: Literal["mean", "sum", "max"] = ...,
     options: DensificationOptions | None = ...,
 ) -> ChamferResult: ...
-def hausdorff_directed_3d(a: list[Point3D], b: list[Point3D]) -> HausdorffDirectedWitness: ...
-def hausdorff_3d(a: list[Point3D], b: list[Point3D]) -> HausdorffWitness: ...
+def hausdorff_directed_3d(
+    a: list[Point3D] | object, b: list[Point3D] | object, upper_bound_m: float | None = ...
+) -> HausdorffDirectedWitness: ...
+def hausdorff_3d(
+    a: list[Point3D] | object, b: list[Point3D] | object, threads: int | None = ...
+) -> HausdorffWitness: ...
 def hausdorff_directed_clipped_3d(
-    a: list[Point3D], b: list[Point3D], bounding_box: BoundingBox
+    a: list[Point3D] | object,
+    b: list[Point3D] | object,
+    bounding_box: BoundingBox,
+    upper_bound_m: float | None = ...,
 ) -> HausdorffDirectedWitness: ...
-def hausdorff_clipped_3d(a: list[Point3D], b: list[Point3D], bounding_box: BoundingBox) -> HausdorffWitness: ...
+def hausdorff_clipped_3d(
+    a: list[Point3D] | object,
+    b: list[Point3D] | object,
+    bounding_box: BoundingBox,
+    threads: int | None = ...,
+) -> HausdorffWitness: ...
 def hausdorff_directed_polyline_clipped(
     a: list[LineString],
     b: list[LineString],
@@ -229,6 +294,13 @@ def geodesic_distance_to_many(
     destinations_lon: object,
     ellipsoid: Ellipsoid | None = ...,
 ) -> list[float]: ...
+def geodesic_distance_matrix(
+    origins_lat: object,
+    origins_lon: object,
+    destinations_lat: object,
+    destinations_lon: object,
+    ellipsoid: Ellipsoid | None = ...,
+) -> list[float]: ...
 def polygon_area_batch(
     coords: object,
     ring_offsets: object,
@@ -238,6 +310,7 @@ def polygon_area_batch(
 
 __all__ = [
     "EARTH_RADIUS_METERS",
+    "WGS84_ELLIPSOID",
     "GeodistError",
     "InvalidLatitudeError",
     "InvalidLongitudeError",
@@ -254,6 +327,7 @@ __all__ = [
     "Polygon",
     "LineString",
     "DensificationOptions",
+    "DensifiedPolyline",
     "GeodesicSolution",
     "HausdorffDirectedWitness",
     "HausdorffWitness",
@@ -272,7 +346,10 @@ __all__ = [
     "hausdorff_directed_clipped",
     "hausdorff_clipped",
     "hausdorff_directed_polyline",
+    "hausdorff_directed_polyline_streaming",
+    "hausdorff_directed_polyline_batch",
     "hausdorff_polyline",
+    "hausdorff_polyline_coords",
     "chamfer_directed_polyline",
     "chamfer_polyline",
     "hausdorff_directed_3d",
@@ -287,6 +364,7 @@ __all__ = [
     "geodesic_distance_batch",
     "geodesic_with_bearings_batch",
     "geodesic_distance_to_many",
+    "geodesic_distance_matrix",
     "polygon_area_batch",
 ]
 
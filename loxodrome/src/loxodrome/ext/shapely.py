@@ -5,7 +5,8 @@ Imports are guarded so Shapely remains an opt-in dependency.
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from functools import singledispatch
+from typing import Any
 
 from ..errors import InvalidGeometryError
 from ..geometry import BoundingBox, LineString, Point, Point3D
@@ -23,23 +24,6 @@ except ModuleNotFoundError as exc:
 __all__ = ("from_shapely", "to_shapely")
 
 
-@runtime_checkable
-class _PointLike(Protocol):
-    x: float
-    y: float
-    has_z: bool
-
-    @property
-    def z(self) -> float: ...
-
-
-@runtime_checkable
-class _PolygonLike(Protocol):
-    bounds: tuple[float, float, float, float]
-
-    def equals(self, other: Any) -> bool: ...
-
-
 def to_shapely(geometry: Point | Point3D | BoundingBox | LineString) -> Any:
     """Convert a loxodrome geometry into the matching Shapely shape."""
     if isinstance(geometry, Point):
@@ -61,30 +45,41 @@ def to_shapely(geometry: Point | Point3D | BoundingBox | LineString) -> Any:
     )
 
 
-def from_shapely(geometry: _PointLike | _PolygonLike) -> Point | Point3D | BoundingBox | LineString:
-    """Convert a Shapely geometry into a loxodrome geometry."""
-    if isinstance(geometry, ShapelyPoint):
-        latitude: float = float(geometry.y)
-        longitude: float = float(geometry.x)
-        if getattr(geometry, "has_z", False):
-            altitude_m: float = float(geometry.z)
-            return Point3D(latitude, longitude, altitude_m)
-        return Point(latitude, longitude)
-
-    if isinstance(geometry, ShapelyLineString):
-        if getattr(geometry, "has_z", False):
-            raise InvalidGeometryError("3D LineStrings are not supported; drop Z or flatten before converting.")
-        coords = [(float(lat), float(lon)) for lon, lat in geometry.coords]
-        return LineString(coords)
-
-    if isinstance(geometry, ShapelyPolygon):
-        min_lon, min_lat, max_lon, max_lat = geometry.bounds
-        rectangle = shapely_box(min_lon, min_lat, max_lon, max_lat)
-        if not geometry.equals(rectangle):
-            raise InvalidGeometryError("Only axis-aligned rectangular polygons can be converted to BoundingBox.")
-        return BoundingBox(float(min_lat), float(max_lat), float(min_lon), float(max_lon))
+@singledispatch
+def from_shapely(geometry: Any) -> Point | Point3D | BoundingBox | LineString:
+    """Convert a Shapely geometry into a loxodrome geometry.
 
+    Dispatches on the concrete Shapely type (Point, LineString, Polygon), so
+    batch conversions pay a single type lookup per geometry.
+    """
     raise TypeError(
         "from_shapely expects shapely.geometry.Point (2D/3D) or a rectangular shapely.geometry.Polygon, "
         f"got {type(geometry).__name__}",
     )
+
+
+@from_shapely.register
+def _from_shapely_point(geometry: ShapelyPoint) -> Point | Point3D:
+    latitude: float = float(geometry.y)
+    longitude: float = float(geometry.x)
+    if geometry.has_z:
+        altitude_m: float = float(geometry.z)
+        return Point3D(latitude, longitude, altitude_m)
+    return Point(latitude, longitude)
+
+
+@from_shapely.register
+def _from_shapely_linestring(geometry: ShapelyLineString) -> LineString:
+    if geometry.has_z:
+        raise InvalidGeometryError("3D LineStrings are not supported; drop Z or flatten before converting.")
+    coords = [(float(lat), float(lon)) for lon, lat in geometry.coords]
+    return LineString(coords)
+
+
+@from_shapely.register
+def _from_shapely_polygon(geometry: ShapelyPolygon) -> BoundingBox:
+    min_lon, min_lat, max_lon, max_lat = geometry.bounds
+    rectangle = shapely_box(min_lon, min_lat, max_lon, max_lat)
+    if not geometry.equals(rectangle):
+        raise InvalidGeometryError("Only axis-aligned rectangular polygons can be converted to BoundingBox.")
+    return BoundingBox(float(min_lat), float(max_lat), float(min_lon), float(max_lon))
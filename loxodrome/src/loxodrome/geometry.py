@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
 from collections.abc import Iterator
+from itertools import chain
 from math import isfinite
-from typing import Sequence
+from typing import TYPE_CHECKING, Any, Sequence, cast
 
 from . import _loxodrome_rs
 from .errors import InvalidGeometryError
@@ -13,6 +16,10 @@ from .types import BoundingBox as BoundingBoxTuple
 from .types import Point as PointTuple
 from .types import Point3D as Point3DTuple
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 __all__ = (
     "Ellipsoid",
     "Point",
@@ -20,6 +27,7 @@ __all__ = (
     "BoundingBox",
     "Polygon",
     "LineString",
+    "DensifiedPolyline",
 )
 
 
@@ -48,18 +56,18 @@ class Ellipsoid:
 
     @classmethod
     def wgs84(cls) -> "Ellipsoid":
-        """Return the WGS84 reference ellipsoid."""
-        return cls._from_handle(_loxodrome_rs.Ellipsoid.wgs84())
+        """Return the WGS84 reference ellipsoid backed by the extension's shared handle."""
+        return cls._from_handle(_loxodrome_rs.WGS84_ELLIPSOID)
 
     @property
     def semi_major_axis_m(self) -> float:
         """Semi-major axis in meters."""
-        return float(self._handle.semi_major_axis_m)
+        return self._handle.semi_major_axis_m
 
     @property
     def semi_minor_axis_m(self) -> float:
         """Semi-minor axis in meters."""
-        return float(self._handle.semi_minor_axis_m)
+        return self._handle.semi_minor_axis_m
 
     def to_tuple(self) -> tuple[float, float]:
         """Return a tuple representation `(semi_major_axis_m, semi_minor_axis_m)`."""
@@ -94,12 +102,12 @@ class Point:
     @property
     def lat(self) -> Latitude:
         """Return the latitude in degrees."""
-        return float(self._handle.lat)
+        return self._handle.lat
 
     @property
     def lon(self) -> Longitude:
         """Return the longitude in degrees."""
-        return float(self._handle.lon)
+        return self._handle.lon
 
     def to_tuple(self) -> PointTuple:
         """Return a tuple representation for interoperability."""
@@ -119,6 +127,10 @@ class Point:
             return NotImplemented
         return self.to_tuple() == other.to_tuple()
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Reject subclasses so handle extraction can rely on exact type checks."""
+        raise TypeError("Point cannot be subclassed")
+
     @classmethod
     def _from_handle(cls, handle: _loxodrome_rs.Point) -> "Point":
         instance = cls.__new__(cls)
@@ -146,17 +158,17 @@ class Point3D:
     @property
     def lat(self) -> Latitude:
         """Return the latitude in degrees."""
-        return float(self._handle.lat)
+        return self._handle.lat
 
     @property
     def lon(self) -> Longitude:
         """Return the longitude in degrees."""
-        return float(self._handle.lon)
+        return self._handle.lon
 
     @property
     def altitude_m(self) -> AltitudeM:
         """Return the altitude in meters."""
-        return float(self._handle.altitude_m)
+        return self._handle.altitude_m
 
     def to_tuple(self) -> Point3DTuple:
         """Return a tuple representation for interoperability."""
@@ -176,6 +188,10 @@ class Point3D:
             return NotImplemented
         return self.to_tuple() == other.to_tuple()
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Reject subclasses so handle extraction can rely on exact type checks."""
+        raise TypeError("Point3D cannot be subclassed")
+
 
 _LATITUDE_MIN_DEGREES = -90.0
 _LATITUDE_MAX_DEGREES = 90.0
@@ -259,6 +275,98 @@ def _coerce_point_like(value: Point | PointTuple) -> PointTuple:
     raise InvalidGeometryError(f"expected Point or (lat, lon) tuple, got {type(value).__name__}")
 
 
+def _coerce_vertices(vertices: Sequence[Point | PointTuple]) -> list[PointTuple]:
+    """Coerce vertices to `(lat, lon)` tuples, specializing on all-Point sequences.
+
+    Points were validated at construction, so a sequence made only of Points is
+    unpacked without per-vertex checks; anything else, including a mixed
+    sequence, goes through `_coerce_point_like`.
+    """
+    if all(type(vertex) is Point for vertex in vertices):
+        return [vertex._handle.to_tuple() for vertex in cast("Sequence[Point]", vertices)]
+
+    return [_coerce_point_like(vertex) for vertex in vertices]
+
+
+# Exact scalar types eligible for packing; bools and numeric subclasses fail the
+# identity check and take the validating path.
+_PACKABLE_SCALAR_TYPES = (float, int)
+
+
+def _looks_like_coord(value: object) -> bool:
+    return (
+        type(value) is tuple
+        and len(value) == 2
+        and type(value[0]) in _PACKABLE_SCALAR_TYPES
+        and type(value[1]) in _PACKABLE_SCALAR_TYPES
+    )
+
+
+def _is_coord_array(points: object, *, width: int) -> bool:
+    # NumPy stays optional: an ndarray can only reach us if numpy is already imported.
+    numpy = sys.modules.get("numpy")
+    return (
+        numpy is not None
+        and isinstance(points, numpy.ndarray)
+        and points.dtype == numpy.float64
+        and points.ndim == 2
+        and points.shape[1] == width
+    )
+
+
+# GeoArrow's interleaved point encoding names its child field after the axis
+# order, and that order is x/y (lon/lat) rather than the (lat, lon) used here.
+_GEOARROW_INTERLEAVED_FIELDS = {"xy", "xyz"}
+
+# Struct-module format codes that all describe a native-endian C double.
+_NATIVE_DOUBLE_FORMATS = {"d", "@d", "=d", "<d" if sys.byteorder == "little" else ">d"}
+
+
+def _coord_buffer(points: object, *, width: int) -> object | None:
+    """Return `points` as an `(N, width)` float64 buffer the kernel reads directly, or None.
+
+    Accepts float64 NumPy arrays, 2-D native-endian double memoryviews
+    (strided views are copied to a contiguous one), and pyarrow
+    `fixed_size_list<double>[width]` arrays or chunked arrays. GeoArrow
+    interleaved columns (child field `xy`/`xyz`) are reordered from
+    `(lon, lat)` to `(lat, lon)`; other layouts must already be `(lat, lon)`.
+    """
+    if _is_coord_array(points, width=width):
+        contiguous: object = sys.modules["numpy"].ascontiguousarray(points)
+        return contiguous
+    if isinstance(points, memoryview):
+        shape = points.shape
+        if points.format not in _NATIVE_DOUBLE_FORMATS or shape is None or len(shape) != 2 or shape[1] != width:
+            return None
+        if points.format == "d" and points.c_contiguous:
+            return points
+        copied: object = memoryview(points.tobytes()).cast("d", shape)
+        return copied
+
+    # Like NumPy, pyarrow is never imported here; an Arrow array implies it is loaded.
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is None or not isinstance(points, (pyarrow.Array, pyarrow.ChunkedArray)):
+        return None
+    arrow_type = points.type
+    if not (
+        pyarrow.types.is_fixed_size_list(arrow_type)
+        and arrow_type.list_size == width
+        and pyarrow.types.is_float64(arrow_type.value_type)
+    ):
+        return None
+    if points.null_count:
+        raise InvalidGeometryError("coordinate arrays must not contain null points")
+
+    column = points.combine_chunks() if isinstance(points, pyarrow.ChunkedArray) else points
+    values = column.flatten()
+    if values.null_count:
+        raise InvalidGeometryError("coordinate arrays must not contain null coordinate values")
+    coords = values.to_numpy().reshape(-1, width)
+    interleaved = arrow_type.value_field.name in _GEOARROW_INTERLEAVED_FIELDS
+    ordered: object = coords[:, [1, 0, *range(2, width)]] if interleaved else coords
+    return ordered
+
+
 class BoundingBox:
     """Immutable geographic bounding box expressed in degrees."""
 
@@ -290,22 +398,22 @@ class BoundingBox:
     @property
     def min_lat(self) -> Latitude:
         """Return the minimum latitude in degrees."""
-        return float(self._handle.min_lat)
+        return self._handle.min_lat
 
     @property
     def max_lat(self) -> Latitude:
         """Return the maximum latitude in degrees."""
-        return float(self._handle.max_lat)
+        return self._handle.max_lat
 
     @property
     def min_lon(self) -> Longitude:
         """Return the minimum longitude in degrees."""
-        return float(self._handle.min_lon)
+        return self._handle.min_lon
 
     @property
     def max_lon(self) -> Longitude:
         """Return the maximum longitude in degrees."""
-        return float(self._handle.max_lon)
+        return self._handle.max_lon
 
     def to_tuple(self) -> BoundingBoxTuple:
         """Return the bounding box as a tuple of degrees."""
@@ -344,8 +452,8 @@ class Polygon:
         holes: Sequence[Sequence[Point | PointTuple]] | None = None,
     ) -> None:
         """Initialize a polygon boundary with CCW exterior and optional CW holes."""
-        exterior_ring = [_coerce_point_like(vertex) for vertex in exterior]
-        hole_rings = [[_coerce_point_like(vertex) for vertex in ring] for ring in holes or []]
+        exterior_ring = _coerce_vertices(exterior)
+        hole_rings = [_coerce_vertices(ring) for ring in holes or []]
         self._handle = _loxodrome_rs.Polygon(exterior_ring, hole_rings)
 
     def __repr__(self) -> str:
@@ -363,10 +471,26 @@ class LineString:
 
     __slots__ = ("_handle",)
 
-    def __init__(self, vertices: Sequence[Point | PointTuple]) -> None:
-        """Initialize a LineString from vertices."""
-        coords = [_coerce_point_like(vertex) for vertex in vertices]
-        self._handle = _loxodrome_rs.LineString(coords)
+    def __init__(self, vertices: Sequence[Point | PointTuple] | npt.NDArray[np.float64] | memoryview[Any]) -> None:
+        """Initialize a LineString from vertices.
+
+        Float64 `(N, 2)` coordinate buffers (see `_coord_buffer`) and sequences
+        of plain `(float, float)` tuples are handed to the Rust kernel as one
+        packed buffer and validated there; other inputs are coerced vertex by
+        vertex.
+        """
+        buffer = _coord_buffer(vertices, width=2)
+        if buffer is not None:
+            self._handle = _loxodrome_rs.LineString(buffer)
+            return
+
+        if not isinstance(vertices, (list, tuple)):
+            vertices = list(vertices)
+        if vertices and all(map(_looks_like_coord, vertices)):
+            packed = array("d", chain.from_iterable(vertices))
+            self._handle = _loxodrome_rs.LineString(memoryview(packed).cast("B").cast("d", (len(vertices), 2)))
+        else:
+            self._handle = _loxodrome_rs.LineString(_coerce_vertices(vertices))
 
     def to_tuple(self) -> list[PointTuple]:
         """Return vertices as `(lat, lon)` tuples."""
@@ -382,6 +506,33 @@ class LineString:
         samples = self._handle.densify(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
         return [Point._from_handle(sample) for sample in samples]
 
+    def densify_coords(
+        self,
+        max_segment_length_m: float | None = 100.0,
+        max_segment_angle_deg: float | None = 0.1,
+        sample_cap: int = 50_000,
+    ) -> npt.NDArray[np.float64]:
+        """Return densified samples as a read-only `(N, 2)` float64 array of `(lat, lon)` rows.
+
+        Requires NumPy; the samples cross the FFI boundary as one packed buffer
+        instead of a Python object per point.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as exc:
+            raise ImportError(
+                "NumPy is required for densify_coords; install the optional extra with "
+                "`pip install loxodrome[vectorized]` or use densify() instead."
+            ) from exc
+
+        packed = self._handle.densify_coords(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
+        return np.frombuffer(packed, dtype=np.float64).reshape(-1, 2)
+
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """Expose vertices to NumPy as a zero-copy, read-only `(N, 2)` float64 `(lat, lon)` view."""
+        return self._handle.__array_interface__
+
     def __iter__(self) -> Iterator[Point]:
         """Iterate over vertices as Point instances."""
         for lat, lon in self.to_tuple():
@@ -394,3 +545,41 @@ class LineString:
     def __repr__(self) -> str:
         """Return a concise representation for debugging."""
         return f"LineString(num_vertices={len(self)})"
+
+
+class DensifiedPolyline:
+    """Polyline samples densified once for reuse across many Hausdorff queries.
+
+    Comparing one reference against many queries otherwise re-densifies the
+    reference on every call; build it once with :meth:`from_parts` instead.
+    """
+
+    __slots__ = ("_handle",)
+    _handle: _loxodrome_rs.DensifiedPolyline
+
+    @classmethod
+    def from_parts(
+        cls,
+        parts: LineString | Sequence[LineString],
+        max_segment_length_m: float | None = 100.0,
+        max_segment_angle_deg: float | None = 0.1,
+        sample_cap: int = 50_000,
+    ) -> "DensifiedPolyline":
+        """Densify a LineString or the parts of a multiline with the given spacing knobs."""
+        handles = [parts._handle] if isinstance(parts, LineString) else [part._handle for part in parts]
+        options = _loxodrome_rs.DensificationOptions(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
+        instance = cls.__new__(cls)
+        instance._handle = _loxodrome_rs.DensifiedPolyline(handles, options)
+        return instance
+
+    def part_offsets(self) -> list[int]:
+        """Return the `P + 1` offsets delimiting each part within the samples."""
+        return self._handle.part_offsets()
+
+    def __len__(self) -> int:
+        """Return the number of densified samples."""
+        return len(self._handle)
+
+    def __repr__(self) -> str:
+        """Return a concise representation for debugging."""
+        return f"DensifiedPolyline(num_parts={len(self.part_offsets()) - 1}, num_samples={len(self)})"
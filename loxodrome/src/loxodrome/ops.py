@@ -3,16 +3,36 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple, NoReturn, TypeAlias
+
+from typing_extensions import Buffer
 
 from . import _loxodrome_rs
-from .geometry import BoundingBox, Ellipsoid, Point, Point3D, Polygon
+from .geometry import BoundingBox, DensifiedPolyline, Ellipsoid, LineString, Point, Point3D, Polygon, _coord_buffer
 from .types import Meters
+from .types import Point as PointTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    _CoordBuffer: TypeAlias = npt.NDArray[np.float64] | memoryview[Any]
+else:
+    # NumPy is optional and memoryview is not subscriptable before 3.12, so runtime
+    # introspection sees the buffer protocol both types implement.
+    _CoordBuffer: TypeAlias = Buffer
+
+# Point sets may also arrive as `(N, 2)` / `(N, 3)` float64 coordinate buffers
+# (see `_coord_buffer`); pyarrow columns are accepted at runtime as well.
+PointSet: TypeAlias = Iterable[Point] | _CoordBuffer
+PointSet3D: TypeAlias = Iterable[Point3D] | _CoordBuffer
 
 __all__ = (
     "GeodesicResult",
     "HausdorffDirectedWitness",
     "HausdorffWitness",
+    "PolylineDirectedWitness",
+    "PolylineHausdorffWitness",
     "geodesic_distance",
     "geodesic_distance_on_ellipsoid",
     "geodesic_distance_3d",
@@ -27,11 +47,13 @@ __all__ = (
     "hausdorff_clipped_3d",
     "hausdorff_clipped",
     "hausdorff_polygon_boundary",
+    "hausdorff_polyline",
 )
 
+_WGS84 = Ellipsoid.wgs84()
+
 
-@dataclass(frozen=True, slots=True)
-class GeodesicResult:
+class GeodesicResult(NamedTuple):
     """Result of a geodesic computation including distance and bearings."""
 
     distance_m: Meters
@@ -39,8 +61,7 @@ class GeodesicResult:
     final_bearing_deg: float
 
 
-@dataclass(frozen=True, slots=True)
-class HausdorffDirectedWitness:
+class HausdorffDirectedWitness(NamedTuple):
     """Directed Hausdorff witness containing the realizing pair indices."""
 
     distance_m: Meters
@@ -48,15 +69,42 @@ class HausdorffDirectedWitness:
     candidate_index: int
 
 
-@dataclass(frozen=True, slots=True)
-class HausdorffWitness:
-    """Symmetric Hausdorff witness with per-direction details."""
+class HausdorffWitness(NamedTuple):
+    """Symmetric Hausdorff witness with per-direction details.
+
+    Witnesses are named tuples, so they unpack positionally and compare equal
+    to the kernel's `to_tuple()` layout.
+    """
 
     distance_m: Meters
     a_to_b: HausdorffDirectedWitness
     b_to_a: HausdorffDirectedWitness
 
 
+class PolylineDirectedWitness(NamedTuple):
+    """Directed polyline Hausdorff witness locating the realizing samples.
+
+    Parts and indices refer to the densified samples; coordinates are
+    `(lat, lon)` tuples.
+    """
+
+    distance_m: Meters
+    source_part: int
+    source_index: int
+    target_part: int
+    target_index: int
+    source_coord: PointTuple
+    target_coord: PointTuple
+
+
+class PolylineHausdorffWitness(NamedTuple):
+    """Symmetric polyline Hausdorff witness with per-direction details."""
+
+    distance_m: Meters
+    a_to_b: PolylineDirectedWitness
+    b_to_a: PolylineDirectedWitness
+
+
 def geodesic_distance(origin: Point, destination: Point) -> Meters:
     """Compute the great-circle distance between two points in meters.
 
@@ -64,7 +112,7 @@ def geodesic_distance(origin: Point, destination: Point) -> Meters:
     ellipsoid. Prefer :func:`geodesic_distance_on_ellipsoid` for accuracy-
     sensitive work or compliance with geodesy references.
     """
-    return float(_loxodrome_rs.geodesic_distance(origin._handle, destination._handle))
+    return _loxodrome_rs.geodesic_distance(origin._handle, destination._handle)
 
 
 def geodesic_distance_on_ellipsoid(
@@ -73,19 +121,17 @@ def geodesic_distance_on_ellipsoid(
     ellipsoid: Ellipsoid | None = None,
 ) -> Meters:
     """Compute the ellipsoidal geodesic distance between two points in meters."""
-    model = ellipsoid or Ellipsoid.wgs84()
-    return float(
-        _loxodrome_rs.geodesic_distance_on_ellipsoid(
-            origin._handle,
-            destination._handle,
-            ellipsoid=model._handle,
-        )
+    model = ellipsoid or _WGS84
+    return _loxodrome_rs.geodesic_distance_on_ellipsoid(
+        origin._handle,
+        destination._handle,
+        ellipsoid=model._handle,
     )
 
 
 def geodesic_distance_3d(origin: Point3D, destination: Point3D) -> Meters:
     """Compute straight-line (ECEF chord) distance between two 3D points in meters."""
-    return float(_loxodrome_rs.geodesic_distance_3d(origin._handle, destination._handle))
+    return _loxodrome_rs.geodesic_distance_3d(origin._handle, destination._handle)
 
 
 def geodesic_with_bearings(origin: Point, destination: Point) -> GeodesicResult:
@@ -98,9 +144,9 @@ def geodesic_with_bearings(origin: Point, destination: Point) -> GeodesicResult:
     solution = _loxodrome_rs.geodesic_with_bearings(origin._handle, destination._handle)
 
     return GeodesicResult(
-        distance_m=float(solution.distance_m),
-        initial_bearing_deg=float(solution.initial_bearing_deg),
-        final_bearing_deg=float(solution.final_bearing_deg),
+        distance_m=solution.distance_m,
+        initial_bearing_deg=solution.initial_bearing_deg,
+        final_bearing_deg=solution.final_bearing_deg,
     )
 
 
@@ -110,7 +156,7 @@ def geodesic_with_bearings_on_ellipsoid(
     ellipsoid: Ellipsoid | None = None,
 ) -> GeodesicResult:
     """Compute ellipsoidal distance and bearings between two points."""
-    model = ellipsoid or Ellipsoid.wgs84()
+    model = ellipsoid or _WGS84
     solution = _loxodrome_rs.geodesic_with_bearings_on_ellipsoid(
         origin._handle,
         destination._handle,
@@ -118,166 +164,179 @@ def geodesic_with_bearings_on_ellipsoid(
     )
 
     return GeodesicResult(
-        distance_m=float(solution.distance_m),
-        initial_bearing_deg=float(solution.initial_bearing_deg),
-        final_bearing_deg=float(solution.final_bearing_deg),
+        distance_m=solution.distance_m,
+        initial_bearing_deg=solution.initial_bearing_deg,
+        final_bearing_deg=solution.final_bearing_deg,
     )
 
 
-def hausdorff_directed(a: Iterable[Point], b: Iterable[Point]) -> HausdorffDirectedWitness:
-    """Directed Hausdorff distance and witness from set `a` to set `b`."""
+def hausdorff_directed(
+    a: PointSet,
+    b: PointSet,
+    *,
+    upper_bound_m: float | None = None,
+) -> HausdorffDirectedWitness:
+    """Directed Hausdorff distance and witness from set `a` to set `b`.
+
+    Either set may also be a float64 NumPy array of shape `(N, 2)` holding
+    `(lat, lon)` rows in degrees, which skips per-point wrapper construction.
+    2-D float64 memoryviews and pyarrow `fixed_size_list<double>[2]` columns
+    are read the same way. GeoArrow interleaved columns (child field `xy`) are
+    taken as `(lon, lat)` and reordered; for GeoPandas coordinates use
+    `series.get_coordinates().to_numpy()[:, ::-1]`.
+
+    When `upper_bound_m` is given the kernel stops at the first origin whose
+    nearest neighbor lies farther than the bound. The returned witness then
+    exceeds `upper_bound_m` but may understate the true directed distance, so
+    use it for threshold checks (`witness.distance_m > upper_bound_m`).
+    """
     witness = _loxodrome_rs.hausdorff_directed(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        a=_to_handles(a, argument_name="a"),
+        b=_to_handles(b, argument_name="b"),
+        upper_bound_m=upper_bound_m,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_tuple(witness.to_tuple())
+
 
+def hausdorff(a: PointSet, b: PointSet, *, threads: int | None = None) -> HausdorffWitness:
+    """Symmetric Hausdorff distance and witnesses between two point sets.
 
-def hausdorff(a: Iterable[Point], b: Iterable[Point]) -> HausdorffWitness:
-    """Symmetric Hausdorff distance and witnesses between two point sets."""
+    Accepts the same `(N, 2)` float64 arrays as :func:`hausdorff_directed`.
+
+    Large inputs evaluate both directions concurrently with the GIL released.
+    `threads` caps that concurrency rather than sizing a pool: `threads=1`
+    keeps the call on the current thread, e.g. when already running inside a
+    worker pool, while any larger value only allows the two directions to run
+    in parallel. Values below 1 raise ValueError.
+    """
     witness = _loxodrome_rs.hausdorff(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        a=_to_handles(a, argument_name="a"),
+        b=_to_handles(b, argument_name="b"),
+        threads=threads,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _witness_from_tuple(witness.to_tuple())
 
 
 def hausdorff_directed_clipped(
-    a: Iterable[Point],
-    b: Iterable[Point],
+    a: PointSet,
+    b: PointSet,
     bounding_box: BoundingBox,
+    *,
+    upper_bound_m: float | None = None,
 ) -> HausdorffDirectedWitness:
-    """Directed Hausdorff witness after clipping both sets to a bounding box."""
+    """Directed Hausdorff witness after clipping both sets to a bounding box.
+
+    `upper_bound_m` enables the same early exit as :func:`hausdorff_directed`.
+    """
     witness = _loxodrome_rs.hausdorff_directed_clipped(
-        [it._handle for it in a],
-        [it._handle for it in b],
+        _to_handles(a, argument_name="a"),
+        _to_handles(b, argument_name="b"),
         bounding_box._handle,
+        upper_bound_m=upper_bound_m,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_tuple(witness.to_tuple())
 
 
-def hausdorff_clipped(a: Iterable[Point], b: Iterable[Point], bounding_box: BoundingBox) -> HausdorffWitness:
-    """Symmetric Hausdorff witness after clipping both sets to a bounding box."""
+def hausdorff_clipped(
+    a: PointSet,
+    b: PointSet,
+    bounding_box: BoundingBox,
+    *,
+    threads: int | None = None,
+) -> HausdorffWitness:
+    """Symmetric Hausdorff witness after clipping both sets to a bounding box.
+
+    `threads` behaves as in :func:`hausdorff`.
+    """
     witness = _loxodrome_rs.hausdorff_clipped(
-        [it._handle for it in a],
-        [it._handle for it in b],
+        _to_handles(a, argument_name="a"),
+        _to_handles(b, argument_name="b"),
         bounding_box._handle,
+        threads=threads,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _witness_from_tuple(witness.to_tuple())
 
 
-def hausdorff_directed_3d(a: Iterable[Point3D], b: Iterable[Point3D]) -> HausdorffDirectedWitness:
-    """Directed 3D Hausdorff witness using the ECEF chord metric."""
+def hausdorff_directed_3d(
+    a: PointSet3D,
+    b: PointSet3D,
+    *,
+    upper_bound_m: float | None = None,
+) -> HausdorffDirectedWitness:
+    """Directed 3D Hausdorff witness using the ECEF chord metric.
+
+    Either set may also be a float64 NumPy array of shape `(N, 3)` holding
+    `(lat, lon, altitude_m)` rows, which skips per-point wrapper construction.
+    `upper_bound_m` enables the same early exit as :func:`hausdorff_directed`.
+    """
     witness = _loxodrome_rs.hausdorff_directed_3d(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        a=_to_handles_3d(a, argument_name="a"),
+        b=_to_handles_3d(b, argument_name="b"),
+        upper_bound_m=upper_bound_m,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_tuple(witness.to_tuple())
+
 
+def hausdorff_3d(a: PointSet3D, b: PointSet3D, *, threads: int | None = None) -> HausdorffWitness:
+    """Symmetric 3D Hausdorff witness using the ECEF chord metric.
 
-def hausdorff_3d(a: Iterable[Point3D], b: Iterable[Point3D]) -> HausdorffWitness:
-    """Symmetric 3D Hausdorff witness using the ECEF chord metric."""
+    Accepts the same `(N, 3)` float64 arrays as :func:`hausdorff_directed_3d`;
+    `threads` behaves as in :func:`hausdorff`.
+    """
     witness = _loxodrome_rs.hausdorff_3d(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        a=_to_handles_3d(a, argument_name="a"),
+        b=_to_handles_3d(b, argument_name="b"),
+        threads=threads,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _witness_from_tuple(witness.to_tuple())
 
 
 def hausdorff_directed_clipped_3d(
-    a: Iterable[Point3D],
-    b: Iterable[Point3D],
+    a: PointSet3D,
+    b: PointSet3D,
     bounding_box: BoundingBox,
+    *,
+    upper_bound_m: float | None = None,
 ) -> HausdorffDirectedWitness:
-    """Directed 3D Hausdorff witness after clipping points by latitude/longitude."""
+    """Directed 3D Hausdorff witness after clipping points by latitude/longitude.
+
+    `upper_bound_m` enables the same early exit as :func:`hausdorff_directed`.
+    """
     witness = _loxodrome_rs.hausdorff_directed_clipped_3d(
-        [it._handle for it in a],
-        [it._handle for it in b],
+        _to_handles_3d(a, argument_name="a"),
+        _to_handles_3d(b, argument_name="b"),
         bounding_box._handle,
+        upper_bound_m=upper_bound_m,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_tuple(witness.to_tuple())
 
 
-def hausdorff_clipped_3d(a: Iterable[Point3D], b: Iterable[Point3D], bounding_box: BoundingBox) -> HausdorffWitness:
-    """Symmetric 3D Hausdorff witness after clipping points by latitude/longitude."""
+def hausdorff_clipped_3d(
+    a: PointSet3D,
+    b: PointSet3D,
+    bounding_box: BoundingBox,
+    *,
+    threads: int | None = None,
+) -> HausdorffWitness:
+    """Symmetric 3D Hausdorff witness after clipping points by latitude/longitude.
+
+    `threads` behaves as in :func:`hausdorff`.
+    """
     witness = _loxodrome_rs.hausdorff_clipped_3d(
-        [it._handle for it in a],
-        [it._handle for it in b],
+        _to_handles_3d(a, argument_name="a"),
+        _to_handles_3d(b, argument_name="b"),
         bounding_box._handle,
+        threads=threads,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _witness_from_tuple(witness.to_tuple())
 
 
 def hausdorff_polygon_boundary(
@@ -294,12 +353,101 @@ def hausdorff_polygon_boundary(
     polygon_a = Polygon(exterior_a, holes_a)
     polygon_b = Polygon(exterior_b, holes_b)
 
-    return float(
-        _loxodrome_rs.hausdorff_polygon_boundary(
-            polygon_a._handle,
-            polygon_b._handle,
-            max_segment_length_m,
-            max_segment_angle_deg,
-            int(sample_cap),
-        )
+    return _loxodrome_rs.hausdorff_polygon_boundary(
+        polygon_a._handle,
+        polygon_b._handle,
+        max_segment_length_m,
+        max_segment_angle_deg,
+        int(sample_cap),
+    )
+
+
+def hausdorff_polyline(
+    a: LineString | Sequence[LineString] | DensifiedPolyline,
+    b: LineString | Sequence[LineString] | DensifiedPolyline,
+    *,
+    max_segment_length_m: float | None = 100.0,
+    max_segment_angle_deg: float | None = 0.1,
+    sample_cap: int = 50_000,
+) -> PolylineHausdorffWitness:
+    """Symmetric Hausdorff witness between two densified (multi)polylines.
+
+    Either side may be a :class:`DensifiedPolyline`, whose cached samples are
+    used as-is; the spacing knobs only apply to sides that are plain LineStrings.
+    """
+    options = _loxodrome_rs.DensificationOptions(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
+    witness = _loxodrome_rs.hausdorff_polyline(_to_polyline_arg(a), _to_polyline_arg(b), options)
+
+    return _polyline_witness_from_tuple(witness.to_tuple())
+
+
+def _to_polyline_arg(
+    value: LineString | Sequence[LineString] | DensifiedPolyline,
+) -> list[_loxodrome_rs.LineString] | _loxodrome_rs.DensifiedPolyline:
+    """Return the kernel form of a polyline argument without re-sampling cached ones."""
+    if isinstance(value, DensifiedPolyline):
+        return value._handle
+    if isinstance(value, LineString):
+        return [value._handle]
+    return [part._handle for part in value]
+
+
+def _to_handles(points: PointSet, *, argument_name: str) -> list[_loxodrome_rs.Point] | object:
+    """Collect Rust point handles, passing `(N, 2)` coordinate buffers straight to the kernel."""
+    buffer = _coord_buffer(points, width=2)
+    if buffer is not None:
+        return buffer
+
+    return [
+        point._handle
+        if type(point) is Point
+        else _raise_point_type_error(point, expected="Point", argument_name=argument_name)
+        for point in points
+    ]
+
+
+def _to_handles_3d(points: PointSet3D, *, argument_name: str) -> list[_loxodrome_rs.Point3D] | object:
+    """Collect Rust 3D point handles, passing `(N, 3)` coordinate buffers straight to the kernel."""
+    buffer = _coord_buffer(points, width=3)
+    if buffer is not None:
+        return buffer
+
+    return [
+        point._handle
+        if type(point) is Point3D
+        else _raise_point_type_error(point, expected="Point3D", argument_name=argument_name)
+        for point in points
+    ]
+
+
+def _directed_witness_from_tuple(values: tuple[float, int, int]) -> HausdorffDirectedWitness:
+    """Build a directed witness from the kernel's `(distance_m, origin_index, candidate_index)` tuple."""
+    return HausdorffDirectedWitness._make(values)
+
+
+def _witness_from_tuple(
+    values: tuple[float, tuple[float, int, int], tuple[float, int, int]],
+) -> HausdorffWitness:
+    """Build a symmetric witness from the kernel's nested `(distance_m, a_to_b, b_to_a)` tuple."""
+    distance_m, a_to_b, b_to_a = values
+    return HausdorffWitness(distance_m, _directed_witness_from_tuple(a_to_b), _directed_witness_from_tuple(b_to_a))
+
+
+def _polyline_witness_from_tuple(
+    values: tuple[
+        float,
+        tuple[float, int, int, int, int, PointTuple, PointTuple],
+        tuple[float, int, int, int, int, PointTuple, PointTuple],
+    ],
+) -> PolylineHausdorffWitness:
+    """Build a symmetric polyline witness from the kernel's nested `(distance_m, a_to_b, b_to_a)` tuple."""
+    distance_m, a_to_b, b_to_a = values
+    return PolylineHausdorffWitness(
+        distance_m,
+        PolylineDirectedWitness._make(a_to_b),
+        PolylineDirectedWitness._make(b_to_a),
     )
+
+
+def _raise_point_type_error(value: object, *, expected: str, argument_name: str) -> NoReturn:
+    raise TypeError(f"{argument_name} must contain {expected} instances, got {type(value).__name__}")
@@ -18,18 +18,35 @@ import numpy.typing as _npt
 
 from . import _loxodrome_rs
 from .errors import InvalidGeometryError
-from .geometry import Ellipsoid, Point, _coerce_point_like
+from .geometry import Ellipsoid, LineString, Point, _coerce_point_like
+from .ops import PolylineDirectedWitness, PolylineHausdorffWitness, _polyline_witness_from_tuple
 from .types import Point as PointTuple
 from .types import Point3D as Point3DTuple
 
 FloatArray: TypeAlias = _npt.NDArray[_np.float64]
 IntArray: TypeAlias = _npt.NDArray[_np.int64]
+RecordArray: TypeAlias = _npt.NDArray[_np.void]
 
 _LAT_MIN = -90.0
 _LAT_MAX = 90.0
 _LON_MIN = -180.0
 _LON_MAX = 180.0
 
+# Field order and widths mirror the packed records emitted by the Rust batch kernel.
+_POLYLINE_WITNESS_DTYPE = _np.dtype(
+    [
+        ("distance_m", _np.float64),
+        ("source_part", _np.uint64),
+        ("source_index", _np.uint64),
+        ("target_part", _np.uint64),
+        ("target_index", _np.uint64),
+        ("source_lat", _np.float64),
+        ("source_lon", _np.float64),
+        ("target_lat", _np.float64),
+        ("target_lon", _np.float64),
+    ]
+)
+
 ArrayLike: TypeAlias = Sequence[SupportsFloat] | Sequence[Sequence[SupportsFloat]] | FloatArray
 FloatBuffer: TypeAlias = FloatArray | list[float]
 IntBuffer: TypeAlias = IntArray | list[int]
@@ -106,14 +123,13 @@ def _coerce_point_columns(lat_deg: ArrayLike, lon_deg: ArrayLike | None) -> tupl
         arrays: tuple[FloatArray, FloatArray] = (lat_array, lon_array)
         return arrays
 
-    lat_list: list[float] = []
-    lon_list: list[float] = []
-
     lat_iterable: list[SupportsFloat] = list(cast(Sequence[SupportsFloat], lat_deg))
     lon_iterable: list[SupportsFloat] = list(cast(Sequence[SupportsFloat], lon_deg))
     if len(lat_iterable) != len(lon_iterable):
         raise InvalidGeometryError(f"lat and lon must share length, got {len(lat_iterable)} and {len(lon_iterable)}")
 
+    lat_list: list[float] = []
+    lon_list: list[float] = []
     for index, (lat_value, lon_value) in enumerate(zip(lat_iterable, lon_iterable)):
         lat_list.append(_validate_scalar(lat_value, index, name="lat", min_value=_LAT_MIN, max_value=_LAT_MAX))
         lon_list.append(_validate_scalar(lon_value, index, name="lon", min_value=_LON_MIN, max_value=_LON_MAX))
@@ -331,6 +347,21 @@ class DistanceResult:
         return list(self.distance_m)
 
 
+@dataclass(frozen=True, slots=True)
+class DistanceMatrixResult:
+    """Container for an origin-by-destination distance matrix."""
+
+    distance_m: FloatArray
+
+    def to_numpy(self) -> FloatArray:
+        """Return distances as a 2-D float64 NumPy array shaped `(origins, destinations)`."""
+        return _np.ascontiguousarray(self.distance_m, dtype=_np.float64)
+
+    def to_python(self) -> list[list[float]]:
+        """Return distances as nested Python lists, one row per origin."""
+        return [[float(value) for value in row] for row in self.distance_m.tolist()]
+
+
 @dataclass(frozen=True, slots=True)
 class BearingsResult:
     """Container for batch distances and bearings."""
@@ -384,6 +415,53 @@ class AreaResult:
         return list(self.area_m2)
 
 
+@dataclass(frozen=True, slots=True)
+class PolylineWitnessBatch:
+    """Container for directed polyline Hausdorff witnesses, one record per pair."""
+
+    records: RecordArray
+
+    @property
+    def distance_m(self) -> FloatArray:
+        """Directed Hausdorff distance for each pair in meters."""
+        return cast(FloatArray, self.records["distance_m"])
+
+    def to_numpy(self) -> RecordArray:
+        """Return witnesses as a structured array with part/index and coordinate fields."""
+        return self.records
+
+    def to_python(self) -> list[tuple[float, int, int, int, int, float, float, float, float]]:
+        """Return witnesses as `(distance_m, source_part, source_index, target_part, target_index, ...)` tuples."""
+        return cast(list[tuple[float, int, int, int, int, float, float, float, float]], self.records.tolist())
+
+    def witness(self, index: int) -> PolylineDirectedWitness:
+        """Wrap the record at `index` as a directed polyline witness."""
+        (
+            distance_m,
+            source_part,
+            source_index,
+            target_part,
+            target_index,
+            source_lat,
+            source_lon,
+            target_lat,
+            target_lon,
+        ) = self.records[index].tolist()
+        return PolylineDirectedWitness(
+            distance_m,
+            source_part,
+            source_index,
+            target_part,
+            target_index,
+            (source_lat, source_lon),
+            (target_lat, target_lon),
+        )
+
+    def __len__(self) -> int:
+        """Number of witnesses in the batch."""
+        return len(self.records)
+
+
 def points_from_coords(lat_deg: ArrayLike, lon_deg: ArrayLike | None = None) -> PointBatch:
     """Construct a PointBatch from latitude/longitude buffers."""
     lat, lon = _coerce_point_columns(lat_deg, lon_deg)
@@ -433,6 +511,34 @@ def _coerce_point_batch(value: PointBatch | ArrayLike) -> PointBatch:
     return points_from_coords(value, None)
 
 
+def _coerce_point3d_batch(value: Point3DBatch | ArrayLike) -> Point3DBatch:
+    if isinstance(value, Point3DBatch):
+        return value
+
+    coords = _np.asarray(value, dtype=_np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise InvalidGeometryError(f"3D coords must have shape (N, 3), got {coords.shape}")
+    return points3d_from_coords(coords[:, 0], coords[:, 1], coords[:, 2])
+
+
+def _geodetic_to_ecef(points: Point3DBatch, semi_major_axis_m: float, semi_minor_axis_m: float) -> FloatArray:
+    """Convert a 3D batch to `(N, 3)` ECEF meters using the same formula as the Rust kernel."""
+    lat = _np.radians(_np.asarray(points.lat_deg, dtype=_np.float64))
+    lon = _np.radians(_np.asarray(points.lon_deg, dtype=_np.float64))
+    altitude = _np.asarray(points.altitude_m, dtype=_np.float64)
+    eccentricity_squared = 1.0 - (semi_minor_axis_m * semi_minor_axis_m) / (semi_major_axis_m * semi_major_axis_m)
+
+    sin_lat = _np.sin(lat)
+    surface_normal_radius = semi_major_axis_m / _np.sqrt(1.0 - eccentricity_squared * sin_lat * sin_lat)
+    horizontal = (surface_normal_radius + altitude) * _np.cos(lat)
+
+    ecef = _np.empty((len(points), 3), dtype=_np.float64)
+    _np.multiply(horizontal, _np.cos(lon), out=ecef[:, 0])
+    _np.multiply(horizontal, _np.sin(lon), out=ecef[:, 1])
+    _np.multiply((1.0 - eccentricity_squared) * surface_normal_radius + altitude, sin_lat, out=ecef[:, 2])
+    return ecef
+
+
 def _coerce_ellipsoid(ellipsoid: Ellipsoid | Sequence[float] | None) -> Ellipsoid | None:
     if ellipsoid is None:
         return None
@@ -500,6 +606,33 @@ def geodesic_with_bearings_batch(
     )
 
 
+def geodesic_distance_3d_batch(
+    origins: Point3DBatch | ArrayLike,
+    destinations: Point3DBatch | ArrayLike,
+    *,
+    ellipsoid: Ellipsoid | Sequence[float] | None = None,
+) -> DistanceResult:
+    """Compute pairwise straight-line (ECEF chord) distances between 3D batches.
+
+    Mirrors :func:`loxodrome.geodesic_distance_3d` but runs entirely in NumPy,
+    so no per-pair FFI call is made. Array inputs are `(N, 3)` rows of
+    `(lat, lon, altitude_m)`; the WGS84 ellipsoid is used unless one is given.
+    """
+    origin_batch = _coerce_point3d_batch(origins)
+    destination_batch = _coerce_point3d_batch(destinations)
+    if len(origin_batch) != len(destination_batch):
+        raise InvalidGeometryError(
+            f"origins and destinations must share length, got {len(origin_batch)} and {len(destination_batch)}"
+        )
+
+    model = _coerce_ellipsoid(ellipsoid)
+    semi_major_axis_m, semi_minor_axis_m = (model if model is not None else Ellipsoid.wgs84()).to_tuple()
+
+    delta = _geodetic_to_ecef(origin_batch, semi_major_axis_m, semi_minor_axis_m)
+    delta -= _geodetic_to_ecef(destination_batch, semi_major_axis_m, semi_minor_axis_m)
+    return DistanceResult(_np.linalg.norm(delta, axis=1))
+
+
 def geodesic_distance_to_many(
     origin: Point | PointTuple,
     destinations: PointBatch | ArrayLike,
@@ -522,6 +655,79 @@ def geodesic_distance_to_many(
     return DistanceResult(_np.asarray(distances, dtype=_np.float64))
 
 
+def geodesic_distance_matrix(
+    origins: PointBatch | ArrayLike,
+    destinations: PointBatch | ArrayLike,
+    *,
+    ellipsoid: Ellipsoid | Sequence[float] | None = None,
+) -> DistanceMatrixResult:
+    """Compute distances from every origin to every destination in one kernel call.
+
+    Row `i` of the result holds the distances from origin `i`, so `argmin` along
+    axis 1 yields each origin's nearest destination.
+    """
+    origin_batch = _coerce_point_batch(origins)
+    destination_batch = _coerce_point_batch(destinations)
+    model = _coerce_ellipsoid(ellipsoid)
+
+    distances = _loxodrome_rs.geodesic_distance_matrix(
+        origin_batch.lat_deg,
+        origin_batch.lon_deg,
+        destination_batch.lat_deg,
+        destination_batch.lon_deg,
+        ellipsoid=model._handle if model else None,
+    )
+
+    matrix = _np.asarray(distances, dtype=_np.float64).reshape(len(origin_batch), len(destination_batch))
+    return DistanceMatrixResult(matrix)
+
+
+def hausdorff_directed_polyline_batch(
+    a: Sequence[Sequence[LineString]],
+    b: Sequence[Sequence[LineString]],
+    *,
+    max_segment_length_m: float | None = 100.0,
+    max_segment_angle_deg: float | None = 0.1,
+    sample_cap: int = 50_000,
+) -> PolylineWitnessBatch:
+    """Compute directed polyline Hausdorff witnesses for each `(a[i], b[i])` pair of multilines.
+
+    All pairs are evaluated in one kernel call and the witnesses are returned as
+    packed records rather than per-pair Python objects.
+    """
+    if len(a) != len(b):
+        raise InvalidGeometryError(f"a and b must share length, got {len(a)} and {len(b)}")
+
+    options = _loxodrome_rs.DensificationOptions(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
+    packed = _loxodrome_rs.hausdorff_directed_polyline_batch(
+        [[part._handle for part in parts] for parts in a],
+        [[part._handle for part in parts] for parts in b],
+        options,
+    )
+
+    return PolylineWitnessBatch(_np.frombuffer(packed, dtype=_POLYLINE_WITNESS_DTYPE))
+
+
+def hausdorff_polyline_coords(
+    a: PolylineBatch,
+    b: PolylineBatch,
+    *,
+    max_segment_length_m: float | None = 100.0,
+    max_segment_angle_deg: float | None = 0.1,
+    sample_cap: int = 50_000,
+) -> PolylineHausdorffWitness:
+    """Compute the symmetric polyline Hausdorff witness between two multilines held as flat buffers.
+
+    Each batch is read as the parts of one multiline: `coords` holds every
+    vertex and `offsets` delimits the parts. The kernel slices parts straight
+    out of the buffers, so no per-part LineString is constructed.
+    """
+    options = _loxodrome_rs.DensificationOptions(max_segment_length_m, max_segment_angle_deg, int(sample_cap))
+    witness = _loxodrome_rs.hausdorff_polyline_coords(a.coords, a.offsets, b.coords, b.offsets, options)
+
+    return _polyline_witness_from_tuple(witness.to_tuple())
+
+
 def area_batch(
     polygons: PolygonBatch,
     *,
@@ -545,14 +751,20 @@ __all__ = [
     "PolylineBatch",
     "PolygonBatch",
     "DistanceResult",
+    "DistanceMatrixResult",
     "BearingsResult",
     "AreaResult",
+    "PolylineWitnessBatch",
     "points_from_coords",
     "points3d_from_coords",
     "polylines_from_coords",
     "polygons_from_coords",
     "geodesic_distance_batch",
     "geodesic_with_bearings_batch",
+    "geodesic_distance_3d_batch",
     "geodesic_distance_to_many",
+    "geodesic_distance_matrix",
+    "hausdorff_directed_polyline_batch",
+    "hausdorff_polyline_coords",
     "area_batch",
 ]
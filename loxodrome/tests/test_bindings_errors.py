@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from array import array
 
 import pytest
 
@@ -71,6 +72,17 @@ def test_degenerate_polyline_maps_to_invalid_geometry_error() -> None:
         rs.LineString([(0.0, 0.0), (0.0, 0.0)])
 
 
+@pytest.mark.parametrize("width", [1, 3, 4])
+def test_2d_coordinate_buffers_must_have_two_columns(width: int) -> None:
+    coords = memoryview(array("d", [0.0] * 2 * width)).cast("B").cast("d", (2, width))
+    points = [rs.Point(0.0, 0.0)]
+
+    with pytest.raises(ValueError, match=r"shape \(N, 2\)"):
+        rs.hausdorff(coords, points)
+    with pytest.raises(ValueError, match=r"shape \(N, 2\)"):
+        rs.LineString(coords)
+
+
 def test_unmapped_variant_falls_back_to_base_exception() -> None:
     with pytest.raises(rs.GeodistError):
         raise rs.GeodistError("synthetic geodist error")
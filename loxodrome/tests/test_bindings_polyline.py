@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import functools
+
+import numpy as np
+import numpy.typing as npt
 import pytest
+from _hausdorff_oracle import hausdorff_directed_oracle
 from pytest import approx
 
 from loxodrome import _loxodrome_rs
+from loxodrome import vectorized as vz
+
+
+@pytest.fixture(scope="module")
+def default_options() -> _loxodrome_rs.DensificationOptions:
+    return _loxodrome_rs.DensificationOptions(
+        max_segment_length_m=1_000_000.0,
+        max_segment_angle_deg=None,
+        sample_cap=1000,
+    )
 
 
 def test_densification_options_validation_and_defaults() -> None:
@@ -18,16 +33,11 @@ def test_densification_options_validation_and_defaults() -> None:
         )
 
 
-def test_polyline_hausdorff_smoke() -> None:
+def test_polyline_hausdorff_smoke(default_options: _loxodrome_rs.DensificationOptions) -> None:
     line_a = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 1.0)])
     line_b = _loxodrome_rs.LineString([(0.0, 0.0), (1.0, 0.0)])
-    options = _loxodrome_rs.DensificationOptions(
-        max_segment_length_m=1_000_000.0,
-        max_segment_angle_deg=None,
-        sample_cap=1000,
-    )
 
-    directed = _loxodrome_rs.hausdorff_directed_polyline([line_a], [line_b], options)
+    directed = _loxodrome_rs.hausdorff_directed_polyline([line_a], [line_b], default_options)
     assert isinstance(directed, _loxodrome_rs.PolylineDirectedWitness)
     assert directed.source_part == 0
     assert directed.target_part == 0
@@ -36,7 +46,7 @@ def test_polyline_hausdorff_smoke() -> None:
     assert directed.distance_m > 100_000
     assert directed.source_coord.to_tuple() == (0.0, 1.0)
 
-    symmetric = _loxodrome_rs.hausdorff_polyline([line_a], [line_b], options)
+    symmetric = _loxodrome_rs.hausdorff_polyline([line_a], [line_b], default_options)
     assert isinstance(symmetric, _loxodrome_rs.PolylineHausdorffWitness)
     assert symmetric.distance_m >= symmetric.a_to_b.distance_m
     assert symmetric.distance_m >= symmetric.b_to_a.distance_m
@@ -81,30 +91,31 @@ def test_polyline_hausdorff_multiline_witness_matches_argmax() -> None:
         [line_b_overlap, line_b_offset],
         options=options,
     )
+    option_values = options.to_tuple()
 
     def directed_argmax(
         a_parts: list[_loxodrome_rs.LineString], b_parts: list[_loxodrome_rs.LineString]
     ) -> tuple[float, int, int, int, int]:
-        max_len, max_angle, cap = options.to_tuple()
-        sampled_a = [part.densify(max_len, max_angle, cap) for part in a_parts]
-        sampled_b = [part.densify(max_len, max_angle, cap) for part in b_parts]
-        best: tuple[float, int, int, int, int] | None = None
-        for a_part_idx, samples in enumerate(sampled_a):
-            for source_idx, source in enumerate(samples):
-                min_dist = None
-                min_target = None
-                for b_part_idx, targets in enumerate(sampled_b):
-                    for target_idx, target in enumerate(targets):
-                        dist = _loxodrome_rs.geodesic_distance(source, target)
-                        if min_dist is None or dist < min_dist:
-                            min_dist = dist
-                            min_target = (b_part_idx, target_idx)
-                assert min_dist is not None
-                assert min_target is not None
-                if best is None or min_dist > best[0]:
-                    best = (min_dist, a_part_idx, source_idx, min_target[0], min_target[1])
-        assert best is not None
-        return best
+        sampled_a = [_densified(part, *option_values) for part in a_parts]
+        sampled_b = [_densified(part, *option_values) for part in b_parts]
+        a_offsets = np.cumsum([0] + [len(samples) for samples in sampled_a])
+        b_offsets = np.cumsum([0] + [len(samples) for samples in sampled_b])
+
+        distances = vz.geodesic_distance_matrix(np.concatenate(sampled_a), np.concatenate(sampled_b)).to_numpy()
+        min_target = distances.argmin(axis=1)
+        min_dist = distances[np.arange(len(distances)), min_target]
+        best_row = int(min_dist.argmax())
+        best_col = int(min_target[best_row])
+
+        a_part = int(np.searchsorted(a_offsets, best_row, side="right")) - 1
+        b_part = int(np.searchsorted(b_offsets, best_col, side="right")) - 1
+        return (
+            float(min_dist[best_row]),
+            a_part,
+            best_row - int(a_offsets[a_part]),
+            b_part,
+            best_col - int(b_offsets[b_part]),
+        )
 
     a_to_b = directed_argmax([line_a_overlap, line_a_offset], [line_b_overlap, line_b_offset])
     b_to_a = directed_argmax([line_b_overlap, line_b_offset], [line_a_overlap, line_a_offset])
@@ -124,6 +135,74 @@ def test_polyline_hausdorff_multiline_witness_matches_argmax() -> None:
     assert witness.distance_m == approx(max(a_to_b[0], b_to_a[0]))
 
 
+def test_polyline_hausdorff_directed_matches_oracle() -> None:
+    line_a = _loxodrome_rs.LineString([(0.0, 0.0), (0.5, 1.0), (0.0, 2.0)])
+    line_b = _loxodrome_rs.LineString([(0.2, 0.0), (0.2, 2.0)])
+    options = _loxodrome_rs.DensificationOptions(
+        max_segment_length_m=20_000.0,
+        max_segment_angle_deg=None,
+        sample_cap=10_000,
+    )
+
+    witness = _loxodrome_rs.hausdorff_directed_polyline([line_a], [line_b], options)
+
+    option_values = options.to_tuple()
+    samples_a = _densified(line_a, *option_values)
+    samples_b = _densified(line_b, *option_values)
+    distance_m, origin_index, candidate_index = hausdorff_directed_oracle(samples_a, samples_b)
+
+    assert witness.distance_m == approx(distance_m)
+    assert witness.source_index == origin_index
+    assert witness.target_index == candidate_index
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_polyline_hausdorff_matches_oracle_on_random_multilines(seed: int) -> None:
+    # Seeded random walks stand in for property-based fuzzing without adding a dependency.
+    rng = np.random.default_rng(seed)
+    parts_a = _random_multiline(rng)
+    parts_b = _random_multiline(rng)
+    options = _loxodrome_rs.DensificationOptions(
+        max_segment_length_m=50_000.0,
+        max_segment_angle_deg=None,
+        sample_cap=50_000,
+    )
+
+    witness = _loxodrome_rs.hausdorff_polyline(parts_a, parts_b, options)
+
+    option_values = options.to_tuple()
+    samples_a = np.concatenate([_densified(part, *option_values) for part in parts_a])
+    samples_b = np.concatenate([_densified(part, *option_values) for part in parts_b])
+    a_to_b, _, _ = hausdorff_directed_oracle(samples_a, samples_b)
+    b_to_a, _, _ = hausdorff_directed_oracle(samples_b, samples_a)
+
+    assert witness.a_to_b.distance_m == approx(a_to_b)
+    assert witness.b_to_a.distance_m == approx(b_to_a)
+    assert witness.distance_m == approx(max(a_to_b, b_to_a))
+
+
+def test_polyline_hausdorff_directed_streaming_matches_materialized() -> None:
+    line_a_overlap = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 1.0)])
+    line_a_offset = _loxodrome_rs.LineString([(10.0, 0.0), (10.0, 1.0), (10.5, 2.0)])
+    line_b = _loxodrome_rs.LineString([(0.2, 0.0), (0.2, 2.0)])
+    options = _loxodrome_rs.DensificationOptions(
+        max_segment_length_m=20_000.0,
+        max_segment_angle_deg=None,
+        sample_cap=10_000,
+    )
+
+    expected = _loxodrome_rs.hausdorff_directed_polyline([line_a_overlap, line_a_offset], [line_b], options)
+    streamed = _loxodrome_rs.hausdorff_directed_polyline_streaming([line_a_overlap, line_a_offset], [line_b], options)
+
+    assert streamed.distance_m == approx(expected.distance_m)
+    assert streamed.source_part == expected.source_part
+    assert streamed.source_index == expected.source_index
+    assert streamed.target_part == expected.target_part
+    assert streamed.target_index == expected.target_index
+    assert streamed.source_coord.to_tuple() == expected.source_coord.to_tuple()
+    assert streamed.target_coord.to_tuple() == expected.target_coord.to_tuple()
+
+
 def test_polyline_hausdorff_clipped_smoke() -> None:
     line_a = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 1.0)])
     line_b = _loxodrome_rs.LineString([(0.0, 0.0), (1.0, 0.0)])
@@ -141,32 +220,22 @@ def test_polyline_hausdorff_clipped_smoke() -> None:
     assert clipped.distance_m >= clipped.a_to_b.distance_m
 
 
-def test_polyline_chamfer_mean_smoke() -> None:
+def test_polyline_chamfer_mean_smoke(default_options: _loxodrome_rs.DensificationOptions) -> None:
     line_a = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 1.0)])
     line_b = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 2.0)])
-    options = _loxodrome_rs.DensificationOptions(
-        max_segment_length_m=1_000_000.0,
-        max_segment_angle_deg=None,
-        sample_cap=1000,
-    )
 
-    chamfer = _loxodrome_rs.chamfer_polyline([line_a], [line_b], reduction="mean", options=options)
+    chamfer = _loxodrome_rs.chamfer_polyline([line_a], [line_b], reduction="mean", options=default_options)
     assert isinstance(chamfer, _loxodrome_rs.ChamferResult)
     assert chamfer.a_to_b.witness is None
     assert chamfer.b_to_a.witness is None
     assert chamfer.distance_m >= 0.0
 
 
-def test_polyline_chamfer_max_emits_witness() -> None:
+def test_polyline_chamfer_max_emits_witness(default_options: _loxodrome_rs.DensificationOptions) -> None:
     line_a = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 1.0), (0.0, 2.0)])
     line_b = _loxodrome_rs.LineString([(0.0, 0.0), (0.0, 0.2)])
-    options = _loxodrome_rs.DensificationOptions(
-        max_segment_length_m=1_000_000.0,
-        max_segment_angle_deg=None,
-        sample_cap=1000,
-    )
 
-    directed = _loxodrome_rs.chamfer_directed_polyline([line_a], [line_b], reduction="max", options=options)
+    directed = _loxodrome_rs.chamfer_directed_polyline([line_a], [line_b], reduction="max", options=default_options)
     assert isinstance(directed.witness, _loxodrome_rs.PolylineDirectedWitness)
     assert directed.distance_m == directed.witness.distance_m
     assert directed.witness.source_index >= directed.witness.target_index
@@ -179,3 +248,21 @@ def test_polyline_chamfer_clipped_errors() -> None:
 
     with pytest.raises(_loxodrome_rs.EmptyPointSetError):
         _loxodrome_rs.chamfer_polyline_clipped([line_a], [line_b], bbox, reduction="mean")
+
+
+@functools.cache
+def _densified(
+    part: _loxodrome_rs.LineString, max_len: float | None, max_angle: float | None, cap: int
+) -> npt.NDArray[np.float64]:
+    # LineString hashes by identity, so each part is densified once per option set across the module.
+    return np.frombuffer(part.densify_coords(max_len, max_angle, cap), dtype=np.float64).reshape(-1, 2)
+
+
+def _random_multiline(rng: np.random.Generator) -> list[_loxodrome_rs.LineString]:
+    parts = []
+    for _ in range(int(rng.integers(1, 4))):
+        start = rng.uniform((-60.0, -150.0), (60.0, 150.0))
+        steps = rng.normal(scale=0.3, size=(int(rng.integers(1, 20)), 2))
+        vertices = np.vstack((start, start + np.cumsum(steps, axis=0)))
+        parts.append(_loxodrome_rs.LineString([(float(lat), float(lon)) for lat, lon in vertices]))
+    return parts
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
-from loxodrome import BoundingBox, Ellipsoid, InvalidGeometryError, LineString, Point, Point3D
+from loxodrome import BoundingBox, Ellipsoid, InvalidGeometryError, LineString, Point, Point3D, _loxodrome_rs
 from loxodrome.geometry import Polygon
 
 
@@ -57,6 +58,7 @@ def test_ellipsoid_accepts_axes_and_wgs84_factory() -> None:
     ellipsoid = Ellipsoid(6_378_137.0, 6_356_752.314_245)
     assert ellipsoid.to_tuple() == (6_378_137.0, 6_356_752.314_245)
     assert Ellipsoid.wgs84() == ellipsoid
+    assert Ellipsoid.wgs84()._handle is _loxodrome_rs.WGS84_ELLIPSOID
 
 
 @pytest.mark.parametrize(
@@ -97,6 +99,14 @@ def test_point3d_rejects_bool_inputs() -> None:
         Point3D(0.0, 0.0, True)
 
 
+def test_point_types_reject_subclassing() -> None:
+    with pytest.raises(TypeError, match="Point cannot be subclassed"):
+        type("TaggedPoint", (Point,), {"__slots__": ()})
+
+    with pytest.raises(TypeError, match="Point3D cannot be subclassed"):
+        type("TaggedPoint3D", (Point3D,), {"__slots__": ()})
+
+
 def test_bounding_box_accepts_ordered_coordinates() -> None:
     bbox = BoundingBox(-10.0, 10.0, -20.0, 20.0)
     assert bbox.to_tuple() == (-10.0, 10.0, -20.0, 20.0)
@@ -145,6 +155,34 @@ def test_linestring_accepts_vertices_and_to_tuple() -> None:
     assert line.to_tuple() == [(0.0, 0.0), (0.0, 1.0)]
 
 
+def test_linestring_packed_and_coerced_inputs_agree() -> None:
+    vertices = [(0.0, 0.0), (0.5, 1.0), (1.0, 2.0)]
+    expected = LineString([Point(lat, lon) for lat, lon in vertices]).to_tuple()
+
+    assert LineString(vertices).to_tuple() == expected
+    assert LineString(np.array(vertices, dtype=np.float64)).to_tuple() == expected
+    assert LineString([(0, 0), (0.5, 1.0), (1, 2)]).to_tuple() == expected
+
+    with pytest.raises(InvalidGeometryError, match="index 1"):
+        LineString([(0.0, 0.0), (91.0, 0.0)])
+    with pytest.raises(InvalidGeometryError, match="bool"):
+        LineString([(True, 0.0), (0.0, 1.0)])
+
+
+def test_point_vertex_sequences_fall_back_when_mixed() -> None:
+    exterior = [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.0, 0.0)]
+    points = [Point(lat, lon) for lat, lon in exterior]
+
+    assert Polygon(points).to_tuple() == Polygon(exterior).to_tuple()
+    assert LineString([points[0], (0, 1)]).to_tuple() == [(0.0, 0.0), (0.0, 1.0)]
+    with pytest.raises(InvalidGeometryError, match="expected Point or"):
+        LineString([points[0], [0.0, 1.0]])  # type: ignore[list-item]
+    with pytest.raises(InvalidGeometryError, match="got Point3D"):
+        LineString([points[0], Point3D(0.0, 1.0, 0.0)])  # type: ignore[list-item]
+    with pytest.raises(InvalidGeometryError, match="got Point3D"):
+        Polygon([points[0], Point3D(0.0, 1.0, 0.0), points[2], points[0]])  # type: ignore[list-item]
+
+
 def test_linestring_rejects_degenerate_after_dedup() -> None:
     with pytest.raises(InvalidGeometryError):
         LineString([(0.0, 0.0), (0.0, 0.0)])
@@ -159,3 +197,27 @@ def test_linestring_densify_returns_expected_samples() -> None:
     assert len(samples) == 101
     assert samples[0].to_tuple() == start
     assert samples[-1].to_tuple() == pytest.approx(end)
+
+
+def test_linestring_densify_coords_matches_densify() -> None:
+    line = LineString([(0.0, 0.0), (0.0, 0.0899), (0.05, 0.1)])
+
+    coords = line.densify_coords()
+
+    assert coords.shape == (len(line.densify()), 2)
+    assert coords.dtype == np.float64
+    assert not coords.flags.writeable
+    assert [tuple(row) for row in coords.tolist()] == [sample.to_tuple() for sample in line.densify()]
+
+
+def test_linestring_array_interface_views_vertices() -> None:
+    vertices = [(0.0, 0.0), (0.5, 1.0), (1.0, 2.0)]
+    line = LineString(vertices)
+
+    coords = np.asarray(line)
+
+    assert coords.shape == (3, 2)
+    assert coords.dtype == np.float64
+    assert not coords.flags.writeable
+    assert [tuple(row) for row in coords.tolist()] == vertices
+    np.testing.assert_array_equal(np.asarray(line._handle), coords)
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import ctypes
+from array import array
+
+import numpy as np
+import pytest
 from pytest import approx
 
 from loxodrome import (
     BoundingBox,
+    DensifiedPolyline,
     Ellipsoid,
+    EmptyPointSetError,
     GeodesicResult,
     HausdorffDirectedWitness,
     HausdorffWitness,
+    InvalidDistanceError,
+    InvalidGeometryError,
+    LineString,
     Point,
     Point3D,
+    PolylineDirectedWitness,
+    PolylineHausdorffWitness,
+    _loxodrome_rs,
     geodesic_distance,
     geodesic_distance_3d,
     geodesic_distance_on_ellipsoid,
@@ -24,6 +37,7 @@ from loxodrome import (
     hausdorff_directed_clipped,
     hausdorff_directed_clipped_3d,
     hausdorff_polygon_boundary,
+    hausdorff_polyline,
 )
 
 
@@ -107,6 +121,95 @@ def test_hausdorff_clipped_filters_points() -> None:
     assert clipped_symmetric.distance_m == approx(0.0)
 
 
+def test_hausdorff_directed_upper_bound_exits_early() -> None:
+    a = [Point(0.0, 0.0), Point(0.0, 1.0), Point(0.0, 3.0)]
+    b = [Point(0.0, 0.0)]
+
+    exact = hausdorff_directed(a, b)
+    assert hausdorff_directed(a, b, upper_bound_m=exact.distance_m + 1.0) == exact
+
+    bounded = hausdorff_directed(a, b, upper_bound_m=1_000.0)
+    assert bounded.origin_index == 1
+    assert 1_000.0 < bounded.distance_m < exact.distance_m
+
+    a_3d = [Point3D(lat, lon, 0.0) for lat, lon in (point.to_tuple() for point in a)]
+    b_3d = [Point3D(0.0, 0.0, 0.0)]
+    assert hausdorff_directed_3d(a_3d, b_3d, upper_bound_m=1_000.0).origin_index == 1
+
+    with pytest.raises(InvalidDistanceError):
+        hausdorff_directed(a, b, upper_bound_m=-1.0)
+
+
+def test_hausdorff_accepts_coordinate_arrays() -> None:
+    coords_a = np.array([[0.0, 0.0], [0.0, 1.0]], dtype=np.float64)
+    coords_b = np.array([[0.0, 1.0]], dtype=np.float64)
+
+    from_arrays = hausdorff_directed(coords_a, coords_b)
+    from_points = hausdorff_directed([Point(0.0, 0.0), Point(0.0, 1.0)], [Point(0.0, 1.0)])
+
+    assert from_arrays == from_points
+    assert hausdorff(coords_a, coords_b) == hausdorff(
+        [Point(0.0, 0.0), Point(0.0, 1.0)],
+        [Point(0.0, 1.0)],
+    )
+
+
+def test_hausdorff_accepts_memoryview_and_arrow_coordinates() -> None:
+    rows = [(0.0, 0.0), (0.0, 1.0)]
+    expected = hausdorff_directed([Point(lat, lon) for lat, lon in rows], [Point(0.0, 1.0)])
+    view = memoryview(array("d", [0.0, 0.0, 0.0, 1.0])).cast("B").cast("d", (2, 2))
+    assert hausdorff_directed(view, np.array([[0.0, 1.0]])) == expected
+    strided = memoryview(array("d", [0.0, 0.0, 9.0, 9.0, 0.0, 1.0])).cast("B").cast("d", (3, 2))[::2]
+    assert hausdorff_directed(strided, np.array([[0.0, 1.0]])) == expected
+    row = ctypes.c_double * 2
+    explicit_endian = memoryview((row * 2)(row(0.0, 0.0), row(0.0, 1.0)))
+    assert hausdorff_directed(explicit_endian, np.array([[0.0, 1.0]])) == expected
+
+    pa = pytest.importorskip("pyarrow")
+    column = pa.array([list(row) for row in rows], type=pa.list_(pa.float64(), 2))
+    assert hausdorff_directed(pa.chunked_array([column[:1], column[1:]]), [Point(0.0, 1.0)]) == expected
+
+    geoarrow = pa.array([[lon, lat] for lat, lon in rows], type=pa.list_(pa.field("xy", pa.float64()), 2))
+    assert hausdorff_directed(geoarrow, [Point(0.0, 1.0)]) == expected
+
+    with pytest.raises(InvalidGeometryError, match="null points"):
+        hausdorff_directed(pa.array([[0.0, 0.0], None], type=pa.list_(pa.float64(), 2)), [Point(0.0, 1.0)])
+    with pytest.raises(InvalidGeometryError, match="null coordinate values"):
+        hausdorff_directed(pa.array([[0.0, None]], type=pa.list_(pa.float64(), 2)), [Point(0.0, 1.0)])
+
+
+def test_hausdorff_3d_and_clipped_accept_coordinate_arrays() -> None:
+    ground = np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float64)
+    elevated = np.array([[0.0, 0.0, 150.0]], dtype=np.float64)
+    east_only_box = BoundingBox(-1.0, 1.0, 0.5, 1.5)
+
+    assert hausdorff_directed_3d(elevated, ground) == hausdorff_directed_3d(
+        [Point3D(0.0, 0.0, 150.0)],
+        [Point3D(0.0, 0.0, 0.0), Point3D(0.0, 1.0, 0.0)],
+    )
+    assert hausdorff_clipped_3d(ground, ground, east_only_box).distance_m == approx(0.0)
+
+    # Column slices are strided views; the wrapper hands the kernel a contiguous copy.
+    coords = ground[:, :2]
+    assert hausdorff_directed_clipped(coords, coords, east_only_box).origin_index == 1
+
+
+def test_hausdorff_rejects_non_point_elements() -> None:
+    with pytest.raises(TypeError, match="b must contain Point instances, got tuple"):
+        hausdorff_directed([Point(0.0, 0.0)], [(0.0, 1.0)])  # type: ignore[list-item]
+
+    with pytest.raises(TypeError, match="a must contain Point3D instances, got Point"):
+        hausdorff_3d([Point(0.0, 0.0)], [Point3D(0.0, 0.0, 0.0)])  # type: ignore[list-item]
+
+
+def test_ops_surface_kernel_errors_without_rewrapping() -> None:
+    with pytest.raises(EmptyPointSetError) as excinfo:
+        hausdorff_directed([], [Point(0.0, 0.0)])
+
+    assert type(excinfo.value) is _loxodrome_rs.EmptyPointSetError
+    assert excinfo.value.__context__ is None
+
+
 def test_hausdorff_3d_matches_vertical_delta() -> None:
     ground = Point3D(0.0, 0.0, 0.0)
     elevated = Point3D(0.0, 0.0, 200.0)
@@ -117,6 +220,43 @@ def test_hausdorff_3d_matches_vertical_delta() -> None:
     assert symmetric.distance_m == approx(200.0)
 
 
+def test_hausdorff_witnesses_mirror_kernel_tuples() -> None:
+    a = [Point(0.0, 0.0), Point(0.0, 1.0)]
+    b = [Point(0.0, 1.0)]
+    raw = _loxodrome_rs.hausdorff([point._handle for point in a], [point._handle for point in b]).to_tuple()
+
+    witness = hausdorff(a, b)
+
+    assert (witness.distance_m, witness.a_to_b.origin_index, witness.b_to_a.candidate_index) == (
+        raw[0],
+        raw[1][1],
+        raw[2][2],
+    )
+    assert type(witness.a_to_b.origin_index) is int
+    assert witness == raw
+    distance_m, a_to_b, _ = witness
+    assert (distance_m, a_to_b) == (witness.distance_m, witness.a_to_b)
+
+
+def test_hausdorff_parallel_directions_match_serial() -> None:
+    # Large enough to cross the kernel's parallel threshold.
+    a = np.column_stack((np.linspace(-1.0, 1.0, 800), np.linspace(0.0, 2.0, 800)))
+    b = np.column_stack((np.linspace(-1.0, 1.2, 700), np.linspace(0.1, 2.0, 700)))
+    box = BoundingBox(-0.5, 0.5, 0.0, 2.0)
+
+    assert hausdorff(a, b) == hausdorff(a, b, threads=1)
+    assert hausdorff_clipped(a, b, box) == hausdorff_clipped(a, b, box, threads=1)
+
+    a_3d = np.column_stack((a, np.zeros(len(a))))
+    b_3d = np.column_stack((b, np.full(len(b), 25.0)))
+    assert hausdorff_3d(a_3d, b_3d) == hausdorff_3d(a_3d, b_3d, threads=1)
+
+    assert hausdorff(a, b, threads=4) == hausdorff(a, b, threads=1)
+    for threads in (0, -1):
+        with pytest.raises(ValueError, match="threads must be at least 1"):
+            hausdorff(a, b, threads=threads)
+
+
 def test_hausdorff_3d_clipped_filters_points() -> None:
     inside = Point3D(0.0, 0.0, 50.0)
     outside = Point3D(10.0, 0.0, 0.0)
@@ -138,3 +278,20 @@ def test_polygon_boundary_hausdorff_matches_zero_for_identical() -> None:
     ]
     distance = hausdorff_polygon_boundary(exterior, exterior)
     assert distance == approx(0.0)
+
+
+def test_hausdorff_polyline_reuses_densified_reference() -> None:
+    reference = LineString([(0.0, 0.0), (0.0, 0.01)])
+    query = LineString([(0.001, 0.0), (0.001, 0.01)])
+    dense_reference = DensifiedPolyline.from_parts(reference)
+
+    assert len(dense_reference) == len(reference.densify())
+    assert dense_reference.part_offsets() == [0, len(dense_reference)]
+
+    expected = hausdorff_polyline(query, reference)
+    assert isinstance(expected, PolylineHausdorffWitness)
+    assert isinstance(expected.a_to_b, PolylineDirectedWitness)
+    assert expected.a_to_b.source_coord == query.densify()[expected.a_to_b.source_index].to_tuple()
+
+    assert hausdorff_polyline(query, dense_reference) == expected
+    assert hausdorff_polyline([query], dense_reference) == expected
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import loxodrome
+
+
+def test_import_defers_wrapper_modules() -> None:
+    script = "import sys, loxodrome; print(sorted(m for m in sys.modules if m.startswith('loxodrome.')))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_lazy_attributes_are_cached_and_listed() -> None:
+    from loxodrome import geometry
+
+    assert loxodrome.Point is geometry.Point
+    assert "Point" in vars(loxodrome)
+    assert set(loxodrome.__all__) <= set(dir(loxodrome))
+
+
+def test_lazy_exports_match_all_and_their_source_modules() -> None:
+    lazy = loxodrome._LAZY
+
+    assert sorted(lazy) == sorted(loxodrome.__all__)
+    for name, module_name in lazy.items():
+        module = importlib.import_module(f"loxodrome.{module_name}")
+        assert name in module.__all__, f"{name} is not exported by loxodrome.{module_name}"
+
+
+def test_earth_radius_is_the_extension_float() -> None:
+    from loxodrome import _loxodrome_rs
+
+    assert type(loxodrome.EARTH_RADIUS_METERS) is float
+    assert loxodrome.EARTH_RADIUS_METERS is _loxodrome_rs.EARTH_RADIUS_METERS
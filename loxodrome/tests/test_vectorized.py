@@ -3,9 +3,9 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from loxodrome import InvalidGeometryError, ops
+from loxodrome import InvalidGeometryError, _loxodrome_rs, ops
 from loxodrome import vectorized as vz
-from loxodrome.geometry import Point
+from loxodrome.geometry import LineString, Point, Point3D
 
 
 def test_points_from_coords_numpy_roundtrip() -> None:
@@ -31,6 +31,15 @@ def test_points3d_from_coords_rejects_mismatched_altitude() -> None:
         vz.points3d_from_coords([0.0, 1.0], [0.0, 1.0], [10.0])
 
 
+def test_sequence_columns_validate_into_float_lists() -> None:
+    batch = vz.points3d_from_coords([0.0, 1], [2.0, 3], [10.0, 20])
+
+    for column in (batch.lat_deg, batch.lon_deg, batch.altitude_m):
+        assert isinstance(column, list)
+        assert all(type(value) is float for value in column)
+    assert batch.to_python() == [(0.0, 2.0, 10.0), (1.0, 3.0, 20.0)]
+
+
 def test_geodesic_distance_batch_matches_scalar() -> None:
     origins = vz.points_from_coords([(0.0, 0.0), (0.0, 0.0)])
     destinations = vz.points_from_coords([(0.0, 1.0), (1.0, 0.0)])
@@ -47,6 +56,21 @@ def test_geodesic_distance_batch_matches_scalar() -> None:
     np.testing.assert_allclose(distances, expected)
 
 
+def test_geodesic_distance_3d_batch_matches_scalar() -> None:
+    origins = np.array([[0.0, 0.0, 0.0], [45.0, 90.0, 1_000.0]], dtype=np.float64)
+    destinations = vz.points3d_from_coords([0.0, -45.0], [0.0, -90.0], [150.0, 0.0])
+
+    distances = vz.geodesic_distance_3d_batch(origins, destinations).to_numpy()
+    expected = [
+        ops.geodesic_distance_3d(Point3D(0.0, 0.0, 0.0), Point3D(0.0, 0.0, 150.0)),
+        ops.geodesic_distance_3d(Point3D(45.0, 90.0, 1_000.0), Point3D(-45.0, -90.0, 0.0)),
+    ]
+
+    np.testing.assert_allclose(distances, expected, rtol=1e-12)
+    with pytest.raises(InvalidGeometryError, match="must share length"):
+        vz.geodesic_distance_3d_batch(origins, origins[:1])
+
+
 def test_geodesic_distance_to_many_reuses_origin() -> None:
     origin = Point(0.0, 0.0)
     destinations = vz.points_from_coords([(0.0, 1.0), (1.0, 0.0)])
@@ -56,6 +80,82 @@ def test_geodesic_distance_to_many_reuses_origin() -> None:
     assert distances[0] == pytest.approx(distances[1])
 
 
+def test_geodesic_distance_matrix_matches_scalar() -> None:
+    origins = vz.points_from_coords([(0.0, 0.0), (10.0, 0.0)])
+    destinations = vz.points_from_coords([(0.0, 1.0), (1.0, 0.0), (10.0, 0.0)])
+
+    matrix = vz.geodesic_distance_matrix(origins, destinations).to_numpy()
+    assert matrix.shape == (2, 3)
+    for row, origin in enumerate(origins.to_python()):
+        for col, destination in enumerate(destinations.to_python()):
+            assert matrix[row, col] == ops.geodesic_distance(Point(*origin), Point(*destination))
+
+    empty = vz.points_from_coords(np.empty((0, 2), dtype=np.float64))
+    assert vz.geodesic_distance_matrix(origins, empty).to_numpy().shape == (2, 0)
+
+
+def test_hausdorff_directed_polyline_batch_matches_per_pair_witnesses() -> None:
+    a = [
+        [LineString([(0.0, 0.0), (0.0, 1.0)])],
+        [LineString([(0.0, 0.0), (1.0, 0.0)]), LineString([(5.0, 0.0), (5.0, 1.0)])],
+    ]
+    b = [[LineString([(0.5, 0.0), (0.5, 1.0)])], [LineString([(0.0, 0.0), (0.0, 2.0)])]]
+
+    batch = vz.hausdorff_directed_polyline_batch(a, b, max_segment_length_m=10_000.0)
+
+    assert len(batch) == 2
+    options = _loxodrome_rs.DensificationOptions(10_000.0, 0.1, 50_000)
+    for record, parts_a, parts_b in zip(batch.to_numpy(), a, b):
+        expected = _loxodrome_rs.hausdorff_directed_polyline(
+            [part._handle for part in parts_a], [part._handle for part in parts_b], options
+        )
+        assert record["distance_m"] == expected.distance_m
+        assert (record["source_part"], record["source_index"]) == (expected.source_part, expected.source_index)
+        assert (record["target_part"], record["target_index"]) == (expected.target_part, expected.target_index)
+        assert (record["source_lat"], record["source_lon"]) == expected.source_coord.to_tuple()
+        assert (record["target_lat"], record["target_lon"]) == expected.target_coord.to_tuple()
+
+    for index, (parts_a, parts_b) in enumerate(zip(a, b)):
+        expected = _loxodrome_rs.hausdorff_directed_polyline(
+            [part._handle for part in parts_a], [part._handle for part in parts_b], options
+        )
+        witness = batch.witness(index)
+        assert isinstance(witness, ops.PolylineDirectedWitness)
+        assert witness == ops.PolylineDirectedWitness._make(expected.to_tuple())
+    assert batch.witness(-1) == batch.witness(1)
+
+    assert int(batch.distance_m.argmax()) == 1
+    assert batch.to_python()[0][0] == batch.distance_m[0]
+
+    with pytest.raises(InvalidGeometryError, match="share length"):
+        vz.hausdorff_directed_polyline_batch(a, b[:1])
+
+
+def test_hausdorff_polyline_coords_matches_linestring_parts() -> None:
+    parts_a = [[(0.0, 0.0), (0.0, 0.5)], [(1.0, 0.0), (1.0, 0.5)]]
+    parts_b = [[(0.0, 0.1), (0.2, 0.5)]]
+
+    def as_batch(parts: list[list[tuple[float, float]]]) -> vz.PolylineBatch:
+        offsets = np.cumsum([0, *map(len, parts)])
+        return vz.polylines_from_coords(np.concatenate([np.asarray(part) for part in parts]), offsets.tolist())
+
+    options = _loxodrome_rs.DensificationOptions(10_000.0, None, 50_000)
+    expected = _loxodrome_rs.hausdorff_polyline(
+        [LineString(part)._handle for part in parts_a],
+        [LineString(part)._handle for part in parts_b],
+        options,
+    )
+
+    witness = vz.hausdorff_polyline_coords(as_batch(parts_a), as_batch(parts_b), max_segment_length_m=10_000.0)
+
+    assert isinstance(witness, ops.PolylineHausdorffWitness)
+    assert witness.distance_m == expected.distance_m
+    assert (witness.a_to_b.source_part, witness.a_to_b.source_index) == (
+        expected.a_to_b.source_part,
+        expected.a_to_b.source_index,
+    )
+
+
 def test_area_batch_returns_expected_square() -> None:
     coords = np.array(
         [